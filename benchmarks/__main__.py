@@ -0,0 +1,76 @@
+"""
+Runs the benchmark suite and writes machine-readable results.
+
+    python -m benchmarks --output bench.json
+    python -m benchmarks --only polling --baseline bench.json --tolerance 0.25
+
+With ``--baseline`` the run is compared metric by metric against an earlier
+output file and the process exits with status 1 when any metric regressed by
+more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import sys
+from importlib import metadata
+from typing import Any, Dict, List
+
+from benchmarks.bench_client import BENCHMARKS
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        version = metadata.version("lume_py")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {"python": platform.python_version(), "platform": platform.platform(), "lume_py": version}
+
+
+def regressions(current: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    previous = {entry["name"]: entry["metrics"] for entry in baseline}
+    found = []
+    for entry in current:
+        for key, value in entry["metrics"].items():
+            before = previous.get(entry["name"], {}).get(key)
+            if not before or not before["value"]:
+                continue
+            change = (value["value"] - before["value"]) / before["value"]
+            if value["better"] == "higher":
+                change = -change
+            if change > tolerance:
+                found.append(f"{entry['name']}.{key}: {before['value']:.6g} -> {value['value']:.6g} ({change:+.0%})")
+    return found
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[1])
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Run only the named group (repeatable).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest is kept.")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    parser.add_argument("--baseline", help="Compare against an earlier JSON report.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression against the baseline.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or BENCHMARKS:
+        results.extend(BENCHMARKS[name](args.repeat))
+    report = {"schema": 1, "environment": environment(), "results": results}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = regressions(results, json.load(f)["results"], args.tolerance)
+        for line in found:
+            print(f"regression: {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
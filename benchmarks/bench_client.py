@@ -0,0 +1,174 @@
+"""
+Benchmarks for the client hot paths.
+
+Every benchmark runs against ``lume_py.testing.StandInServer`` so the numbers
+reflect SDK overhead (request building, JSON handling, model construction,
+polling behaviour) rather than network conditions.
+"""
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+import lume_py as lume
+from lume_py.testing import StandInServer
+
+from benchmarks.bench_import import bench_import
+
+
+def metric(value: float, unit: str, better: str = "lower") -> Dict[str, Any]:
+    return {"value": value, "unit": unit, "better": better}
+
+
+def best_of(repeat: int, run: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Runs an async benchmark body ``repeat`` times and keeps the fastest run.
+    """
+    runs = [asyncio.run(run()) for _ in range(repeat)]
+    return min(runs, key=lambda r: r["seconds"]["value"])
+
+
+def bench_listing(repeat: int, records: int = 2000, size: int = 100) -> List[Dict[str, Any]]:
+    listings = [
+        ("Pipeline.get_all_pipelines", "pipelines", lume.Pipeline.get_all_pipelines),
+        ("Job.get_all_jobs", "jobs", lume.Job.get_all_jobs),
+        ("Result.get_results", "results", lume.Result.get_results),
+        ("WorkShop.get_workshops", "workshops", lume.WorkShop.get_workshops),
+        ("Target.get", "target_schemas", lume.Target.get),
+    ]
+    output = []
+    for name, collection, fetch in listings:
+        server = StandInServer()
+        server.seed(collection, records, name="benchmark", status="finished")
+
+        async def run() -> Dict[str, Any]:
+            server.reset_counts()
+            with server.install():
+                start = time.perf_counter()
+                items = await fetch(size=size, all=True)
+                elapsed = time.perf_counter() - start
+            assert len(items) == records
+            return {
+                "seconds": metric(elapsed, "s"),
+                "items_per_second": metric(records / elapsed, "items/s", "higher"),
+                "requests": metric(server.total_requests, "requests"),
+            }
+
+        output.append({"name": f"listing.{name}", "params": {"records": records, "size": size}, "metrics": best_of(repeat, run)})
+    return output
+
+
+def bench_polling(repeat: int, run_duration: float = 0.2, latency: float = 0.001) -> List[Dict[str, Any]]:
+    async def job_run(server: StandInServer):
+        pipeline = server.add("pipelines", name="benchmark")
+        job = await lume.Job.create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+        return await job.run()
+
+    def workshop_run(method: str, argument: Dict[str, Any]):
+        async def call(server: StandInServer):
+            workshop = lume.WorkShop(**server.add("workshops", status="created"))
+            return await getattr(workshop, method)(argument)
+        return call
+
+    operations = [
+        ("Job.run", job_run),
+        ("WorkShop.run_prompt", workshop_run("run_prompt", {"f_name": "first name only"})),
+        ("WorkShop.run_sample", workshop_run("run_sample", {"first_name": "John"})),
+        ("WorkShop.run_target_schema", workshop_run("run_target_schema", {"type": "object"})),
+    ]
+    output = []
+    channels = [(None, name, operation) for name, operation in operations]
+    channels += [(push, f"Job.run[{push}]", job_run) for push in ("sse", "long-poll")]
+    for push, name, operation in channels:
+        server = StandInServer(latency=latency, run_duration=run_duration, push=push)
+
+        async def run() -> Dict[str, Any]:
+            with server.install():
+                start = time.perf_counter()
+                result = await operation(server)
+                elapsed = time.perf_counter() - start
+            assert result.status == "finished"
+            requests = server.total_requests
+            server.reset_counts()
+            return {
+                "seconds": metric(elapsed, "s"),
+                "overhead_seconds": metric(max(elapsed - run_duration, 0.0), "s"),
+                "requests": metric(requests, "requests"),
+            }
+
+        params = {"run_duration": run_duration, "latency": latency}
+        output.append({"name": f"polling.{name}", "params": params, "metrics": best_of(repeat, run)})
+    return output
+
+
+def bench_serialization(repeat: int, rows: int = 20000, columns: int = 12) -> List[Dict[str, Any]]:
+    source_data = [{f"column_{c}": f"value {r} {c}" for c in range(columns)} for r in range(rows)]
+    server = StandInServer()
+    pipeline = server.add("pipelines", name="benchmark")
+
+    async def run() -> Dict[str, Any]:
+        with server.install():
+            start = time.perf_counter()
+            await lume.Job.create(pipeline_id=pipeline["id"], source_data=source_data)
+            elapsed = time.perf_counter() - start
+        server.collections["jobs"].clear()
+        return {"seconds": metric(elapsed, "s"), "rows_per_second": metric(rows / elapsed, "rows/s", "higher")}
+
+    return [{"name": "serialization.Job.create", "params": {"rows": rows, "columns": columns}, "metrics": best_of(repeat, run)}]
+
+
+def bench_result_mapper(repeat: int, items: int = 50000) -> List[Dict[str, Any]]:
+    from lume_py.endpoints.results import ResultMapper
+
+    payload = [
+        {
+            "result_id": "res-1",
+            "index": index,
+            "source_record": {"first_name": "John", "last_name": "Doe", "row": index},
+            "mapped_record": {"f_name": "John", "l_name": "Doe"},
+            "messsage": None,
+        }
+        for index in range(items)
+    ]
+
+    async def run() -> Dict[str, Any]:
+        start = time.perf_counter()
+        mappers = [ResultMapper(**item) for item in payload]
+        elapsed = time.perf_counter() - start
+        assert len(mappers) == items
+        return {"seconds": metric(elapsed, "s"), "microseconds_per_item": metric(elapsed / items * 1e6, "us")}
+
+    return [{"name": "models.ResultMapper", "params": {"items": items}, "metrics": best_of(repeat, run)}]
+
+
+def bench_mappings_memory(repeat: int, mappings: int = 20000) -> List[Dict[str, Any]]:
+    server = StandInServer(mappings_per_result=mappings)
+    result = server.add("results", status="finished")
+
+    async def run() -> Dict[str, Any]:
+        server.reset_counts()
+        with server.install():
+            tracemalloc.start()
+            start = time.perf_counter()
+            rows = await lume.Result(**result).get_mappings(all=True)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        assert len(rows) == mappings
+        return {
+            "seconds": metric(elapsed, "s"),
+            "peak_bytes": metric(peak, "bytes"),
+            "requests": metric(server.total_requests, "requests"),
+        }
+
+    return [{"name": "memory.Result.get_mappings", "params": {"mappings": mappings}, "metrics": best_of(repeat, run)}]
+
+
+BENCHMARKS = {
+    "listing": bench_listing,
+    "polling": bench_polling,
+    "serialization": bench_serialization,
+    "models": bench_result_mapper,
+    "memory": bench_mappings_memory,
+    "import": bench_import,
+}
@@ -0,0 +1,61 @@
+"""
+Cold-start benchmarks: the cost of importing the SDK and making the first call.
+
+Each measurement runs in a fresh interpreter so module caches from earlier
+benchmarks do not hide import work. ``first request`` includes importing the
+stand-in server, so compare it only against earlier runs of itself.
+"""
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# Each snippet sets ``start`` before the code being measured; the harness
+# reports the elapsed time and how many modules were loaded.
+SNIPPETS = {
+    "import lume_py": "import lume_py",
+    "from lume_py import Job": "from lume_py import Job",
+    "first request": (
+        "import asyncio\n"
+        "from lume_py import Job\n"
+        "from lume_py.testing import StandInServer\n"
+        "server = StandInServer()\n"
+        "job = server.add('jobs', status='created')\n"
+        "async def main():\n"
+        "    with server.install():\n"
+        "        await Job.get_job_by_id(job['id'])\n"
+        "asyncio.run(main())"
+    ),
+}
+
+HARNESS = """
+import json, sys, time
+baseline = set(sys.modules)
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": len(set(sys.modules) - baseline)}}))
+"""
+
+
+def measure(code: str) -> Dict[str, Any]:
+    output = subprocess.run(
+        [sys.executable, "-c", HARNESS.format(code=code)], check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def bench_import(repeat: int) -> List[Dict[str, Any]]:
+    output = []
+    for name, code in SNIPPETS.items():
+        runs = [measure(code) for _ in range(repeat)]
+        best = min(runs, key=lambda r: r["seconds"])
+        output.append({
+            "name": f"import.{name}",
+            "params": {},
+            "metrics": {
+                "seconds": {"value": best["seconds"], "unit": "s", "better": "lower"},
+                "modules": {"value": best["modules"], "unit": "modules", "better": "lower"},
+            },
+        })
+    return output
@@ -1,17 +1,92 @@
-from lume_py.endpoints.pipeline import Pipeline
-from lume_py.endpoints.jobs import Job
-from lume_py.endpoints.results import Result
-from lume_py.endpoints.target import Target
-from lume_py.endpoints.workshop import WorkShop
-from lume_py.endpoints.mappers import Mapping
-from lume_py.endpoints.config import Settings, get_settings
-from lume_py.endpoints.excel import Excel
-from lume_py.endpoints.pdf import PDF
+"""
+Python SDK for the Lume API.
 
+Names are imported lazily on first access (PEP 562), so ``import lume_py`` stays
+cheap and only the endpoint modules that are actually used get loaded.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lume_py.endpoints.pipeline import Pipeline
+    from lume_py.endpoints.jobs import Job
+    from lume_py.endpoints.results import Result
+    from lume_py.endpoints.target import Target
+    from lume_py.endpoints.workshop import WorkShop
+    from lume_py.endpoints.mappers import Mapping
+    from lume_py.endpoints.config import Settings, get_settings, get_client
+    from lume_py.endpoints.sdk.binding import use_client
+    from lume_py.endpoints.sdk.pool import ClientPool
+    from lume_py.endpoints.sdk.api_client import Client
+    from lume_py.endpoints.sdk.handles import Handle, as_completed, gather
+    from lume_py.endpoints.excel import Excel
+    from lume_py.endpoints.pdf import PDF
+    from lume_py.endpoints.experiments import WorkShopExperiment
+    from lume_py.endpoints.triage import TriageIndex
+    from lume_py.endpoints.mirror import Mirror, MemoryStore, SQLiteStore
+    from lume_py.endpoints.registry import TargetRegistry
+    from lume_py.endpoints.validation import SchemaValidator, get_validator
+    from lume_py.endpoints.inference import SchemaInferrer, infer_schema
+    from lume_py.endpoints.sdk.downloads import Downloader
+    from lume_py.endpoints.uploads import UploadManifest
+    from lume_py.endpoints.pivots import PivotTaskTracker
+    from lume_py.endpoints.sdk.concurrency import AdaptiveConcurrency
+    from lume_py.endpoints.sdk.lanes import PriorityLanes, lane
+
+_LAZY = {
+    'Pipeline': 'lume_py.endpoints.pipeline',
+    'Job': 'lume_py.endpoints.jobs',
+    'Result': 'lume_py.endpoints.results',
+    'Target': 'lume_py.endpoints.target',
+    'WorkShop': 'lume_py.endpoints.workshop',
+    'Mapping': 'lume_py.endpoints.mappers',
+    'Settings': 'lume_py.endpoints.config',
+    'get_settings': 'lume_py.endpoints.config',
+    'get_client': 'lume_py.endpoints.config',
+    'use_client': 'lume_py.endpoints.sdk.binding',
+    'ClientPool': 'lume_py.endpoints.sdk.pool',
+    'Client': 'lume_py.endpoints.sdk.api_client',
+    'Handle': 'lume_py.endpoints.sdk.handles',
+    'as_completed': 'lume_py.endpoints.sdk.handles',
+    'gather': 'lume_py.endpoints.sdk.handles',
+    'Excel': 'lume_py.endpoints.excel',
+    'PDF': 'lume_py.endpoints.pdf',
+    'WorkShopExperiment': 'lume_py.endpoints.experiments',
+    'TriageIndex': 'lume_py.endpoints.triage',
+    'Mirror': 'lume_py.endpoints.mirror',
+    'MemoryStore': 'lume_py.endpoints.mirror',
+    'SQLiteStore': 'lume_py.endpoints.mirror',
+    'TargetRegistry': 'lume_py.endpoints.registry',
+    'SchemaValidator': 'lume_py.endpoints.validation',
+    'get_validator': 'lume_py.endpoints.validation',
+    'SchemaInferrer': 'lume_py.endpoints.inference',
+    'infer_schema': 'lume_py.endpoints.inference',
+    'Downloader': 'lume_py.endpoints.sdk.downloads',
+    'UploadManifest': 'lume_py.endpoints.uploads',
+    'PivotTaskTracker': 'lume_py.endpoints.pivots',
+    'AdaptiveConcurrency': 'lume_py.endpoints.sdk.concurrency',
+    'PriorityLanes': 'lume_py.endpoints.sdk.lanes',
+    'lane': 'lume_py.endpoints.sdk.lanes',
+}
+
+
+def __getattr__(name: str):
+    if name == 'settings':
+        from lume_py.endpoints.config import get_settings
+        return get_settings()
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY, 'settings'])
 
-settings = get_settings()
 
 def set_api_key(api_key: str):
-    settings.set_api_key(api_key)
+    from lume_py.endpoints.config import get_settings
+    get_settings().set_api_key(api_key)
 
-__all__ = ['Pipeline', 'Job', 'Result', 'Target', 'WorkShop', 'Mapping', 'Settings', 'set_api_key', 'Excel', 'PDF']
+__all__ = ['Pipeline', 'Job', 'Result', 'Target', 'WorkShop', 'Mapping', 'Settings', 'set_api_key', 'Excel', 'PDF', 'Client', 'ClientPool', 'use_client', 'get_client', 'Handle', 'as_completed', 'gather', 'WorkShopExperiment', 'TriageIndex', 'Mirror', 'MemoryStore', 'SQLiteStore', 'TargetRegistry', 'SchemaValidator', 'get_validator', 'SchemaInferrer', 'infer_schema', 'Downloader', 'UploadManifest', 'PivotTaskTracker', 'AdaptiveConcurrency', 'PriorityLanes', 'lane']
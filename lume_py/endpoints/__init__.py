@@ -1,8 +1,48 @@
-from .excel import *
-from .pdf import *
-from .jobs import *
-from .pipeline import *
-from .results import *
-from .workshop import *
-from .mappers import *
-from .target import *
\ No newline at end of file
+import importlib
+
+# Endpoint modules are imported on first access of one of their names (PEP 562).
+_LAZY = {
+    'Excel': 'excel',
+    'PDF': 'pdf',
+    'Job': 'jobs',
+    'JobHandle': 'jobs',
+    'Pipeline': 'pipeline',
+    'PipelineCreatePayload': 'pipeline',
+    'PipelineUpdatePayload': 'pipeline',
+    'PipelineUploadSheets': 'pipeline',
+    'PipelinePopulateSheets': 'pipeline',
+    'Result': 'results',
+    'ResultMapper': 'results',
+    'WorkShop': 'workshop',
+    'Mapping': 'mappers',
+    'Target': 'target',
+    'WorkShopExperiment': 'experiments',
+    'ExperimentReport': 'experiments',
+    'ExperimentRow': 'experiments',
+    'Variant': 'experiments',
+    'TriageIndex': 'triage',
+    'Mirror': 'mirror',
+    'MemoryStore': 'mirror',
+    'SQLiteStore': 'mirror',
+    'TargetRegistry': 'registry',
+    'SchemaValidator': 'validation',
+    'ValidationReport': 'validation',
+    'RowError': 'validation',
+    'get_validator': 'validation',
+    'SchemaInferrer': 'inference',
+    'infer_schema': 'inference',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
+
+__all__ = list(_LAZY)
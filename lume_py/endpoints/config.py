@@ -1,21 +1,33 @@
-from pydantic_settings import BaseSettings
-from lume_py.endpoints.sdk.api_client import Lume
+from lume_py.endpoints.sdk.binding import current_client
 from functools import lru_cache
-from typing import Optional
+from typing import TYPE_CHECKING
 
-class Settings(BaseSettings):
-    lume_api_key: Optional[str] = None
-    client: Optional[Lume] = None
+if TYPE_CHECKING:
+    from lume_py.endpoints.sdk.api_client import Lume
+    from lume_py.endpoints.settings import Settings
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        if self.lume_api_key:
-            self.client = Lume(api_key=self.lume_api_key)
 
-    def set_api_key(self, api_key: str):
-        self.lume_api_key = api_key
-        self.client = Lume(api_key=self.lume_api_key)
+def __getattr__(name: str):
+    # pydantic-settings is only imported once the settings are first needed.
+    if name == "Settings":
+        from lume_py.endpoints.settings import Settings
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 @lru_cache()
-def get_settings() -> Settings:
+def get_settings() -> "Settings":
+    from lume_py.endpoints.settings import Settings
     return Settings()
+
+def get_client() -> "Lume":
+    """
+    Returns the client for the current call: the one selected with ``use_client``
+    or ``bind`` if any, otherwise the default ``settings.client``. A client that
+    was replaced resolves to its replacement.
+
+    :raises ValueError: If no client is selected and no API key has been set.
+    """
+    client = current_client() or get_settings().client
+    if client is None:
+        raise ValueError("No Lume client configured; call lume_py.set_api_key() or set LUME_API_KEY.")
+    return client.current()
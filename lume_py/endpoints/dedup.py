@@ -0,0 +1,81 @@
+"""
+Deduplication of identical source records before they are sent for mapping.
+
+    plan = Deduplicated(rows)
+    mapping = await pipeline.run_pipeline(plan.unique)
+    mapped = plan.expand(mapping.mapped_data)  # one entry per row of ``rows`` again
+
+``Pipeline.run_pipeline``, ``Pipeline.create_job`` and ``Job.create`` do this
+for you with ``dedup=True``.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+def record_key(record: Any) -> bytes:
+    """
+    Returns a digest identifying a record by content, ignoring key order.
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+class Deduplicated:
+    """
+    The unique records of a batch, and the position of every original row among them.
+
+    :param records: The source records, in their original order.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.unique: List[Dict[str, Any]] = []
+        self.positions: List[int] = []
+        self.counts: List[int] = []
+        seen: Dict[bytes, int] = {}
+        for record in records:
+            key = record_key(record)
+            position = seen.get(key)
+            if position is None:
+                position = seen[key] = len(self.unique)
+                self.unique.append(record)
+                self.counts.append(0)
+            self.counts[position] += 1
+            self.positions.append(position)
+
+    @property
+    def rows(self) -> int:
+        return len(self.positions)
+
+    @property
+    def duplicates(self) -> int:
+        return len(self.positions) - len(self.unique)
+
+    def expand(self, items: Sequence[T]) -> List[T]:
+        """
+        Maps one output per unique record back to one output per original row.
+
+        :raises ValueError: If there is not exactly one item per unique record.
+        """
+        if len(items) != len(self.unique):
+            raise ValueError(f"Expected {len(self.unique)} items, one per unique record, got {len(items)}")
+        return [items[position] for position in self.positions]
+
+    def expand_mappings(self, mappings: Iterable[M]) -> List[M]:
+        """
+        Expands per-record mapping rows, e.g. ``ResultMapper``, whose ``index`` is
+        the position of a unique record. The returned rows carry the index of the
+        original row. Original rows whose unique record is missing are skipped,
+        so a page of mappings expands to the rows it covers.
+        """
+        by_position = {mapping.index: mapping for mapping in mappings}
+        return [
+            by_position[position].model_copy(update={"index": row})
+            for row, position in enumerate(self.positions)
+            if position in by_position
+        ]
@@ -1,42 +1,70 @@
-import httpx
-from typing import Dict, Any
-from lume_py.endpoints.config import get_settings
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, Iterable, Optional
+from http import HTTPMethod
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.binding import Bindable
+from lume_py.endpoints.sdk.api_client import UploadFile
+from lume_py.endpoints.sdk.hooks import instrumented
+from lume_py.endpoints.sdk.downloads import Download, Downloader
+from lume_py.endpoints.uploads import UploadManifest
 
-settings = get_settings()
+if TYPE_CHECKING:
+    from lume_py.endpoints.pivots import PivotTask
 
-class Excel:
+
+class Excel(Bindable):
     """
     Service class for convenience methods related to Excel operations.
     """
 
     @staticmethod
-    async def convert_sheets(file_path: str, name: str, sheets: str = '') -> Dict[str, Any]:
+    @instrumented("Excel.convert_sheets")
+    async def convert_sheets(
+        file_path: str,
+        name: str,
+        sheets: str = '',
+        manifest: Optional[UploadManifest] = None,
+        prefilter: bool = False,
+        ranges: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         """
         Convert an Excel file to structured JSON data
 
         :param file_path: The path to the Excel file to upload.
         :param name: The name of the file including the extension.
         :param sheets: The names of the sheets in the file you want to include in the conversion given in comma delimited format. If not provided, all sheets will be included.
+        :param manifest: Skips the upload and returns the previous response if the same content was converted before (optional).
+        :param prefilter: Whether to upload a copy holding only ``sheets``, built locally (optional, defaults to False).
+            Requires ``pip install lume_py[excel]``.
+        :param ranges: Cell ranges to keep per sheet, e.g. ``{"Orders": "A1:H5000"}``; implies ``prefilter`` (optional).
         :return: A dictionary containing the response data.
         :raises Exception: If the file cannot be uploaded or other errors occur.
         """
+        key = None
+        if manifest is not None:
+            key, cached = await manifest.lookup("Excel.convert_sheets", file_path, name=name, sheets=sheets, ranges=ranges)
+            if cached is not None:
+                return cached
+        from lume_py.endpoints.sheets import prefiltered
+
         try:
-            with open(file_path, 'rb') as f:
-                files = {'file': (name, f, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+            async with prefiltered(file_path, sheets if prefilter or ranges else None, ranges) as upload_path:
+                files = {'file': (name, UploadFile(upload_path), 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
                 data = {'name': name, 'sheets': sheets}
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        'https://staging.lume-terminus.com/crud/convert/sheets',
-                        files=files,
-                        data=data,
-                        headers={'accept': 'application/json', 'lume-api-key': settings.client.api_key}
-                    )
-                    response.raise_for_status()
-                    return response.json()
+                response = await get_client().request(
+                    method=HTTPMethod.POST,
+                    url='https://staging.lume-terminus.com/crud/convert/sheets',
+                    files=files,
+                    data=data,
+                    headers={'accept': 'application/json'},
+                )
         except Exception as exc:
             raise exc
+        if key is not None:
+            manifest.put(key, response)
+        return response
 
     @staticmethod
+    @instrumented("Excel.get_pivot_tasks")
     async def get_pivot_tasks(page: int = 1, size: int = 50) -> Dict[str, Any]:
         """
         Retrieves a list of all Excel pivot tasks.
@@ -47,18 +75,16 @@ class Excel:
         :raises Exception: If the request fails or other errors occur.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    'https://staging.lume-terminus.com/crud/excel/pivot',
-                    params={'page': page, 'size': size},
-                    headers={'lume-api-key': settings.client.api_key}
-                )
-                response.raise_for_status()
-                return response.json()
+            return await get_client().request(
+                method=HTTPMethod.GET,
+                url='https://staging.lume-terminus.com/crud/excel/pivot',
+                params={'page': page, 'size': size},
+            )
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @instrumented("Excel.get_pivot_task_status")
     async def get_pivot_task_status(task_id: str) -> Dict[str, Any]:
         """
         Retrieves the status of a specific Excel pivot task.
@@ -68,17 +94,15 @@ class Excel:
         :raises Exception: If the request fails or other errors occur.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'https://staging.lume-terminus.com/crud/excel/pivot/{task_id}',
-                    headers={'lume-api-key': settings.client.api_key}
-                )
-                response.raise_for_status()
-                return response.json()
+            return await get_client().request(
+                method=HTTPMethod.GET,
+                url=f'https://staging.lume-terminus.com/crud/excel/pivot/{task_id}',
+            )
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @instrumented("Excel.get_pivot_task_url")
     async def get_pivot_task_url(task_id: str) -> Dict[str, Any]:
         """
         Retrieves the URL of a specific Excel pivot task file.
@@ -88,12 +112,44 @@ class Excel:
         :raises Exception: If the request fails or other errors occur.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'https://staging.lume-terminus.com/crud/excel/pivot/{task_id}/url',
-                    headers={'lume-api-key': settings.client.api_key}
-                )
-                response.raise_for_status()
-                return response.json()
+            return await get_client().request(
+                method=HTTPMethod.GET,
+                url=f'https://staging.lume-terminus.com/crud/excel/pivot/{task_id}/url',
+            )
         except Exception as exc:
             raise exc
+
+    @staticmethod
+    def track_pivot_tasks(task_ids: Iterable[str], fetch_urls: bool = False, timeout: Optional[float] = None) -> AsyncIterator['PivotTask']:
+        """
+        Tracks many pivot tasks together and yields each one as it finishes,
+        polling with the client that is current when this is called.
+
+            async for task in Excel.track_pivot_tasks(task_ids, fetch_urls=True):
+                print(task.id, task.status, task.url)
+
+        :param task_ids: The IDs of the pivot tasks.
+        :param fetch_urls: Whether to fetch the file URL of each finished task (optional, defaults to False).
+        :param timeout: Seconds to track them (optional, defaults to no limit).
+        :return: An async iterator of ``PivotTask`` objects in completion order.
+        :raises TimeoutError: If tasks are still pending after ``timeout`` seconds.
+        """
+        from lume_py.endpoints.pivots import PivotTaskTracker
+
+        return PivotTaskTracker(task_ids, fetch_urls=fetch_urls, client=get_client()).track(timeout=timeout)
+
+    @staticmethod
+    @instrumented("Excel.download_pivot_task")
+    async def download_pivot_task(task_id: str, path: str, checksum: Optional[str] = None, downloader: Optional[Downloader] = None) -> Download:
+        """
+        Downloads the Excel file of a finished pivot task to disk in parallel chunks,
+        resuming an interrupted download.
+
+        :param task_id: The ID of the pivot task.
+        :param path: The destination file.
+        :param checksum: The expected digest as ``"<algorithm>:<hex>"`` (optional).
+        :param downloader: The downloader to use (optional, defaults to the client's).
+        :return: What was transferred.
+        """
+        response = await Excel.get_pivot_task_url(task_id)
+        return await (downloader or get_client().downloader).download(response["url"], path, checksum=checksum)
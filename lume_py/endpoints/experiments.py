@@ -0,0 +1,175 @@
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from lume_py.endpoints.pipeline import Pipeline
+from lume_py.endpoints.results import Result
+from lume_py.endpoints.sdk.handles import gather
+from lume_py.endpoints.workshop import WorkShop
+
+# The order in which the steps of a variant run: the target schema defines the
+# fields that prompts refer to, and the sample is mapped with both applied.
+STEPS = ("target_schema", "prompt", "sample")
+
+
+class Variant(BaseModel):
+    """
+    One combination of a target schema, prompt and sample to try in a workshop.
+    A step left as ``None`` is skipped.
+    """
+    name: str
+    target_schema: Optional[Dict[str, Any]] = None
+    prompt: Optional[Dict[str, Any]] = None
+    sample: Optional[Dict[str, Any]] = None
+    labels: Dict[str, str] = Field(default_factory=dict)
+
+
+class ExperimentRow(BaseModel):
+    """
+    The outcome of one variant.
+    """
+    variant: str
+    labels: Dict[str, str] = Field(default_factory=dict)
+    workshop_id: Optional[str] = None
+    result_id: Optional[str] = None
+    status: Optional[str] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    mapped_records: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class ExperimentReport(BaseModel):
+    """
+    The comparison table of an experiment, one row per variant in grid order.
+    """
+    rows: List[ExperimentRow] = Field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> List[ExperimentRow]:
+        return [row for row in self.rows if row.error or row.status != "finished"]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Returns the table as flat dictionaries, e.g. for ``pandas.DataFrame(report.records())``.
+        Mapped records are spread into ``mapped.<field>`` columns from the first mapped row.
+        """
+        records = []
+        for row in self.rows:
+            record = {"variant": row.variant, **row.labels}
+            record.update(workshop_id=row.workshop_id, result_id=row.result_id, status=row.status,
+                          seconds=round(row.seconds, 3), error=row.error)
+            first = row.mapped_records[0] if row.mapped_records else {}
+            record.update({f"mapped.{key}": value for key, value in first.items()})
+            records.append(record)
+        return records
+
+    def table(self, columns: Optional[Sequence[str]] = None) -> str:
+        """
+        Renders the comparison table as aligned plain text.
+
+        :param columns: The columns to show (optional, defaults to every column).
+        """
+        records = self.records()
+        if columns is None:
+            columns = list(dict.fromkeys(key for record in records for key in record))
+        cells = [[str(column) for column in columns]]
+        cells += [["" if record.get(column) is None else str(record[column]) for column in columns] for record in records]
+        widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+        lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in cells]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+
+class WorkShopExperiment:
+    """
+    Runs a grid of target schema, prompt and sample variants against a pipeline,
+    one workshop per variant, and collects the outcomes into one table.
+
+        experiment = WorkShopExperiment(
+            pipeline,
+            prompts={"short": {"f_name": "first name"}, "strict": {"f_name": "first name only, no titles"}},
+            samples={"john": {"first_name": "Dr. John"}},
+        )
+        report = await experiment.run()
+        print(report.table())
+
+    :param pipeline: The pipeline the workshops are created for.
+    :param target_schemas: Named target schemas to try (optional).
+    :param prompts: Named ``target_fields_to_prompt`` values to try (optional).
+    :param samples: Named samples to run (optional).
+    :param max_concurrency: Variants run at once (optional, defaults to 8).
+    :param timeout: Seconds each step may take (optional, defaults to no limit).
+    :param fetch_mappings: Whether to fetch the mapped records of the last run of each variant
+        (optional, defaults to True).
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        target_schemas: Optional[Dict[str, Dict[str, Any]]] = None,
+        prompts: Optional[Dict[str, Dict[str, Any]]] = None,
+        samples: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        fetch_mappings: bool = True,
+    ):
+        if not pipeline.id:
+            raise ValueError("Pipeline ID is required for running an experiment.")
+        self.pipeline = pipeline
+        self.grid = {"target_schema": target_schemas, "prompt": prompts, "sample": samples}
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.fetch_mappings = fetch_mappings
+
+    def variants(self) -> List[Variant]:
+        """
+        Expands the grid into variants: every combination of the given options.
+        """
+        axes = [(step, list(options.items())) for step, options in self.grid.items() if options]
+        if not axes:
+            raise ValueError("An experiment needs at least one target schema, prompt or sample.")
+        variants = []
+        for combination in itertools.product(*(options for _, options in axes)):
+            labels = {step: name for (step, _), (name, _) in zip(axes, combination)}
+            values = {step: value for (step, _), (_, value) in zip(axes, combination)}
+            variants.append(Variant(name=" / ".join(labels.values()), labels=labels, **values))
+        return variants
+
+    async def run(self) -> ExperimentReport:
+        """
+        Creates the workshops and runs every variant with bounded parallelism.
+        A failing variant is reported in its row and does not stop the others.
+
+        :return: The comparison table.
+        """
+        started = time.perf_counter()
+        variants = self.variants()
+        rows = await gather([self._run_variant(variant) for variant in variants], max_concurrency=self.max_concurrency)
+        return ExperimentReport(rows=rows, seconds=time.perf_counter() - started)
+
+    async def _run_variant(self, variant: Variant) -> ExperimentRow:
+        row = ExperimentRow(variant=variant.name, labels=variant.labels)
+        started = time.perf_counter()
+        try:
+            workshop = await self.pipeline.create_workshop()
+            row.workshop_id = workshop.id
+            result = None
+            for step in STEPS:
+                value = getattr(variant, step)
+                if value is not None:
+                    result = await self._run_step(workshop, step, value)
+            row.result_id, row.status = result.id, result.status
+            if self.fetch_mappings and result.status == "finished":
+                row.mapped_records = [m.mapped_record or {} for m in await result.get_mappings(all=True)]
+        except Exception as exc:
+            row.error = repr(exc)
+        row.seconds = time.perf_counter() - started
+        return row
+
+    async def _run_step(self, workshop: WorkShop, step: str, value: Dict[str, Any]) -> Result:
+        run = {"target_schema": workshop.run_target_schema, "prompt": workshop.run_prompt, "sample": workshop.run_sample}[step]
+        result = await run(value, immediate=True)
+        return await result.wait(self.timeout)
@@ -0,0 +1,160 @@
+"""
+Local target-schema inference over any number of records, in one pass.
+
+    inferrer = SchemaInferrer()
+    with open("extract.jsonl") as lines:
+        inferrer.update(json.loads(line) for line in lines)
+    target = await Target.create(inferrer.schema(), name="contacts")
+
+Each field keeps its observed types, null and presence counts, a bounded set
+of distinct strings for enum detection, and the string formats that every
+value so far satisfies. Memory grows with the number of fields, not records.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from lume_py.endpoints.validation import FORMATS
+
+# Formats proposed by inference, in order of preference. The checks are stricter
+# than the validator's so that, e.g., "20240101" or "1230" are not taken for a date or time.
+INFERRED_FORMATS = {
+    "date-time": lambda value: value[4:5] == "-" and FORMATS["date-time"](value),
+    "date": lambda value: len(value) == 10 and value[4] == "-" and value[7] == "-" and FORMATS["date"](value),
+    "time": lambda value: value[2:3] == ":" and FORMATS["time"](value),
+    "uuid": lambda value: len(value) == 36 and FORMATS["uuid"](value),
+    "email": FORMATS["email"],
+    "uri": lambda value: "://" in value and FORMATS["uri"](value),
+}
+
+
+class _Field:
+    __slots__ = ("seen", "nulls", "types", "strings", "values", "formats", "objects", "properties", "items")
+
+    def __init__(self):
+        self.seen = 0
+        self.nulls = 0
+        self.types: Set[str] = set()
+        self.strings = 0
+        self.values: Optional[Set[str]] = set()
+        self.formats: Optional[Set[str]] = None
+        self.objects = 0
+        self.properties: Dict[str, "_Field"] = {}
+        self.items: Optional["_Field"] = None
+
+    def add(self, value: Any, max_enum: int) -> None:
+        self.seen += 1
+        if value is None:
+            self.nulls += 1
+        elif isinstance(value, bool):
+            self.types.add("boolean")
+        elif isinstance(value, int):
+            self.types.add("integer")
+        elif isinstance(value, float):
+            self.types.add("number")
+        elif isinstance(value, dict):
+            self.types.add("object")
+            self.objects += 1
+            for name, item in value.items():
+                field = self.properties.get(name)
+                if field is None:
+                    field = self.properties[name] = _Field()
+                field.add(item, max_enum)
+        elif isinstance(value, (list, tuple)):
+            self.types.add("array")
+            if self.items is None:
+                self.items = _Field()
+            for item in value:
+                self.items.add(item, max_enum)
+        else:
+            self.add_string(str(value), max_enum)
+
+    def add_string(self, value: str, max_enum: int) -> None:
+        self.types.add("string")
+        self.strings += 1
+        if self.values is not None:
+            self.values.add(value)
+            if len(self.values) > max_enum:
+                self.values = None  # Too many distinct values to be an enum; stop tracking them.
+        if self.formats is None:
+            self.formats = {name for name, test in INFERRED_FORMATS.items() if test(value)}
+        elif self.formats:
+            self.formats = {name for name in self.formats if INFERRED_FORMATS[name](value)}
+
+    def schema(self, max_enum: int) -> Dict[str, Any]:
+        types = set(self.types)
+        if {"integer", "number"} <= types:
+            types.discard("integer")
+        names: List[str] = sorted(types)
+        if self.nulls or not names:
+            names.append("null")
+        schema: Dict[str, Any] = {"type": names[0] if len(names) == 1 else names}
+        if types == {"string"}:
+            if self.formats:
+                schema["format"] = next(name for name in INFERRED_FORMATS if name in self.formats)
+            elif self.values is not None and len(self.values) * 2 <= self.strings:
+                # Only values that repeat are taken as an enum, so a handful of IDs is not.
+                schema["enum"] = sorted(self.values) + ([None] if self.nulls else [])
+        if "object" in types:
+            schema["properties"] = {name: field.schema(max_enum) for name, field in self.properties.items()}
+            required = [name for name, field in self.properties.items() if field.seen == self.objects]
+            if required:
+                schema["required"] = required
+        if "array" in types and self.items is not None and self.items.seen:
+            schema["items"] = self.items.schema(max_enum)
+        return schema
+
+
+class SchemaInferrer:
+    """
+    Infers a JSON Schema for records incrementally.
+
+    Types seen for a field are merged (integers and floats become ``number``),
+    nulls make a field nullable, fields missing from some records are left out
+    of ``required``, repeated strings with at most ``max_enum`` distinct values
+    become an ``enum``, and strings that all match a format get that ``format``.
+
+    :param max_enum: The most distinct strings a field may have to be an enum
+        (optional, defaults to 20).
+    """
+
+    def __init__(self, max_enum: int = 20):
+        self.max_enum = max_enum
+        self.records = 0
+        self._root = _Field()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Adds one record.
+
+        :raises ValueError: If the record is not a dictionary.
+        """
+        if not isinstance(record, dict):
+            raise ValueError(f"Records must be dictionaries, got {type(record).__name__}")
+        self.records += 1
+        self._root.add(record, self.max_enum)
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "SchemaInferrer":
+        """
+        Adds every record from an iterable, consuming it lazily.
+        """
+        for record in records:
+            self.add(record)
+        return self
+
+    def schema(self) -> Dict[str, Any]:
+        """
+        Returns the inferred schema of the records added so far, ready for ``Target.create``.
+
+        :raises ValueError: If no records were added.
+        """
+        if not self.records:
+            raise ValueError("Add at least one record before inferring a schema.")
+        schema = self._root.schema(self.max_enum)
+        schema["type"] = "object"
+        return schema
+
+
+def infer_schema(records: Iterable[Dict[str, Any]], max_enum: int = 20) -> Dict[str, Any]:
+    """
+    Infers a target schema from records in one pass. See ``SchemaInferrer``.
+    """
+    return SchemaInferrer(max_enum=max_enum).update(records).schema()
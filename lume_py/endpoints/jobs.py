@@ -1,14 +1,17 @@
 from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
-from lume_py.endpoints.config import get_settings
+from pydantic import PrivateAttr
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.dedup import Deduplicated
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.handles import Handle
+from lume_py.endpoints.sdk.hooks import instrumented
 from lume_py.endpoints.workshop import WorkShop
 from lume_py.endpoints.results import Result
 from .sdk.api_client import Pagination
 from http import HTTPMethod
 
-settings = get_settings()
 
-class Job(BaseModel):
+class Job(BoundModel):
     id: Optional[str] = None
     user_id: Optional[str] = None
     pipeline_id: Optional[str] = None
@@ -17,11 +20,14 @@ class Job(BaseModel):
     status: Optional[str] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    # Set on jobs created with ``dedup=True``; passed on to the results of their runs.
+    _dedup: Optional[Deduplicated] = PrivateAttr(default=None)
 
     class Config:
         orm_mode = True
 
     @staticmethod
+    @instrumented("Job.get_all_jobs")
     async def get_all_jobs(page: int = 1, size: int = 50, all: bool = False) -> List['Job']:
         """
         Retrieves a paginated list of jobs or all jobs if 'all' is set to True.
@@ -35,15 +41,15 @@ class Job(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET, url="jobs", pagination=pagination
                 )
                 jobs.extend([Job(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET, url="jobs", pagination=pagination
             )
             jobs.extend([Job(**item) for item in response["items"]])
@@ -51,32 +57,40 @@ class Job(BaseModel):
         return jobs
 
     @classmethod
-    async def create(cls, pipeline_id: str, source_data: List[Dict[str, Any]]) -> 'Job':
+    @instrumented("Job.create")
+    async def create(cls, pipeline_id: str, source_data: List[Dict[str, Any]], dedup: bool = False) -> 'Job':
         """
         Creates a new job for a given pipeline.
         :param pipeline_id: The ID of the pipeline.
         :param source_data: The source data for the job.
+        :param dedup: Whether to send identical records only once (optional, defaults to False).
+            ``Result.get_mappings`` on the job's results then expands them back to one per original row.
         :return: The created Job object.
         """
-        response = await settings.client.request(
+        plan = Deduplicated(source_data) if dedup else None
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"pipelines/{pipeline_id}/jobs",
-            json={"data": source_data},
+            json={"data": plan.unique if plan else source_data},
         )
-        return cls(**response)
+        job = cls(**response)
+        job._dedup = plan
+        return job
 
     @classmethod
+    @instrumented("Job.get_job_by_id")
     async def get_job_by_id(cls, job_id: str) -> 'Job':
         """
         Retrieves a job by its ID.
         :param job_id: The ID of the job.
         :return: The Job object.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"jobs/{job_id}"
         )
         return cls(**response)
 
+    @instrumented("Job.delete")
     async def delete(self) -> None:
         """
         Deletes the current job.
@@ -84,40 +98,47 @@ class Job(BaseModel):
         """
         if not self.id:
             raise ValueError("Job ID is required for deletion.")
-        await settings.client.request(method=HTTPMethod.DELETE, url=f"jobs/{self.id}")
+        await get_client().request(method=HTTPMethod.DELETE, url=f"jobs/{self.id}")
 
-    async def run(self, immediate: bool = False) -> Result:
+    @instrumented("Job.run")
+    async def run(self, immediate: bool = False, timeout: Optional[float] = None) -> Result:
         """
         Runs the job and returns the result.
         :param immediate: Whether to return the result immediately or wait until the job is complete.
+        :param timeout: Seconds to wait for the job to complete (optional, defaults to no limit).
         :return: The Result object.
+        :raises TimeoutError: If the job is still running after ``timeout`` seconds.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url=f"jobs/{self.id}/run"
         )
-        status = response["status"]
-        result_id = response["id"]
-
+        result = Result(**response)
+        result._dedup = self._dedup
         if immediate:
-            return Result(**response)
-        else:
-            while status in ["queued", "running"]:
-                result = await settings.client.request(
-                    HTTPMethod.GET, url=f"results/{result_id}"
-                )
-                status = result["status"]
-            return Result(**result)
+            return result
+        return await result.wait(timeout)
 
+    @instrumented("Job.submit")
+    async def submit(self) -> 'JobHandle':
+        """
+        Starts the job and returns a handle on it without waiting for completion.
+        :return: A JobHandle whose ``wait()`` returns the finished Result.
+        """
+        result = await self.run(immediate=True)
+        return JobHandle(self, result)
+
+    @instrumented("Job.create_workshop")
     async def create_workshop(self) -> WorkShop:
         """
         Creates a workshop for the current job.
         :return: The created WorkShop object.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url=f"jobs/{self.id}/workshops"
         )
         return WorkShop(**response)
 
+    @instrumented("Job.get_workshops")
     async def get_workshops(self, page: int = 1, size: int = 50, all: bool = False) -> List[WorkShop]:
         """
         Retrieves workshops associated with the current job, optionally fetching all pages.
@@ -130,7 +151,7 @@ class Job(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET,
                     url=f"jobs/{self.id}/workshops",
                     pagination=pagination,
@@ -138,9 +159,9 @@ class Job(BaseModel):
                 workshops.extend([WorkShop(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET,
                 url=f"jobs/{self.id}/workshops",
                 pagination=pagination,
@@ -148,26 +169,30 @@ class Job(BaseModel):
             workshops.extend([WorkShop(**item) for item in response["items"]])
         return workshops
 
+    @instrumented("Job.get_target_schema")
     async def get_target_schema(self) -> Dict[str, Any]:
         """
         Retrieves the target schema associated with the current job.
         :return: A dictionary representing the target schema.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"jobs/{self.id}/target_schema"
         )
 
     @classmethod
-    async def create_and_run(cls, pipeline_id: str, source_data: List[Dict[str, Any]]) -> Result:
+    @instrumented("Job.create_and_run")
+    async def create_and_run(cls, pipeline_id: str, source_data: List[Dict[str, Any]], dedup: bool = False) -> Result:
         """
         Creates and runs a job for a given pipeline.
         :param pipeline_id: The ID of the pipeline.
         :param source_data: The source data for the job.
+        :param dedup: Whether to send identical records only once (optional, defaults to False).
         :return: The Result object from running the job.
         """
-        job = await cls.create(pipeline_id, source_data)
+        job = await cls.create(pipeline_id, source_data, dedup=dedup)
         return await job.run()
 
+    @instrumented("Job.get_results")
     async def get_results(self, page: int = 1, size: int = 50, all: bool = False) -> List[Result]:
         """
         Retrieves results associated with the current job, optionally fetching all pages.
@@ -180,7 +205,7 @@ class Job(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET,
                     url=f"jobs/{self.id}/results",
                     pagination=pagination,
@@ -188,12 +213,27 @@ class Job(BaseModel):
                 results.extend([Result(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET,
                 url=f"jobs/{self.id}/results",
                 pagination=pagination,
             )
             results.extend([Result(**item) for item in response["items"]])
         return results
+
+
+class JobHandle(Handle[Result]):
+    """
+    Handle on a submitted job run; see ``Handle`` for ``wait``, ``done``,
+    ``cancel`` and ``add_done_callback``.
+
+    ``result_id`` is known right away. Cancelling stops waiting for the run;
+    it does not stop the run on the server.
+    """
+
+    def __init__(self, job: Job, result: Result):
+        self.job = job
+        self.result_id = result.id
+        super().__init__(result.wait(), name=f"Job {job.id}")
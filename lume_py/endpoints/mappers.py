@@ -1,22 +1,27 @@
 from typing import Any, Optional, List, Dict
-from pydantic import BaseModel
-from lume_py.endpoints.config import get_settings
+from pydantic import PrivateAttr
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.dedup import Deduplicated
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.hooks import instrumented
 from http import HTTPMethod
 
-settings = get_settings()
 
-class Mapping(BaseModel):
+class Mapping(BoundModel):
     id: Optional[str] = None
     status: Optional[str] = None
     created_at: Optional[str] = None
     job_id: Optional[str] = None
     pipeline_id: Optional[str] = None
     mapped_data: Optional[List[Dict[str, Any]]] = None
+    # Set on mappings of runs with ``dedup=True`` to expand ``mapped_data`` once it arrives.
+    _dedup: Optional[Deduplicated] = PrivateAttr(default=None)
 
     class Config:
         orm_mode = True
 
     @staticmethod
+    @instrumented("Mapping.create")
     async def create(data: List[Dict[str, Any]], name: str, description: str, target_schema: Dict[str, Any]) -> 'Mapping':
         """
         Creates a new mapping.
@@ -32,11 +37,12 @@ class Mapping(BaseModel):
             "description": description,
             "target_schema": target_schema,
         }
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url="mapping", json=payload
         )
         return Mapping(**response)
     
+    @instrumented("Mapping.get_representative_sample")
     async def get_representative_sample(self, target_field_name: str) -> Dict[str, Any]:
         """
         Retrieves a Lookup dictionary.
@@ -45,7 +51,7 @@ class Mapping(BaseModel):
 
         if not self.pipeline_id:
             raise ValueError("Pipeline ID is required for fetching mapper.")
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"pipelines/{self.pipeline_id}/mapper"
         )
         if response is None:
@@ -58,23 +64,33 @@ class Mapping(BaseModel):
         raise ValueError(f"Could not find {target_field_name} within the mapper")
 
     @classmethod
+    @instrumented("Mapping.get_by_id")
     async def get_by_id(cls, result_id: str) -> 'Mapping':
         """
         Retrieves a mapping by its result ID.
         :param result_id: The ID of the result to retrieve the mapping for.
         :return: The mapping details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"mappings/{result_id}"
         )
         return cls(**response)
 
+    @instrumented("Mapping.get_details")
     async def get_details(self) -> 'Mapping':
         """
         Retrieves the details of this mapping.
         :return: The mapping details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"mappings/{self.id}"
         )
-        return Mapping(**response)
+        return Mapping._expanded(response, self._dedup)
+
+    @staticmethod
+    def _expanded(response: Dict[str, Any], dedup: Optional[Deduplicated]) -> 'Mapping':
+        mapping = Mapping(**response)
+        mapping._dedup = dedup
+        if dedup is not None and mapping.mapped_data is not None:
+            mapping.mapped_data = dedup.expand(mapping.mapped_data)
+        return mapping
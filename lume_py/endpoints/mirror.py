@@ -0,0 +1,301 @@
+"""
+A local mirror of the Lume collections, kept up to date with ``updated_at`` watermarks.
+
+    mirror = Mirror(SQLiteStore("lume.db"))
+    await mirror.refresh()
+    jobs = mirror.jobs_for_pipeline(pipeline_id)
+    latest = mirror.latest_result_per_job()
+
+Each refresh asks the server only for records updated since the newest
+``updated_at`` seen in that collection. Servers that ignore the
+``updated_since`` filter are detected and the collection is re-listed instead,
+writing only the records that changed. Deleted records are not detected.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import defaultdict
+from http import HTTPMethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.jobs import Job
+from lume_py.endpoints.pipeline import Pipeline
+from lume_py.endpoints.results import Result
+from lume_py.endpoints.sdk.api_client import Pagination
+from lume_py.endpoints.sdk.handles import gather
+from lume_py.endpoints.sdk.hooks import instrumented
+from lume_py.endpoints.target import Target
+from lume_py.endpoints.triage import parse_timestamp
+from lume_py.endpoints.workshop import WorkShop
+
+T = TypeVar("T")
+
+MODELS = {
+    "pipelines": Pipeline,
+    "jobs": Job,
+    "workshops": WorkShop,
+    "results": Result,
+    "target_schemas": Target,
+}
+
+# Record fields that queries can filter on without a scan.
+INDEXED_FIELDS = ("pipeline_id", "job_id", "workshop_id", "status")
+
+
+class MemoryStore:
+    """
+    Keeps the mirror in memory, with a hash index per field in ``INDEXED_FIELDS``.
+    """
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self._indexes: Dict[Tuple[str, str], Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._watermarks: Dict[str, Tuple[str, float]] = {}
+
+    def watermark(self, collection: str) -> Optional[Tuple[str, float]]:
+        return self._watermarks.get(collection)
+
+    def upsert(self, collection: str, records: Iterable[Dict[str, Any]]) -> int:
+        changed = 0
+        records_by_id = self._records[collection]
+        for record in records:
+            previous = records_by_id.get(record["id"])
+            if previous == record:
+                continue
+            for field in INDEXED_FIELDS:
+                if previous is not None and previous.get(field) is not None:
+                    self._indexes[(collection, field)][previous[field]].discard(record["id"])
+                if record.get(field) is not None:
+                    self._indexes[(collection, field)][record[field]].add(record["id"])
+            records_by_id[record["id"]] = record
+            self._advance(collection, record)
+            changed += 1
+        return changed
+
+    def _advance(self, collection: str, record: Dict[str, Any]) -> None:
+        if record.get("updated_at"):
+            at = parse_timestamp(record["updated_at"])
+            current = self._watermarks.get(collection)
+            if current is None or at > current[1]:
+                self._watermarks[collection] = (record["updated_at"], at)
+
+    def get(self, collection: str, record_id: str) -> Optional[Dict[str, Any]]:
+        return self._records[collection].get(record_id)
+
+    def count(self, collection: str) -> int:
+        return len(self._records[collection])
+
+    def find(self, collection: str, **filters: Any) -> List[Dict[str, Any]]:
+        records = self._records[collection]
+        ids: Optional[Set[str]] = None
+        for field, value in filters.items():
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"{field!r} is not indexed, expected one of {INDEXED_FIELDS}")
+            matches = self._indexes[(collection, field)].get(value, set())
+            ids = set(matches) if ids is None else ids & matches
+        selected = records.values() if ids is None else (records[record_id] for record_id in ids)
+        return sorted(selected, key=lambda record: (parse_timestamp(record.get("updated_at")), record["id"]))
+
+    def latest(self, collection: str, field: str) -> Dict[str, Dict[str, Any]]:
+        records = self._records[collection]
+        return {
+            value: max((records[record_id] for record_id in ids), key=lambda record: parse_timestamp(record.get("updated_at")))
+            for value, ids in self._indexes[(collection, field)].items()
+            if ids
+        }
+
+
+class SQLiteStore:
+    """
+    Keeps the mirror in a SQLite database, so it survives restarts and can be
+    shared between processes. Indexed fields are stored in their own columns.
+
+    :param path: The database file (optional, defaults to an in-memory database).
+    """
+
+    # Calls block on disk I/O, so refreshes run them in a worker thread.
+    blocking = True
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        columns = ", ".join(f"{field} TEXT" for field in INDEXED_FIELDS)
+        with self._db:
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS records (collection TEXT NOT NULL, id TEXT NOT NULL, "
+                f"updated_at TEXT, updated_ts REAL, {columns}, data TEXT NOT NULL, PRIMARY KEY (collection, id))"
+            )
+            for field in INDEXED_FIELDS:
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS records_{field} ON records (collection, {field}, updated_ts)"
+                )
+            self._db.execute("CREATE TABLE IF NOT EXISTS watermarks (collection TEXT PRIMARY KEY, value TEXT, ts REAL)")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def watermark(self, collection: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._db.execute("SELECT value, ts FROM watermarks WHERE collection = ?", (collection,)).fetchone()
+        return tuple(row) if row else None
+
+    def upsert(self, collection: str, records: Iterable[Dict[str, Any]]) -> int:
+        changed = 0
+        with self._lock, self._db:
+            for record in records:
+                data = json.dumps(record, sort_keys=True)
+                row = self._db.execute(
+                    "SELECT data FROM records WHERE collection = ? AND id = ?", (collection, record["id"])
+                ).fetchone()
+                if row is not None and row[0] == data:
+                    continue
+                values = [record.get(field) for field in INDEXED_FIELDS]
+                placeholders = ", ".join("?" for _ in INDEXED_FIELDS)
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO records (collection, id, updated_at, updated_ts, "
+                    f"{', '.join(INDEXED_FIELDS)}, data) VALUES (?, ?, ?, ?, {placeholders}, ?)",
+                    (collection, record["id"], record.get("updated_at"), parse_timestamp(record.get("updated_at")), *values, data),
+                )
+                if record.get("updated_at"):
+                    self._db.execute(
+                        "INSERT INTO watermarks (collection, value, ts) VALUES (?, ?, ?) "
+                        "ON CONFLICT (collection) DO UPDATE SET value = excluded.value, ts = excluded.ts "
+                        "WHERE excluded.ts > watermarks.ts",
+                        (collection, record["updated_at"], parse_timestamp(record["updated_at"])),
+                    )
+                changed += 1
+        return changed
+
+    def get(self, collection: str, record_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM records WHERE collection = ? AND id = ?", (collection, record_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM records WHERE collection = ?", (collection,)).fetchone()[0]
+
+    def find(self, collection: str, **filters: Any) -> List[Dict[str, Any]]:
+        for field in filters:
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"{field!r} is not indexed, expected one of {INDEXED_FIELDS}")
+        where = "".join(f" AND {field} = ?" for field in filters)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT data FROM records WHERE collection = ?{where} ORDER BY updated_ts, id",
+                (collection, *filters.values()),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def latest(self, collection: str, field: str) -> Dict[str, Dict[str, Any]]:
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"{field!r} is not indexed, expected one of {INDEXED_FIELDS}")
+        # SQLite returns the other columns of the row holding the MAX() of each group.
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {field}, data, MAX(updated_ts) FROM records "
+                f"WHERE collection = ? AND {field} IS NOT NULL GROUP BY {field}",
+                (collection,),
+            ).fetchall()
+        return {value: json.loads(data) for value, data, _ in rows}
+
+
+class Mirror:
+    """
+    A local copy of the Lume collections, refreshed incrementally.
+
+    :param store: A ``MemoryStore`` or ``SQLiteStore`` (optional, defaults to a new ``MemoryStore``).
+    :param collections: The collections to mirror (optional, defaults to every collection in ``MODELS``).
+    :param page_size: Records fetched per page (optional, defaults to 100).
+    """
+
+    def __init__(self, store=None, collections: Iterable[str] = tuple(MODELS), page_size: int = 100):
+        self.store = store if store is not None else MemoryStore()
+        self.collections = list(collections)
+        for collection in self.collections:
+            if collection not in MODELS:
+                raise ValueError(f"Unknown collection {collection!r}, expected one of {tuple(MODELS)}")
+        self.page_size = page_size
+        self.server_filtering: Dict[str, bool] = {}
+
+    @instrumented("Mirror.refresh")
+    async def refresh(self, collections: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Fetches the records changed since the last refresh, for every collection concurrently.
+
+        :param collections: The collections to refresh (optional, defaults to all mirrored ones).
+        :return: The number of records added or changed per collection.
+        """
+        collections = list(collections or self.collections)
+        changed = await gather([self._refresh(collection) for collection in collections])
+        for outcome in changed:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return dict(zip(collections, changed))
+
+    async def _refresh(self, collection: str) -> int:
+        watermark = await self._store(self.store.watermark, collection)
+        if watermark is not None and self.server_filtering.get(collection) is not False:
+            records = await self._fetch(collection, {"updated_since": watermark[0]})
+            # Older records mean the server ignored the filter and sent the full
+            # listing; later refreshes of this collection skip the filter.
+            self.server_filtering[collection] = all(
+                parse_timestamp(record.get("updated_at")) >= watermark[1] for record in records
+            )
+        else:
+            records = await self._fetch(collection, None)
+        return await self._store(self.store.upsert, collection, records)
+
+    async def _store(self, function: Callable[..., T], *args: Any) -> T:
+        # The SQLite connection cannot be pickled, so use a thread rather than the client's executor.
+        if getattr(self.store, "blocking", False):
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    async def _fetch(self, collection: str, params: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        pagination = Pagination(page=1, size=self.page_size)
+        records: List[Dict[str, Any]] = []
+        while True:
+            response = await get_client().request(
+                method=HTTPMethod.GET, url=collection, params=dict(params or {}), pagination=pagination
+            )
+            records.extend(response["items"])
+            if len(response["items"]) < self.page_size:
+                return records
+            pagination.page += 1
+
+    def get(self, collection: str, record_id: str) -> Optional[Any]:
+        """
+        Returns a mirrored record as its model, e.g. ``mirror.get("jobs", job_id)``.
+        """
+        record = self.store.get(collection, record_id)
+        return MODELS[collection](**record) if record is not None else None
+
+    def find(self, collection: str, **filters: Any) -> List[Any]:
+        """
+        Returns the mirrored records matching every filter, oldest update first.
+        Only fields in ``INDEXED_FIELDS`` can be filtered on.
+        """
+        return [MODELS[collection](**record) for record in self.store.find(collection, **filters)]
+
+    def count(self, collection: str) -> int:
+        return self.store.count(collection)
+
+    def jobs_for_pipeline(self, pipeline_id: str) -> List[Job]:
+        return self.find("jobs", pipeline_id=pipeline_id)
+
+    def workshops_for_pipeline(self, pipeline_id: str) -> List[WorkShop]:
+        return self.find("workshops", pipeline_id=pipeline_id)
+
+    def results_for_job(self, job_id: str) -> List[Result]:
+        return self.find("results", job_id=job_id)
+
+    def latest_result_per_job(self) -> Dict[str, Result]:
+        """
+        Returns the most recently updated result of every mirrored job, keyed by job ID.
+        """
+        return {job_id: Result(**record) for job_id, record in self.store.latest("results", "job_id").items()}
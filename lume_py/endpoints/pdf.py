@@ -1,17 +1,21 @@
-import httpx
-from lume_py.endpoints.config import get_settings
-from .sdk.api_client import Pagination
+from typing import Optional
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.binding import Bindable
+from lume_py.endpoints.sdk.hooks import instrumented
+from .sdk.api_client import Pagination, UploadFile
+from .sdk.downloads import Download, Downloader
+from .uploads import UploadManifest
 from http import HTTPMethod
 
-settings = get_settings()
 
-class PDF:
+class PDF(Bindable):
     """
     Service class for PDF-related workflows.
     This may include custom endpoints for specific use cases.
     """
 
     @staticmethod
+    @instrumented("PDF.process_adv_form")
     async def process_adv_form(pdf_path: str):
         """
         Processes an advanced form PDF.
@@ -19,35 +23,29 @@ class PDF:
         :return: A dictionary representing the processed PDF result.
         """
 
-        async with httpx.AsyncClient() as client:
-            with open(pdf_path, 'rb') as pdf_file:
-                files = {'file': (pdf_path, pdf_file, 'application/pdf')}
-                response = await client.post(
-                    'https://staging.lume-terminus.com/crud/pdf/adv',
-                    files=files,
-                    headers={'lume-api-key': settings.client.api_key}
-                )
-                response.raise_for_status()
-                response = response.json()
-                status = response['status']
-
-                while status in ['QUEUED', 'PENDING']:
-                    response = await client.get(f'https://staging.lume-terminus.com/crud/pdf/adv/{response["id"]}', headers={'lume-api-key': settings.client.api_key})
-                    response = response.json()
-                    status = response['status']
-                return response
+        files = {'file': (pdf_path, UploadFile(pdf_path), 'application/pdf')}
+        response = await get_client().request(
+            method=HTTPMethod.POST,
+            url='https://staging.lume-terminus.com/crud/pdf/adv',
+            files=files,
+        )
+        return await get_client().poll(
+            f'https://staging.lume-terminus.com/crud/pdf/adv/{response["id"]}', response, pending=['QUEUED', 'PENDING']
+        )
 
     @staticmethod
+    @instrumented("PDF.get_adv_form")
     async def get_adv_form(pdf_id):
         """
         Retrieves an advanced form PDF by its ID.
         :return: FileResult object representing the PDF.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"pdf/adv/{pdf_id}"
         )
 
     @staticmethod
+    @instrumented("PDF.get_adv_forms_page")
     async def get_adv_forms_page(page: int = 1, size: int = 50):
         """
         Retrieves a paginated list of advanced form PDFs.
@@ -55,13 +53,14 @@ class PDF:
         :param size: The number of items per page (optional, defaults to 50).
         :return: PaginatedResponse containing FileResult objects.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET,
             url="pdf/adv",
             pagination=Pagination(page=page, size=size),
         )
 
     @staticmethod
+    @instrumented("PDF.get_adv_url")
     async def get_adv_url(pdf_id: int):
         """
         Retrieves the URL of an advanced form PDF by its ID.
@@ -69,7 +68,7 @@ class PDF:
         :return: URL of the PDF.
         """
         try:
-            body = await settings.client.request(
+            body = await get_client().request(
                 method=HTTPMethod.GET, url=f"pdf/adv/{pdf_id}/url"
             )
             return body["url"]
@@ -77,33 +76,38 @@ class PDF:
             raise exc
 
     @staticmethod
-    async def extract_pdf(pdf_path: str, immediate: bool = False):
+    @instrumented("PDF.extract_pdf")
+    async def extract_pdf(pdf_path: str, immediate: bool = False, manifest: Optional[UploadManifest] = None):
         """
         Extracts data from a PDF file.
         :param pdf_path: The path to the PDF file to process.
+        :param manifest: Skips the upload if the same content was extracted before (optional).
+            A finished extraction is returned as recorded; an unfinished one is polled by its ID.
         :return: A dictionary representing the extracted PDF result.
         """
-        async with httpx.AsyncClient() as client:
-            with open(pdf_path, 'rb') as pdf_file:
-                files = {'file': (pdf_path, pdf_file, 'application/pdf')}
-                response = await client.post(
-                    'https://staging.lume-terminus.com/crud/pdf/orders',
-                    files=files,
-                    headers={'lume-api-key': settings.client.api_key}
-                )
-                response.raise_for_status()
-                response = response.json()
-                status = response['status']
-                if immediate is True:
-                    return response
-                else:
-                    while status in ['QUEUED', 'PENDING']:
-                        response = await client.get(f'https://staging.lume-terminus.com/crud/pdf/orders/{response["id"]}', headers={'lume-api-key': settings.client.api_key})
-                        response = response.json()
-                        status = response['status']
-                    return response
+        key = response = None
+        if manifest is not None:
+            key, response = await manifest.lookup("PDF.extract_pdf", pdf_path)
+        if response is None:
+            files = {'file': (pdf_path, UploadFile(pdf_path), 'application/pdf')}
+            response = await get_client().request(
+                method=HTTPMethod.POST,
+                url='https://staging.lume-terminus.com/crud/pdf/orders',
+                files=files,
+            )
+            if key is not None:
+                manifest.put(key, response)
+        if immediate is True:
+            return response
+        result = await get_client().poll(
+            f'https://staging.lume-terminus.com/crud/pdf/orders/{response["id"]}', response, pending=['QUEUED', 'PENDING']
+        )
+        if key is not None and result is not response:
+            manifest.put(key, result)
+        return result
 
     @staticmethod
+    @instrumented("PDF.get_pdfs")
     async def get_pdfs(page: int = 1, size: int = 50):
         """
         Retrieves a paginated list of PDF orders.
@@ -111,24 +115,26 @@ class PDF:
         :param size: The number of items per page (optional, defaults to 50).
         :return: PaginatedResponse containing FileResult objects.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET,
             url="pdf/orders",
             pagination=Pagination(page=page, size=size),
         )
 
     @staticmethod
+    @instrumented("PDF.get_pdf")
     async def get_pdf(pdf_id: int):
         """
         Retrieves a PDF order by its ID.
         :param pdf_id: The ID of the PDF order.
         :return: FileResult object representing the PDF.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"pdf/orders/{pdf_id}"
         )
 
     @staticmethod
+    @instrumented("PDF.get_pdf_url")
     async def get_pdf_url(pdf_id: int):
         """
         Retrieves the URL of a PDF order by its ID.
@@ -136,9 +142,37 @@ class PDF:
         :return: URL of the PDF.
         """
         try:
-            body = await settings.client.request(
+            body = await get_client().request(
                 method=HTTPMethod.GET, url=f"pdf/orders/{pdf_id}/url"
             )
             return body["url"]
         except Exception as exc:
             raise exc
+
+    @staticmethod
+    @instrumented("PDF.download_pdf")
+    async def download_pdf(pdf_id: int, path: str, checksum: Optional[str] = None, downloader: Optional[Downloader] = None) -> Download:
+        """
+        Downloads the file of a PDF order to disk in parallel chunks, resuming an interrupted download.
+        :param pdf_id: The ID of the PDF order.
+        :param path: The destination file.
+        :param checksum: The expected digest as ``"<algorithm>:<hex>"`` (optional).
+        :param downloader: The downloader to use (optional, defaults to the client's).
+        :return: What was transferred.
+        """
+        url = await PDF.get_pdf_url(pdf_id)
+        return await (downloader or get_client().downloader).download(url, path, checksum=checksum)
+
+    @staticmethod
+    @instrumented("PDF.download_adv")
+    async def download_adv(pdf_id: int, path: str, checksum: Optional[str] = None, downloader: Optional[Downloader] = None) -> Download:
+        """
+        Downloads the file of an advanced form PDF to disk in parallel chunks, resuming an interrupted download.
+        :param pdf_id: The ID of the PDF form.
+        :param path: The destination file.
+        :param checksum: The expected digest as ``"<algorithm>:<hex>"`` (optional).
+        :param downloader: The downloader to use (optional, defaults to the client's).
+        :return: What was transferred.
+        """
+        url = await PDF.get_adv_url(pdf_id)
+        return await (downloader or get_client().downloader).download(url, path, checksum=checksum)
@@ -1,14 +1,17 @@
 from typing import Optional, Dict, List, Any, Tuple
-import httpx
 from pydantic import BaseModel, Field
-from lume_py.endpoints.config import get_settings
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.hooks import instrumented
 from lume_py.endpoints.jobs import Job
 from lume_py.endpoints.workshop import WorkShop
 from lume_py.endpoints.mappers import Mapping
-from .sdk.api_client import Pagination
+from lume_py.endpoints.dedup import Deduplicated
+from lume_py.endpoints.validation import SchemaValidator, ValidationReport, get_validator, validate_records
+from lume_py.endpoints.uploads import UploadManifest
+from .sdk.api_client import Pagination, UploadFile
 from http import HTTPMethod
 
-settings = get_settings()
 
 class PipelineCreatePayload(BaseModel):
     name: str = Field(..., example="Example Pipeline")
@@ -60,7 +63,7 @@ class PipelinePopulateSheets(BaseModel):
     class Config:
         orm_mode = True
 
-class Pipeline(BaseModel):
+class Pipeline(BoundModel):
     id: Optional[str] = None
     user_id: Optional[str] = None
     name: Optional[str] = None
@@ -75,6 +78,7 @@ class Pipeline(BaseModel):
         orm_mode = True
 
     @staticmethod
+    @instrumented("Pipeline.get_all_pipelines")
     async def get_all_pipelines(page: int = 1, size: int = 50, all: bool = False) -> List['Pipeline']:
         """
         Fetches pipeline data, either all pipelines across pages or a single page of pipelines.
@@ -88,21 +92,22 @@ class Pipeline(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET, url="pipelines", pagination=pagination
                 )
                 pipelines.extend([Pipeline(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET, url="pipelines", pagination=pagination
             )
             pipelines.extend([Pipeline(**item) for item in response["items"]])
         return pipelines
 
     @classmethod
+    @instrumented("Pipeline.create")
     async def create(cls, name: str, target_schema: Dict[str, Any], description: Optional[str] = None) -> 'Pipeline':
         """
         Creates a new pipeline.
@@ -117,12 +122,13 @@ class Pipeline(BaseModel):
             "target_schema": target_schema,
             "description": description
         }
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url="pipelines", json=payload
         )
         return cls(**response)
 
     @classmethod
+    @instrumented("Pipeline.get_pipeline_by_id")
     async def get_pipeline_by_id(cls, pipeline_id: str) -> 'Pipeline':
         """
         Fetches a pipeline by its ID.
@@ -130,11 +136,12 @@ class Pipeline(BaseModel):
         :param pipeline_id: The ID of the pipeline to fetch.
         :return: The pipeline instance.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"pipelines/{pipeline_id}"
         )
         return cls(**response)
 
+    @instrumented("Pipeline.update")
     async def update(self, name: str, description: str) -> 'Pipeline':
         """
         Updates the pipeline with new information.
@@ -147,11 +154,12 @@ class Pipeline(BaseModel):
         if not self.id:
             raise ValueError("Pipeline ID is required for updating.")
         payload = {"name": name, "description": description}
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.PUT, url=f"pipelines/{self.id}", json=payload
         )
         return Pipeline(**response)
 
+    @instrumented("Pipeline.delete")
     async def delete(self) -> None:
         """
         Deletes the pipeline.
@@ -160,27 +168,25 @@ class Pipeline(BaseModel):
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for deletion.")
-        await settings.client.request(
+        await get_client().request(
             method=HTTPMethod.DELETE, url=f"pipelines/{self.id}"
         )
 
-    async def create_job(self, source_data: List[Dict[str, Any]]) -> Job:
+    @instrumented("Pipeline.create_job")
+    async def create_job(self, source_data: List[Dict[str, Any]], dedup: bool = False) -> Job:
         """
         Creates a job associated with the pipeline.
 
         :param source_data: The source data for the job.
+        :param dedup: Whether to send identical records only once (optional, defaults to False).
         :return: The created job instance.
         :raises ValueError: If the pipeline ID is not set.
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for creating a job.")
-        response = await settings.client.request(
-            method=HTTPMethod.POST,
-            url=f"pipelines/{self.id}/jobs",
-            json={"data": source_data},
-        )
-        return Job(**response)
+        return await Job.create(self.id, source_data, dedup=dedup)
 
+    @instrumented("Pipeline.get_workshops")
     async def get_workshops(self, page: int = 1, size: int = 50, all: bool = False) -> List[WorkShop]:
         """
         Retrieves all workshops associated with the pipeline, iterating through pages until all workshops are retrieved.
@@ -198,7 +204,7 @@ class Pipeline(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET,
                     url=f"pipelines/{self.id}/workshops",
                     pagination=pagination,
@@ -208,9 +214,9 @@ class Pipeline(BaseModel):
                 )
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET,
                 url=f"pipelines/{self.id}/workshops",
                 pagination=pagination,
@@ -219,6 +225,7 @@ class Pipeline(BaseModel):
 
         return workshops
 
+    @instrumented("Pipeline.create_workshop")
     async def create_workshop(self) -> WorkShop:
         """
         Creates a workshop associated with the pipeline.
@@ -228,11 +235,12 @@ class Pipeline(BaseModel):
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for creating a workshop.")
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url=f"pipelines/{self.id}/workshops"
         )
         return WorkShop(**response)
 
+    @instrumented("Pipeline.get_target_schema")
     async def get_target_schema(self) -> Dict[str, Any]:
         """
         Retrieves the target schema for the pipeline.
@@ -242,10 +250,39 @@ class Pipeline(BaseModel):
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for fetching target schema.")
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"pipelines/{self.id}/target_schema"
         )
 
+    @instrumented("Pipeline.get_validator")
+    async def get_validator(self) -> SchemaValidator:
+        """
+        Returns the pipeline's target schema compiled for local validation,
+        fetching the schema first if this pipeline does not carry it.
+
+        :return: The validator, shared by every pipeline with the same target schema.
+        :raises ValueError: If the pipeline ID is not set.
+        """
+        if self.target_schema is None:
+            self.target_schema = await self.get_target_schema()
+        return get_validator(self.target_schema, schema_id=self.target_schema_id)
+
+    @instrumented("Pipeline.validate_records")
+    async def validate_records(self, records: List[Dict[str, Any]], processes: Optional[int] = None) -> ValidationReport:
+        """
+        Validates records, e.g. ``mapping.mapped_data``, against the pipeline's target schema locally.
+        Validation runs on the client's executor, so the event loop stays free.
+
+        :param records: The records to validate.
+        :param processes: Worker processes for large batches (optional, defaults to none).
+        :return: The report with the errors of every row.
+        """
+        validator = await self.get_validator()
+        return await get_client().offload(
+            validate_records, validator.schema, records, schema_id=self.target_schema_id, processes=processes
+        )
+
+    @instrumented("Pipeline.get_mapper")
     async def get_mapper(self) -> List[Dict[str, Any]]:
         """
         Retrieves the mapper for the pipeline.
@@ -255,13 +292,14 @@ class Pipeline(BaseModel):
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for fetching mapper.")
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"pipelines/{self.id}/mapper"
         )
         if response is None:
             raise ValueError("No mapper found for this pipeline, consider running the job first.")
         return response
 
+    @instrumented("Pipeline.learn")
     async def learn(self, target_property_names: Optional[List[str]] = None) -> None:
         """
         Initiates learning on the pipeline.
@@ -272,60 +310,84 @@ class Pipeline(BaseModel):
         if not self.id:
             raise ValueError("Pipeline ID is required for learning.")
         payload = {'target_field_names': target_property_names}
-        await settings.client.request(
+        await get_client().request(
             method=HTTPMethod.POST, url=f"pipelines/{self.id}/learn", json=payload
         )
 
-    async def run_pipeline(self, source_data: List[Dict[str, Any]], immediate: bool = False) -> Mapping:
+    @instrumented("Pipeline.run_pipeline")
+    async def run_pipeline(self, source_data: List[Dict[str, Any]], immediate: bool = False, dedup: bool = False) -> Mapping:
         """
         Runs the pipeline with the given source data.
 
         :param source_data: The source data for the pipeline.
         :param immediate: Whether to return the mapping immediately or wait for completion.
+        :param dedup: Whether to send identical records only once (optional, defaults to False).
+            ``mapped_data`` is expanded back to one record per original row.
         :return: The mapping result.
         :raises ValueError: If the pipeline ID is not set or no mapper is found.
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for running the pipeline.")
-        response = await settings.client.request(
+        plan = Deduplicated(source_data) if dedup else None
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"pipeline/{self.id}/run",
-            json={"data": source_data},
+            json={"data": plan.unique if plan else source_data},
         )
-        status = response['status']
-        result_id = response['id']
         if immediate is True:
-            return Mapping(**response)
-        else:
-            while status in ['queued', 'running']:
-                result = await settings.client.request(
-                    method=HTTPMethod.GET, url=f"mappings/{result_id}"
-                )
-                status = result['status']
-            if result is None:
-                raise ValueError("No mapper found for this pipeline, consider running the job first.")
-            return Mapping(**result)
-
-    async def upload_sheets(self, file_path: str, pipeline_map_list: Optional[str] = '', second_table_row_to_insert: Optional[int] = None):
+            return Mapping._expanded(response, plan)
+        result = await get_client().wait(f"mappings/{response['id']}", response)
+        if result is None:
+            raise ValueError("No mapper found for this pipeline, consider running the job first.")
+        return Mapping._expanded(result, plan)
+
+    @instrumented("Pipeline.upload_sheets")
+    async def upload_sheets(
+        self,
+        file_path: str,
+        pipeline_map_list: Optional[str] = '',
+        second_table_row_to_insert: Optional[int] = None,
+        manifest: Optional[UploadManifest] = None,
+        sheets: Optional[str] = None,
+        ranges: Optional[Dict[str, str]] = None,
+    ):
         """
         Uploads sheets for the pipeline.
 
         :param file_path: Path to the file to upload.
         :param pipeline_map_list: Optional list of pipeline maps.
         :param second_table_row_to_insert: Optional row number to insert in the second table.
+        :param manifest: Skips the upload and returns the previous response if the same content was uploaded before (optional).
+        :param sheets: Comma-delimited sheets to keep; the others are removed locally before the upload (optional).
+            Requires ``pip install lume_py[excel]``.
+        :param ranges: Cell ranges to keep per sheet, e.g. ``{"Orders": "A1:H5000"}`` (optional).
         :return: Response JSON from the upload endpoint.
         """
-        with open(file_path, 'rb') as file:
-            files = {'file': (file_path, file, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
-            data = {
-                'pipeline_map_list': pipeline_map_list,
-                'second_table_row_to_insert': second_table_row_to_insert
-            }
-            async with httpx.AsyncClient(timeout=60) as cli:
-                response = await cli.post('https://api.lume.ai/crud/pipelines/upload/sheets', headers={'lume-api-key': settings.lume_api_key}, files=files, data=data)
-                response.raise_for_status()
-                return response.json()
+        data = {
+            'pipeline_map_list': pipeline_map_list,
+            'second_table_row_to_insert': second_table_row_to_insert
+        }
+        cache_key = None
+        if manifest is not None:
+            cache_key, cached = await manifest.lookup("Pipeline.upload_sheets", file_path, pipeline_id=self.id, sheets=sheets, ranges=ranges, **data)
+            if cached is not None:
+                return cached
+        from lume_py.endpoints.sheets import prefiltered
+
+        async with prefiltered(file_path, sheets, ranges) as upload_path:
+            files = {'file': (file_path, UploadFile(upload_path), 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+            response = await get_client().request(
+                method=HTTPMethod.POST,
+                url='https://api.lume.ai/crud/pipelines/upload/sheets',
+                files=files,
+                data={key: value for key, value in data.items() if value is not None},
+                timeout=60,
+            )
+        if cache_key is not None:
+            manifest.put(cache_key, response)
+        return response
 
+    @instrumented("Pipeline.populate_sheets")
     async def populate_sheets(self, pipeline_ids: str, populate_excel_payload: str, file_type: str) -> Dict[str, Any]:
         """
         Populates sheets with the provided data.
@@ -336,12 +398,13 @@ class Pipeline(BaseModel):
         :return: Response JSON from the populate endpoint.
         """
         sheets_data = PipelinePopulateSheets(pipeline_ids=pipeline_ids, populate_excel_payload=populate_excel_payload, file_type=file_type)
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.POST,
             url="pipelines/populate/sheets",
             json=sheets_data.model_dump(),
         )
 
+    @instrumented("Pipeline.get_images")
     async def get_images(self) -> Dict[str, Any]:
         """
         Retrieves images associated with the pipeline.
@@ -351,6 +414,6 @@ class Pipeline(BaseModel):
         """
         if not self.id:
             raise ValueError("Pipeline ID is required for fetching images.")
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.POST, url=f"pipelines/{self.id}/populate/images"
         )
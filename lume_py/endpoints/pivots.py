@@ -0,0 +1,184 @@
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.excel import Excel
+from lume_py.endpoints.sdk.binding import use_client
+from lume_py.endpoints.sdk.handles import as_completed
+from lume_py.endpoints.sdk.hooks import route_template
+
+if TYPE_CHECKING:
+    from lume_py.endpoints.sdk.api_client import Lume
+
+PENDING_STATUSES = ("QUEUED", "PENDING", "RUNNING")
+FAILED_STATUSES = ("FAILED", "ERROR")
+# Status codes that do not end tracking of a task, besides every 5xx.
+TRANSIENT_STATUSES = {408, 429}
+STATUS_URL = "https://staging.lume-terminus.com/crud/excel/pivot/{task_id}"
+
+
+class PivotTask(BaseModel):
+    """
+    A tracked pivot task that is no longer pending.
+    """
+    id: str
+    status: Optional[str] = None
+    response: Dict[str, Any] = {}
+    url: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+class PivotTaskTracker:
+    """
+    Tracks many Excel pivot tasks at once and yields each one as it finishes.
+
+        tracker = PivotTaskTracker(task_ids, fetch_urls=True)
+        async for task in tracker.track(timeout=600):
+            print(task.id, task.status, task.url)
+
+    Every round checks the status of all pending tasks concurrently over the
+    client's connection pool, then sleeps. The delay starts at the client's
+    ``poll_interval`` and grows by half after every round in which nothing
+    finished, up to ``max_poll_interval``; it starts over when a task finishes.
+
+    A task whose status check is rejected with a 4xx response, e.g. 404 for an
+    unknown ID, is yielded with ``error`` set. Timeouts, connection errors, 429
+    and 5xx responses only skip the round: the task stays pending until it fails
+    ``max_errors`` checks in a row.
+
+    :param task_ids: The IDs of the pivot tasks.
+    :param fetch_urls: Whether to fetch the file URL of each finished task with
+        ``Excel.get_pivot_task_url``; failed tasks are skipped (optional, defaults to False).
+    :param pending: The statuses that mean a task is still in progress
+        (optional, compared case-insensitively).
+    :param max_concurrency: Status requests in flight at once (optional, defaults to 10).
+    :param max_errors: Consecutive transient failures after which a task is given up
+        (optional, defaults to 5).
+    :param client: The client to poll with (optional, defaults to the current client
+        when tracking starts).
+    """
+
+    def __init__(
+        self,
+        task_ids: Iterable[str] = (),
+        fetch_urls: bool = False,
+        pending: Iterable[str] = PENDING_STATUSES,
+        max_concurrency: int = 10,
+        max_errors: int = 5,
+        client: Optional["Lume"] = None,
+    ):
+        self.client = client
+        self.fetch_urls = fetch_urls
+        self.pending_statuses = {status.upper() for status in pending}
+        self.max_concurrency = max_concurrency
+        self.max_errors = max_errors
+        self._pending: Dict[str, float] = {}
+        self._errors: Dict[str, int] = {}
+        self.finished: Dict[str, PivotTask] = {}
+        for task_id in task_ids:
+            self.add(task_id)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def pending(self) -> List[str]:
+        """
+        The IDs of the tasks still being tracked.
+        """
+        return list(self._pending)
+
+    def add(self, task_id: str) -> None:
+        """
+        Starts tracking a task, also while ``track`` is running.
+        """
+        task_id = str(task_id)
+        if task_id not in self._pending and task_id not in self.finished:
+            self._pending[task_id] = time.perf_counter()
+
+    async def track(self, timeout: Optional[float] = None) -> AsyncIterator[PivotTask]:
+        """
+        Polls the pending tasks until every one of them has finished.
+
+        :param timeout: Seconds to track them (optional, defaults to no limit).
+        :return: An async iterator of finished tasks in completion order.
+        :raises TimeoutError: If tasks are still pending after ``timeout`` seconds.
+        """
+        client = self.client = self.client or get_client()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = client.poll_interval
+        rounds = 0
+        while self._pending:
+            rounds += 1
+            finished = False
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            checks = [lambda task_id=task_id: self._check(task_id, rounds) for task_id in self._pending]
+            async for handle in as_completed(checks, timeout=remaining, max_concurrency=self.max_concurrency):
+                task = handle.result()
+                if task is not None:
+                    finished = True
+                    yield task
+            if not self._pending:
+                break
+            interval = client.poll_interval if finished else min(interval * 1.5, client.max_poll_interval)
+            delay = interval * random.uniform(0.9, 1.1)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise TimeoutError(f"{len(self._pending)} pivot tasks still pending after {timeout} seconds")
+            await asyncio.sleep(delay)
+
+    async def wait(self, timeout: Optional[float] = None) -> List[PivotTask]:
+        """
+        Waits for every pending task and returns them in completion order.
+
+        :param timeout: Seconds to wait (optional, defaults to no limit).
+        :raises TimeoutError: If tasks are still pending after ``timeout`` seconds.
+        """
+        return [task async for task in self.track(timeout=timeout)]
+
+    async def _check(self, task_id: str, rounds: int) -> Optional[PivotTask]:
+        # Checks run as separate tasks, so select the tracker's client in each of them.
+        with use_client(self.client):
+            return await self._check_status(task_id, rounds)
+
+    async def _check_status(self, task_id: str, rounds: int) -> Optional[PivotTask]:
+        import httpx
+
+        hooks = get_client().hooks
+        url = STATUS_URL.format(task_id=task_id)
+        try:
+            response = await Excel.get_pivot_task_status(task_id)
+        except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+            status_code = exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+            errors = self._errors[task_id] = self._errors.get(task_id, 0) + 1
+            transient = status_code is None or status_code >= 500 or status_code in TRANSIENT_STATUSES
+            if transient and errors < self.max_errors:
+                return None  # Try again in the next round.
+            return self._finish(PivotTask(id=task_id, error=repr(exc)), url, rounds)
+        except Exception as exc:
+            return self._finish(PivotTask(id=task_id, error=repr(exc)), url, rounds)
+        self._errors.pop(task_id, None)
+        status = response.get("status")
+        hooks.emit("poll_tick", url=url, route=route_template(url), attempt=rounds, status=status,
+                   elapsed=time.perf_counter() - self._pending[task_id])
+        if str(status).upper() in self.pending_statuses:
+            return None
+        task = PivotTask(id=task_id, status=status, response=response)
+        if self.fetch_urls and str(status).upper() not in FAILED_STATUSES:
+            try:
+                task.url = (await Excel.get_pivot_task_url(task_id))["url"]
+            except Exception as exc:
+                task.error = repr(exc)
+        return self._finish(task, url, rounds)
+
+    def _finish(self, task: PivotTask, url: str, rounds: int) -> PivotTask:
+        task.elapsed = time.perf_counter() - self._pending.pop(task.id)
+        self._errors.pop(task.id, None)
+        self.finished[task.id] = task
+        get_client().hooks.emit("poll_end", url=url, route=route_template(url), attempt=rounds,
+                                status=task.status, elapsed=task.elapsed)
+        return task
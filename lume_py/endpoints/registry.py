@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.handles import gather
+from lume_py.endpoints.sdk.hooks import instrumented
+from lume_py.endpoints.target import Target
+
+ROUTE = "target_schemas/{id}"
+
+
+class TargetRegistry:
+    """
+    Resolves target schema IDs to ``Target`` objects through a bounded,
+    expiring cache.
+
+        registry = TargetRegistry(max_size=1000, ttl=300)
+        target = await registry.get(target_id)
+        targets = await registry.get_many(target_ids)
+
+    Misses are fetched with ``target_schemas/{id}``; concurrent lookups of the
+    same ID share one request. Every lookup emits a ``cache_hit`` or
+    ``cache_miss`` event on the client's hooks.
+
+    :param max_size: The number of targets kept; the least recently used are evicted first
+        (optional, defaults to 1024).
+    :param ttl: Seconds a cached target is served before it is fetched again
+        (optional, defaults to 300; ``None`` keeps targets until evicted).
+    :param max_concurrency: Targets fetched at once by ``get_many`` (optional, defaults to 10).
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 300.0, max_concurrency: int = 10):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_concurrency = max_concurrency
+        self._targets: "OrderedDict[str, Tuple[float, Target]]" = OrderedDict()
+        self._fetching: Dict[str, "asyncio.Task[Optional[Target]]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __contains__(self, target_id: str) -> bool:
+        return self._cached(target_id) is not None
+
+    def invalidate(self, target_id: Optional[str] = None) -> None:
+        """
+        Drops one target from the cache, or every target when no ID is given.
+        """
+        if target_id is None:
+            self._targets.clear()
+        else:
+            self._targets.pop(target_id, None)
+
+    def add(self, target: Target) -> None:
+        """
+        Stores a target in the cache, e.g. one that was just created or updated.
+        """
+        self._store(target.id, target)
+
+    def _store(self, target_id: str, target: Target) -> None:
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._targets[target_id] = (expires, target)
+        self._targets.move_to_end(target_id)
+        while len(self._targets) > self.max_size:
+            self._targets.popitem(last=False)
+
+    @instrumented("TargetRegistry.get")
+    async def get(self, target_id: str) -> Optional[Target]:
+        """
+        Resolves a target schema ID.
+
+        :param target_id: The ID of the target schema.
+        :return: The target schema, or None if no target schema has this ID.
+        """
+        hooks = get_client().hooks
+        target = self._cached(target_id)
+        if target is not None:
+            hooks.emit("cache_hit", route=ROUTE, key=target_id)
+            return target
+        hooks.emit("cache_miss", route=ROUTE, key=target_id)
+        task = self._fetching.get(target_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(target_id))
+            self._fetching[target_id] = task
+            task.add_done_callback(lambda _: self._fetching.pop(target_id, None))
+        return await asyncio.shield(task)
+
+    @instrumented("TargetRegistry.get_many")
+    async def get_many(self, target_ids: Iterable[str]) -> Dict[str, Optional[Target]]:
+        """
+        Resolves many target schema IDs concurrently. Cached IDs cost no requests
+        and duplicate IDs are fetched once.
+
+        :param target_ids: The IDs of the target schemas.
+        :return: The target schema per ID, or None for IDs that do not exist.
+        """
+        unique = list(dict.fromkeys(target_ids))
+        resolved = await gather([self.get(target_id) for target_id in unique], max_concurrency=self.max_concurrency)
+        for outcome in resolved:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return dict(zip(unique, resolved))
+
+    @instrumented("TargetRegistry.refresh")
+    async def refresh(self, size: int = 100) -> int:
+        """
+        Reloads the cache from the full listing of target schemas, keeping the
+        ``max_size`` most recently listed ones.
+
+        :param size: The number of items per listing page (optional, defaults to 100).
+        :return: The number of targets cached.
+        """
+        targets = await Target.get(size=size, all=True)
+        self._targets.clear()
+        for target in targets[-self.max_size:]:
+            self.add(target)
+        return len(self._targets)
+
+    def _cached(self, target_id: str) -> Optional[Target]:
+        entry = self._targets.get(target_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._targets[target_id]
+            return None
+        self._targets.move_to_end(target_id)
+        return entry[1]
+
+    async def _fetch(self, target_id: str) -> Optional[Target]:
+        target = await Target.get_target_by_id(target_id)
+        if target is not None:
+            self._store(target_id, target)
+        return target
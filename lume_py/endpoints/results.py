@@ -1,12 +1,19 @@
-from typing import Any, Optional, List, Dict
-from pydantic import BaseModel
-from lume_py.endpoints.config import get_settings
+from typing import Any, AsyncIterator, Iterable, Optional, List, Dict, Tuple, Union
+from pydantic import BaseModel, PrivateAttr
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.dedup import Deduplicated
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.handles import as_completed
+from lume_py.endpoints.sdk.hooks import instrumented
 from .sdk.api_client import Pagination
 from http import HTTPMethod
 import asyncio
+import functools
+
+# Statuses of results that need someone to look at them.
+TRIAGE_STATUSES = ("failed", "needs review")
 
 
-settings = get_settings()
 
 class ResultMapper(BaseModel):
     result_id: Optional[str] = None
@@ -18,16 +25,19 @@ class ResultMapper(BaseModel):
     class Config:
         orm_mode = True
 
-class Result(BaseModel):
+class Result(BoundModel):
     id: Optional[str] = None
     status: Optional[str] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    # Set on results of jobs created with ``dedup=True`` to expand their mappings.
+    _dedup: Optional[Deduplicated] = PrivateAttr(default=None)
 
     class Config:
         orm_mode = True
 
     @staticmethod
+    @instrumented("Result.get_results")
     async def get_results(page: int = 1, size: int = 50, all: bool = False) -> List['Result']:
         """
         Fetches result data, either all results across pages or a single page of results.
@@ -40,48 +50,53 @@ class Result(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET, url="results", pagination=pagination
                 )
                 results.extend([Result(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET, url="results", pagination=pagination
             )
             results.extend([Result(**item) for item in response["items"]])
         return results
 
     @classmethod
+    @instrumented("Result.get_by_id")
     async def get_by_id(cls, result_id: str) -> 'Result':
         """
         Retrieves a result by its ID.
         :param result_id: The ID of the result to retrieve.
         :return: The result details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"results/{result_id}"
         )
         return cls(**response)
 
+    @instrumented("Result.get_details")
     async def get_details(self) -> 'Result':
         """
         Retrieves the details of this result.
         :return: The result details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"results/{self.id}"
         )
-        return Result(**response)
+        result = Result(**response)
+        result._dedup = self._dedup
+        return result
 
+    @instrumented("Result.get_spec")
     async def get_spec(self) -> Dict[str, Any]:
         """
         Retrieves specifications associated with a specific result.
         :return: The specifications.
         """
-        spec = await settings.client.request(
+        spec = await get_client().request(
             method=HTTPMethod.GET, url=f"results/{self.id}/spec"
         )
         if spec:
@@ -89,9 +104,11 @@ class Result(BaseModel):
         else:
             raise ValueError("No spec found for this result, consider running the job first.")
 
+    @instrumented("Result.get_mappings")
     async def get_mappings(self, all: bool = False) -> List[ResultMapper]:
         """
         Retrieves all mappings associated with a specific result, iterating through pages until all results are retrieved.
+        For a job created with ``dedup=True``, the mappings are expanded back to one per original row.
         :param all: Whether to fetch all pages of mappings (optional, defaults to False).
         :return: The list of mappings.
         """
@@ -99,7 +116,7 @@ class Result(BaseModel):
         pagination = Pagination()
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET,
                     url=f"results/{self.id}/mappings",
                     pagination=pagination,
@@ -107,46 +124,92 @@ class Result(BaseModel):
                 mappings.extend([ResultMapper(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < pagination.size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET,
                 url=f"results/{self.id}/mappings",
                 pagination=pagination,
             )
             mappings.extend([ResultMapper(**item) for item in response["items"]])
+        if self._dedup is not None:
+            mappings = self._dedup.expand_mappings(mappings)
         return mappings
 
+    @instrumented("Result.wait")
+    async def wait(self, timeout: Optional[float] = None) -> 'Result':
+        """
+        Waits until the result is no longer queued or running and refreshes it.
+        Completion is pushed by the server when it supports it and polled otherwise.
+        :param timeout: Seconds to wait (optional, defaults to no limit).
+        :return: The updated Result object.
+        :raises TimeoutError: If the result is still pending after ``timeout`` seconds.
+        """
+        if not self.id:
+            raise ValueError("Result ID is required for waiting.")
+        response = await get_client().wait(f"results/{self.id}", self.model_dump(), timeout=timeout)
+        for name, value in Result(**response).model_dump().items():
+            setattr(self, name, value)
+        return self
+
+    @instrumented("Result.generate_confidence_scores")
     async def generate_confidence_scores(self, timeout: int = 10):
         """
         Generates confidence scores for a specific result.
         :param timeout: The timeout for the operation.
         :return: The confidence scores.
+        :raises TimeoutError: If the scores are not ready after ``timeout`` seconds.
         """
 
         async def fetch_confidence_scores():
-            confidence = await settings.client.request(
+            confidence = await get_client().request(
                 method=HTTPMethod.POST, url=f"results/{self.id}/confidence"
             )
-            status = confidence["status"]
-            while status in ["pending", "running", "queued"]:
-                confidence = await settings.client.request(
-                    method=HTTPMethod.GET, url=f"results/{self.id}/confidence"
-                )
-                status = confidence["status"]
-            return confidence
+            return await get_client().wait(
+                f"results/{self.id}/confidence", confidence, pending=["pending", "running", "queued"]
+            )
 
         try:
             confidence = await asyncio.wait_for(fetch_confidence_scores(), timeout)
-        except Exception as exc:
+        except TimeoutError as exc:
             raise TimeoutError(f"Operation timed out after {timeout} seconds") from exc
 
         return confidence
 
-    async def get_failed(self):
-        results = await self.get_results()
-        res = []
-        for result in results:
-            if result.status == "failed" or result.status == "needs review":
-                res.append(result)
-        return res
+    @staticmethod
+    async def generate_confidence_scores_many(
+        results: Iterable['Result'],
+        max_concurrency: int = 20,
+        timeout: float = 60,
+    ) -> AsyncIterator[Tuple['Result', Union[Dict[str, Any], Exception]]]:
+        """
+        Generates confidence scores for many results concurrently and yields them as they complete.
+
+            async for result, scores in Result.generate_confidence_scores_many(results):
+                if isinstance(scores, Exception):
+                    ...
+
+        :param results: The results to score.
+        :param max_concurrency: Results scored at once (optional, defaults to 20).
+        :param timeout: Seconds each result may take once started (optional, defaults to 60).
+            A result that times out yields a ``TimeoutError`` without affecting the others.
+        :return: An async iterator of ``(result, scores)`` pairs in completion order, where
+            ``scores`` is the exception raised for that result if it failed.
+        :raises ValueError: If ``max_concurrency`` is below 1.
+        """
+        results = list(results)
+        operations = [functools.partial(result.generate_confidence_scores, timeout) for result in results]
+        async for handle in as_completed(operations, max_concurrency=max_concurrency):
+            yield results[handle.index], handle.exception() or handle.result()
+
+    @staticmethod
+    @instrumented("Result.get_failed")
+    async def get_failed(size: int = 100) -> List['Result']:
+        """
+        Fetches every result whose status is failed or needs review.
+        To check repeatedly, keep a ``TriageIndex`` and refresh it instead of calling this.
+        :param size: The number of items per page (optional, defaults to 100).
+        :return: A list of failed results.
+        """
+        results = await Result.get_results(size=size, all=True)
+        return [result for result in results if result.status in TRIAGE_STATUSES]
@@ -1,8 +1,39 @@
-import httpx
-from httpx import HTTPStatusError
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+import json as jsonlib
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union
 from pydantic import BaseModel, Field
 from http import HTTPMethod, HTTPStatus
+from .concurrency import AdaptiveConcurrency, FixedConcurrency
+from .lanes import BULK, PriorityLanes, lane
+from .completion import UNSUPPORTED_STATUSES, WAIT_STRATEGIES, PushUnsupported, iter_sse, wait_for
+from .hooks import Hooks, route_template
+from .metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import httpx
+
+    from .downloads import Downloader
+
+T = TypeVar("T")
+
+RETRY_STATUSES = {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT}
+IDEMPOTENT_METHODS = {HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS, HTTPMethod.PUT, HTTPMethod.DELETE}
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+# JSON bodies with at least this many top-level items (e.g. rows of ``data``) are encoded off the event loop.
+LARGE_JSON_ITEMS = 5000
+# Uploaded files are read in blocks of this size, so memory does not grow with the file.
+UPLOAD_BLOCK = 1024 * 1024
+
+logger = logging.getLogger(__name__)
 
 
 class Pagination(BaseModel):
@@ -11,13 +42,212 @@ class Pagination(BaseModel):
 
 
 class Lume:
-    def __init__(self, api_key: str, base_url: str = "https://api.lume.ai/"):
+    """
+    HTTP client for the Lume API.
+
+    The underlying ``httpx.AsyncClient`` (and httpx itself) is only created on
+    first use, so building a ``Lume`` is cheap. Use it as an async context
+    manager, or call ``aclose()``, to release its connections:
+
+        async with lume_py.Client(api_key) as client:
+            await client.warmup(10)
+            with lume_py.use_client(client):
+                ...
+
+    ``max_concurrency`` caps the requests in flight: a number is a fixed limit for
+    all routes, while ``AdaptiveConcurrency()`` tunes a limit per route family from
+    the observed latency and 429/503 responses, and ``PriorityLanes()`` serves
+    interactive requests ahead of bulk ones.
+
+    Blocking work on the upload paths (reading files in blocks, hashing them and
+    encoding large JSON bodies) runs on ``executor`` instead of the event loop, so
+    one large upload does not stall other requests and polls. The default is the
+    event loop's thread pool; a ``ProcessPoolExecutor`` also takes the work off the GIL.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.lume.ai/",
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        limits: Optional["httpx.Limits"] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        max_concurrency: Union[int, FixedConcurrency, AdaptiveConcurrency, PriorityLanes, None] = None,
+        collect_metrics: bool = True,
+        wait_strategy: str = "auto",
+        poll_interval: float = 0.1,
+        max_poll_interval: float = 5.0,
+        executor: Optional["Executor"] = None,
+    ):
+        if wait_strategy not in WAIT_STRATEGIES:
+            raise ValueError(f"Unknown wait strategy {wait_strategy!r}, expected one of {WAIT_STRATEGIES}")
         self.api_key = api_key
         self.base_url = base_url
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={"Content-Type": "application/json", "lume-api-key": self.api_key},
-        )
+        self.max_retries = max_retries
+        self.wait_strategy = wait_strategy
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.executor = executor
+        self.hooks = Hooks()
+        self.metrics = MetricsRegistry().attach(self.hooks) if collect_metrics else None
+        if isinstance(max_concurrency, int):
+            max_concurrency = FixedConcurrency(max_concurrency) if max_concurrency else None
+        self.concurrency = max_concurrency
+        self._transport = transport
+        self._limits = limits
+        self._timeout = timeout
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._operations = 0
+        self._drained: Optional[asyncio.Future] = None
+        self._retiring = False
+        self._reopen: Optional[Callable[[], "Lume"]] = None
+        self._closing: Optional[asyncio.Task] = None
+        self._wait_channels: Dict[str, str] = {}
+        self._waits: Dict[Any, Any] = {}
+        self._downloader: Optional["Downloader"] = None
+        self.closed = False
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """
+        The pooled ``httpx.AsyncClient``, created on first access.
+        """
+        if self._client is None:
+            import httpx
+
+            if self.closed:
+                raise RuntimeError("This Lume client has been closed.")
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"lume-api-key": self.api_key},
+                transport=self._transport,
+                limits=self._limits or httpx.Limits(
+                    max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(self._timeout) if self._timeout is not None else httpx.Timeout(5.0),
+            )
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        return self._client
+
+    @property
+    def downloader(self) -> "Downloader":
+        """
+        The ``Downloader`` for files generated by this client's calls, created on first
+        access. It has its own connection pool, so the API key is never sent with downloads.
+        """
+        if self._downloader is None:
+            from .downloads import Downloader
+
+            self._downloader = Downloader(executor=self.executor)
+        return self._downloader
+
+    @contextmanager
+    def pinned(self) -> Iterator["Lume"]:
+        """
+        Keeps the client open while the block runs, even if it is replaced in the
+        meantime; endpoint operations and ``ClientPool.use`` blocks pin their client.
+        """
+        self._operations += 1
+        try:
+            yield self
+        finally:
+            self._operations -= 1
+            if self._retiring:
+                self._close_when_idle()
+
+    def current(self) -> "Lume":
+        """
+        Returns this client, or the one that replaced it if it was retired by
+        ``set_api_key`` or evicted from a ``ClientPool``.
+        """
+        client = self
+        while client._retiring and client._reopen is not None:
+            client = client._reopen()
+        return client
+
+    def retire(self) -> None:
+        """
+        Closes the client once the operations and requests running on it finish.
+        Must be called on the event loop the client is used on.
+        """
+        self._retiring = True
+        self._close_when_idle()
+
+    def _close_when_idle(self) -> None:
+        if self._operations or self._in_flight or self._closing is not None:
+            return
+        if self._client is None:
+            self.closed = True
+        else:
+            self._closing = asyncio.get_running_loop().create_task(self.aclose())
+
+    async def offload(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs blocking ``function(*args, **kwargs)`` on the client's executor.
+        With a process pool, the function and its arguments must be picklable.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    async def __aenter__(self) -> "Lume":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting new requests, waits for the in-flight ones to finish and
+        closes the connection pool. Closing twice is a no-op.
+
+        :param timeout: Seconds to wait for in-flight requests (optional, defaults to no limit).
+            Requests still running after that fail when the pool is closed.
+        """
+        self.closed = True
+        if self._in_flight:
+            self._drained = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._drained), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Closing Lume client with %d requests still in flight", self._in_flight)
+        if self._client is not None:
+            await self._client.aclose()
+        if self._downloader is not None:
+            await self._downloader.aclose()
+
+    async def warmup(self, connections: int = MAX_KEEPALIVE_CONNECTIONS, url: str = "") -> int:
+        """
+        Opens pooled connections ahead of time so the first burst of requests
+        does not pay for connection and TLS setup.
+
+        The connections are opened by sending concurrent ``HEAD`` requests to
+        ``url``; the response status does not matter.
+
+        :param connections: The number of connections to open, capped at the
+            keep-alive limit of the pool (optional, defaults to 20).
+        :param url: The path to send the requests to (optional, defaults to the base URL).
+        :return: The number of connections that were opened.
+        """
+        import httpx
+
+        keepalive = (self._limits.max_keepalive_connections if self._limits else MAX_KEEPALIVE_CONNECTIONS)
+        if keepalive is not None:
+            connections = min(connections, keepalive)
+
+        async def touch() -> bool:
+            try:
+                await self.client.head(url)
+            except httpx.TransportError as exc:
+                logger.debug("Lume warmup request failed: %r", exc)
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(touch() for _ in range(connections))))
 
     async def request(
         self,
@@ -26,16 +256,95 @@ class Lume:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         pagination: Optional[Pagination] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        if self.closed:
+            raise RuntimeError("This Lume client has been closed.")
+        self._in_flight += 1
+        try:
+            return await self._request(method, url, params, json, pagination, files, data, headers, timeout)
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight and self._drained is not None and not self._drained.done():
+                self._drained.set_result(None)
+            if self._retiring:
+                self._close_when_idle()
+
+    async def _request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        pagination: Optional[Pagination],
+        files: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
     ) -> Dict[str, Any]:
+        import httpx
+
         if pagination:
             params = params or {}
             params.update(pagination.model_dump())
-        response = await self.client.request(method, url, params=params, json=json)
+        extensions = {} if timeout is None else {"timeout": httpx.Timeout(timeout).as_dict()}
+        content = None
+        if json is not None and json_items(json) >= LARGE_JSON_ITEMS:
+            content = await self.offload(encode_json, json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+            json = None
+        if files is not None and any(isinstance(value[1], UploadFile) for value in files.values()):
+            content, multipart_headers = multipart(files, data, self.offload)
+            headers = {**(headers or {}), **multipart_headers}
+            files = data = None
+        request = self.client.build_request(
+            method, url, params=params, json=json, content=content, files=files, data=data, headers=headers,
+            extensions=extensions,
+        )
+        hooks = self.hooks
+        method_name, url, route = str(method), str(request.url), route_template(request.url)
+        request_size = int(request.headers.get("content-length", 0))
+        attempt = 0
+        while True:
+            attempt += 1
+            request_id = hooks.next_id()
+            started = time.perf_counter()
+            hooks.emit(
+                "request_start", id=request_id, method=method_name, url=url, route=route,
+                attempt=attempt, request_size=request_size,
+            )
+            try:
+                response, queue_wait = await self._send(request, method_name, route)
+            except httpx.TransportError as exc:
+                hooks.emit(
+                    "request_end", id=request_id, method=method_name, url=url, route=route,
+                    attempt=attempt, elapsed=time.perf_counter() - started, request_size=request_size, error=repr(exc),
+                )
+                if attempt > self.max_retries or method not in IDEMPOTENT_METHODS:
+                    raise
+                await self._backoff(request_id, method, request, route, attempt, None)
+                continue
+            hooks.emit(
+                "request_end", id=request_id, method=method_name, url=url, route=route,
+                attempt=attempt, elapsed=time.perf_counter() - started - queue_wait, queue_wait=queue_wait,
+                status_code=response.status_code, request_size=request_size, response_size=len(response.content),
+            )
+            if (
+                response.status_code in RETRY_STATUSES
+                and attempt <= self.max_retries
+                and method in IDEMPOTENT_METHODS
+            ):
+                await self._backoff(request_id, method, request, route, attempt, response)
+                continue
+            break
         try:
             response.raise_for_status()
-        except HTTPStatusError as e:
+        except httpx.HTTPStatusError as e:
             status_name = HTTPStatus(response.status_code).name
-            raise HTTPStatusError(
+            raise httpx.HTTPStatusError(
                 message=(
                     f"Error response {e.response.status_code} {status_name} for URL "
                     f"{e.response.url}: {e.response.text}"
@@ -44,3 +353,271 @@ class Lume:
                 response=e.response,
             )
         return response.json()
+
+    async def _send(self, request: "httpx.Request", method: str, route: str) -> Tuple["httpx.Response", float]:
+        """
+        Sends a request once a concurrency slot is free, and reports how it went to the limiter.
+
+        :return: The response and the seconds spent waiting for the slot.
+        """
+        import httpx
+
+        if self.concurrency is None:
+            return await self.client.send(request), 0.0
+        queued = time.perf_counter()
+        await self.concurrency.acquire(method, route)
+        sent = time.perf_counter()
+        status_code, timed_out = None, False
+        try:
+            response = await self.client.send(request)
+            status_code = response.status_code
+            return response, sent - queued
+        except httpx.TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            self.concurrency.release(method, route, time.perf_counter() - sent, status_code, timed_out)
+
+    async def _backoff(
+        self,
+        request_id: int,
+        method: HTTPMethod,
+        request: "httpx.Request",
+        route: str,
+        attempt: int,
+        response: Optional["httpx.Response"],
+    ) -> None:
+        delay = min(0.5 * 2 ** (attempt - 1), 30.0)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        self.hooks.emit(
+            "retry", id=request_id, method=str(method), url=str(request.url), route=route, attempt=attempt,
+            status_code=response.status_code if response is not None else None, elapsed=delay,
+        )
+        await asyncio.sleep(delay)
+
+    async def wait(
+        self,
+        url: str,
+        response: Dict[str, Any],
+        pending: Iterable[str] = ("queued", "running"),
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Waits until the ``status`` of the resource at ``url`` leaves ``pending``,
+        over a server-sent event stream or long-poll when the server offers one
+        and by polling otherwise (see ``completion.wait_for``).
+
+        :param url: The URL reporting the status of the operation.
+        :param response: The last known response, usually the one that started the operation.
+        :param pending: The statuses that mean the operation is still in progress.
+        :param timeout: Seconds to wait (optional, defaults to no limit).
+        :return: The first response whose status is not pending.
+        :raises TimeoutError: If the operation is still pending after ``timeout`` seconds.
+        """
+        return await wait_for(self, url, response, pending, timeout)
+
+    async def events(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams the server-sent events of ``url``, yielding the JSON payload of each event.
+
+        :raises PushUnsupported: If the server does not serve an event stream at ``url``.
+        """
+        import httpx
+
+        if self.closed:
+            raise RuntimeError("This Lume client has been closed.")
+        request = self.client.build_request(
+            HTTPMethod.GET, url, headers={"Accept": "text/event-stream"},
+            extensions={"timeout": httpx.Timeout(self._timeout or 5.0, read=None).as_dict()},
+        )
+        hooks = self.hooks
+        request_id, route, started = hooks.next_id(), route_template(request.url), time.perf_counter()
+        hooks.emit("request_start", id=request_id, method="GET", url=str(request.url), route=route, attempt=1)
+        response = await self.client.send(request, stream=True)
+        try:
+            hooks.emit(
+                "request_end", id=request_id, method="GET", url=str(request.url), route=route, attempt=1,
+                elapsed=time.perf_counter() - started, status_code=response.status_code,
+            )
+            content_type = response.headers.get("content-type", "")
+            if response.status_code in UNSUPPORTED_STATUSES or (
+                response.is_success and not content_type.startswith("text/event-stream")
+            ):
+                raise PushUnsupported(url)
+            response.raise_for_status()
+            async for event in iter_sse(response.aiter_lines()):
+                yield event
+        finally:
+            await response.aclose()
+
+    async def poll(
+        self,
+        url: str,
+        response: Dict[str, Any],
+        pending: Iterable[str] = ("queued", "running"),
+    ) -> Dict[str, Any]:
+        """
+        Re-fetches ``url`` until the ``status`` of the response leaves ``pending``.
+        The delay between requests starts at ``poll_interval`` and grows by half
+        on every tick up to ``max_poll_interval``, with a little jitter so many
+        concurrent waits do not poll in lockstep.
+
+        :param url: The URL reporting the status of the operation.
+        :param response: The last known response, usually the one that started the operation.
+        :param pending: The statuses that mean the operation is still in progress.
+        :return: The first response whose status is not pending.
+        """
+        pending = set(pending)
+        started = time.perf_counter()
+        ticks = 0
+        interval = self.poll_interval
+        while response["status"] in pending:
+            ticks += 1
+            await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+            interval = min(interval * 1.5, self.max_poll_interval)
+            with lane(BULK):
+                response = await self.request(method=HTTPMethod.GET, url=url)
+            self.hooks.emit(
+                "poll_tick", url=url, route=route_template(url), attempt=ticks, status=response["status"],
+                elapsed=time.perf_counter() - started,
+            )
+        if ticks:
+            self.hooks.emit(
+                "poll_end", url=url, route=route_template(url), attempt=ticks, status=response["status"],
+                elapsed=time.perf_counter() - started,
+            )
+        return response
+
+
+Client = Lume
+
+
+class UploadFile:
+    """
+    A file to send in a multipart upload, e.g. ``files={"file": (name, UploadFile(path), mime)}``.
+    It is read in blocks on the client's executor while the request is sent, so
+    neither the event loop nor memory has to hold the whole file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+
+def read_block(path: str, offset: int, size: int) -> bytes:
+    """
+    Reads ``size`` bytes of a file from ``offset``; used to stream uploads on the client's executor.
+    """
+    with open(path, "rb") as file:
+        file.seek(offset)
+        return file.read(size)
+
+
+def multipart(
+    files: Dict[str, Any], data: Optional[Dict[str, Any]], offload: Callable[..., Any]
+) -> Tuple[AsyncIterator[bytes], Dict[str, str]]:
+    """
+    Encodes form fields and files like httpx does, as an async body that reads
+    ``UploadFile`` contents in ``UPLOAD_BLOCK`` blocks through ``offload``.
+
+    :return: The body and its ``Content-Type`` and ``Content-Length`` headers.
+    """
+    boundary = os.urandom(16).hex()
+    parts: list = []
+    for name, value in (data or {}).items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            parts.append(_part_header(boundary, name) + _form_value(item) + b"\r\n")
+    for name, (filename, body, content_type) in files.items():
+        parts.append(_part_header(boundary, name, filename, content_type))
+        parts.append(body if isinstance(body, (UploadFile, bytes)) else body.encode())
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    length = sum(part.size if isinstance(part, UploadFile) else len(part) for part in parts)
+
+    async def body() -> AsyncIterator[bytes]:
+        for part in parts:
+            if not isinstance(part, UploadFile):
+                yield part
+                continue
+            offset = 0
+            while offset < part.size:
+                block = await offload(read_block, part.path, offset, min(UPLOAD_BLOCK, part.size - offset))
+                if not block:
+                    raise ValueError(f"{part.path} shrank to {offset} bytes while it was being uploaded")
+                offset += len(block)
+                yield block
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}", "Content-Length": str(length)}
+    return body(), headers
+
+
+def _part_header(boundary: str, name: str, filename: Optional[str] = None, content_type: Optional[str] = None) -> bytes:
+    disposition = f'form-data; name="{_quote(name)}"'
+    if filename is not None:
+        disposition += f'; filename="{_quote(filename)}"'
+    header = f"--{boundary}\r\nContent-Disposition: {disposition}\r\n"
+    if content_type is not None:
+        header += f"Content-Type: {content_type}\r\n"
+    return (header + "\r\n").encode()
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _form_value(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if value is None:
+        return b""
+    if isinstance(value, bool):
+        return b"true" if value else b"false"
+    return str(value).encode()
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Encodes a JSON body the way httpx does.
+    """
+    return jsonlib.dumps(payload).encode("utf-8")
+
+
+def json_items(payload: Any) -> int:
+    """
+    Counts the top-level items of a JSON body, a cheap proxy for its encoding cost.
+    """
+    if isinstance(payload, dict):
+        return sum(len(value) if isinstance(value, (list, dict)) else 1 for value in payload.values())
+    return len(payload) if isinstance(payload, list) else 1
+
+
+def close_soon(client: Lume, reopen: Optional[Callable[[], Lume]] = None) -> None:
+    """
+    Closes a client that is being replaced without waiting for it.
+
+    Operations already running on the client keep it open until they finish;
+    it is closed as soon as none are left. With ``reopen``, models and blocks
+    still holding the client move to the client it returns on their next call.
+    The close is scheduled on the event loop the client was used on, so it also
+    works from synchronous code such as ``set_api_key``. If that loop is gone,
+    its connections already are too.
+    """
+    client._reopen = reopen
+    loop = client._loop
+    if client._client is None or loop is None or loop.is_closed():
+        client._retiring = True
+        if not client._operations:
+            client.closed = True
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        client.retire()
+    elif loop.is_running():
+        loop.call_soon_threadsafe(client.retire)
+    else:
+        client.closed = True
@@ -0,0 +1,118 @@
+"""
+Explicit client binding for models and service classes.
+
+By default every call uses ``settings.client``. A different ``Lume`` client can
+be selected for a block of code with ``use_client(client)``, or bound to a class
+or model with ``bind``:
+
+    tenant = Pipeline.bind(client)
+    pipeline = await tenant.get_pipeline_by_id("pipeline-id")
+    await pipeline.create_job(source_data)  # also uses ``client``
+
+Models remember the client that was active when they were created, so objects
+returned by a bound call keep using that client.
+"""
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar, Iterator, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+_current_client: ContextVar[Optional[Any]] = ContextVar("lume_client", default=None)
+
+
+def current_client() -> Optional[Any]:
+    """
+    Returns the client selected with ``use_client`` or ``bind`` in this context, if any.
+    """
+    return _current_client.get()
+
+
+@contextmanager
+def use_client(client) -> Iterator[Any]:
+    """
+    Routes every SDK call made inside the block, in this task, through ``client``.
+
+    :param client: The ``Lume`` client to use.
+    """
+    token = _current_client.set(client)
+    try:
+        yield client
+    finally:
+        _current_client.reset(token)
+
+
+class BoundEndpoint:
+    """
+    A class whose methods and constructor run with a specific client.
+    """
+
+    def __init__(self, target: type, client):
+        self._target = target
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(value):
+            if inspect.isfunction(value) or inspect.ismethod(value):
+                # e.g. ``Excel.track_pivot_tasks``, which resolves its client when called.
+                @functools.wraps(value)
+                def call_sync(*args: Any, **kwargs: Any) -> Any:
+                    with use_client(self.client):
+                        return value(*args, **kwargs)
+
+                return call_sync
+            return value
+
+        @functools.wraps(value)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            with use_client(self.client):
+                return await value(*args, **kwargs)
+
+        return call
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        with use_client(self.client):
+            return self._target(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self._target.__name__}.bind({self.client!r})"
+
+
+class _Bind:
+    """
+    ``Model.bind(client)`` returns a ``BoundEndpoint``; ``model.bind(client)`` binds the instance.
+    """
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return functools.partial(BoundEndpoint, owner)
+        return functools.partial(_bind_instance, instance)
+
+
+def _bind_instance(instance: "BoundModel", client) -> "BoundModel":
+    instance._client = client
+    return instance
+
+
+class BoundModel(BaseModel):
+    """
+    Base class for SDK models that remember the client they were created with.
+    """
+
+    _client: Optional[Any] = PrivateAttr(default=None)
+    bind: ClassVar[_Bind] = _Bind()
+
+    def model_post_init(self, __context: Any) -> None:
+        if self._client is None:
+            self._client = _current_client.get()
+
+
+class Bindable:
+    """
+    Mixin giving plain service classes such as ``PDF`` a ``bind(client)`` classmethod.
+    """
+
+    bind: ClassVar[_Bind] = _Bind()
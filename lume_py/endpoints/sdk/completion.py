@@ -0,0 +1,183 @@
+"""
+Waiting for asynchronous operations (job runs, workshop runs, pipeline runs) to finish.
+
+``wait_for`` uses the fastest completion channel the server offers for a status
+URL such as ``results/{id}``:
+
+* a server-sent event stream at ``{url}/events`` that pushes the resource every
+  time its status changes,
+* a long-poll at ``{url}/wait?status=...&timeout=...`` that answers as soon as
+  the status differs from the one given, or after ``timeout`` seconds,
+* otherwise polling ``url`` with exponential backoff.
+
+Which channel a route supports is probed once and remembered per client.
+Concurrent waits on the same URL share a single stream or poller.
+"""
+import asyncio
+import json
+import logging
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .hooks import route_template
+from .lanes import BULK, lane
+
+if TYPE_CHECKING:
+    from .api_client import Lume
+
+logger = logging.getLogger(__name__)
+
+WAIT_STRATEGIES = ("auto", "sse", "long-poll", "poll")
+
+# Seconds the server is asked to hold a long-poll request open.
+LONG_POLL_SECONDS = 30.0
+
+# Statuses answered by servers that do not offer a push channel for a route.
+UNSUPPORTED_STATUSES = {
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.METHOD_NOT_ALLOWED,
+    HTTPStatus.NOT_ACCEPTABLE,
+    HTTPStatus.NOT_IMPLEMENTED,
+}
+
+
+class PushUnsupported(Exception):
+    """
+    Raised when the server does not offer a push channel for a route.
+    """
+
+
+@dataclass
+class _SharedWait:
+    task: asyncio.Task
+    waiters: int = field(default=0)
+
+
+async def wait_for(
+    client: "Lume",
+    url: str,
+    response: Dict[str, Any],
+    pending: Iterable[str] = ("queued", "running"),
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Waits until the ``status`` of the resource at ``url`` leaves ``pending``.
+
+    :param client: The client to send the requests with.
+    :param url: The URL reporting the status of the operation.
+    :param response: The last known response, usually the one that started the operation.
+    :param pending: The statuses that mean the operation is still in progress.
+    :param timeout: Seconds to wait (optional, defaults to no limit).
+    :return: The first response whose status is not pending.
+    :raises TimeoutError: If the operation is still pending after ``timeout`` seconds.
+    """
+    pending = frozenset(pending)
+    if response.get("status") not in pending:
+        return response
+    key = (url, pending)
+    shared = client._waits.get(key)
+    if shared is None or shared.task.done() or shared.task.get_loop() is not asyncio.get_running_loop():
+        with lane(BULK):  # Status checks must not hold up interactive requests.
+            shared = _SharedWait(asyncio.ensure_future(_wait(client, url, response, pending)))
+        client._waits[key] = shared
+        shared.task.add_done_callback(lambda task: _forget(client, key, task))
+    shared.waiters += 1
+    try:
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(shared.task)
+    finally:
+        shared.waiters -= 1
+        if not shared.waiters and not shared.task.done():
+            # Nobody is waiting any more, e.g. after a timeout or cancellation.
+            shared.task.cancel()
+
+
+def _forget(client: "Lume", key: Tuple[str, FrozenSet[str]], task: asyncio.Task) -> None:
+    shared = client._waits.get(key)
+    if shared is not None and shared.task is task:
+        del client._waits[key]
+    if not task.cancelled():
+        task.exception()  # Retrieved by the waiters; silences "never retrieved" warnings.
+
+
+async def _wait(client: "Lume", url: str, response: Dict[str, Any], pending: FrozenSet[str]) -> Dict[str, Any]:
+    route = route_template(url)
+    strategy = client.wait_strategy
+    if strategy == "auto":
+        strategy = client._wait_channels.get(route, "auto")
+    if strategy == "auto":
+        candidates = ("sse", "long-poll")
+    elif strategy == "poll":
+        candidates = ()
+    else:
+        candidates = (strategy,)
+    for candidate in candidates:
+        channel = _sse if candidate == "sse" else _long_poll
+        try:
+            response = await channel(client, url, response, pending)
+        except PushUnsupported:
+            logger.debug("No %s completion channel for %s", candidate, route)
+            continue
+        except Exception as exc:
+            # A broken push channel must not fail the wait; polling picks up from here.
+            logger.debug("%s completion channel for %s failed: %r", candidate, route, exc)
+            break
+        client._wait_channels[route] = candidate
+        return response
+    else:
+        if strategy == "auto":
+            client._wait_channels[route] = "poll"
+    return await client.poll(url, response, pending)
+
+
+async def _long_poll(client: "Lume", url: str, response: Dict[str, Any], pending: FrozenSet[str]) -> Dict[str, Any]:
+    from httpx import HTTPStatusError
+
+    while response["status"] in pending:
+        try:
+            response = await client.request(
+                method=HTTPMethod.GET,
+                url=f"{url}/wait",
+                params={"status": response["status"], "timeout": LONG_POLL_SECONDS},
+                timeout=LONG_POLL_SECONDS + 10.0,
+            )
+        except HTTPStatusError as exc:
+            if exc.response.status_code in UNSUPPORTED_STATUSES:
+                raise PushUnsupported(url) from exc
+            raise
+    return response
+
+
+async def _sse(client: "Lume", url: str, response: Dict[str, Any], pending: FrozenSet[str]) -> Dict[str, Any]:
+    while response["status"] in pending:
+        # The stream may end before the operation does, e.g. when a proxy cuts it; reconnect then.
+        received = False
+        async with aclosing(client.events(f"{url}/events")) as events:
+            async for event in events:
+                response, received = event, True
+                if response["status"] not in pending:
+                    break
+        if not received:
+            raise ConnectionError(f"Event stream {url}/events closed without sending an event")
+    return response
+
+
+async def iter_sse(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Parses a ``text/event-stream`` body into the JSON payloads of its ``data`` fields.
+    Comments, ``event``, ``id`` and ``retry`` fields are ignored.
+    """
+    data = []
+    async for line in lines:
+        if not line:
+            if data:
+                yield json.loads("\n".join(data))
+                data = []
+            continue
+        name, _, value = line.partition(":")
+        if name == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield json.loads("\n".join(data))
@@ -0,0 +1,172 @@
+"""
+Concurrency limits for requests sent by a ``Lume`` client.
+
+``FixedConcurrency`` caps the requests in flight at a constant number.
+``AdaptiveConcurrency`` finds the limit per route family from what the API
+does (additive increase, multiplicative decrease):
+
+- While latency stays near the lowest seen for the family and the limit is
+  actually being used, the limit grows by about one per round trip.
+- When latency rises past ``tolerance`` times that baseline, the limit shrinks
+  by ``latency_decrease``.
+- A 429 or 503 response, or a timeout, cuts it by ``overload_decrease``.
+
+Each family is cut at most once per round trip, so one burst of slow or rejected
+requests counts as a single signal.
+"""
+import asyncio
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Any, Callable, Deque, Dict, Optional
+
+OVERLOAD_STATUSES = {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
+
+
+def route_family(method: str, route: str) -> str:
+    """
+    The default family of a request: its method and route template, e.g. ``"GET results/{id}"``.
+    """
+    return f"{method} {route}"
+
+
+class FixedConcurrency:
+    """
+    Allows at most ``limit`` requests in flight across all routes.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be at least 1.")
+        self.limit = limit
+        self._slots = asyncio.Semaphore(limit)
+
+    async def acquire(self, method: str, route: str) -> None:
+        await self._slots.acquire()
+
+    def release(self, method: str, route: str, elapsed: float, status_code: Optional[int], timed_out: bool = False) -> None:
+        self._slots.release()
+
+
+class _Family:
+    """
+    The adaptive limit and the waiting requests of one route family.
+    """
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.cooldown_until = 0.0
+        self.waiters: Deque[asyncio.Future] = deque()
+
+    def wake(self) -> None:
+        while self.waiters and self.in_flight < int(self.limit):
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdaptiveConcurrency:
+    """
+    Adapts the number of requests in flight per route family to the latency and
+    overload responses the API returns.
+
+        client = Lume(api_key, max_concurrency=AdaptiveConcurrency(initial=10, maximum=100))
+        client.concurrency.limits()  # {"GET results/{id}": 23.4, ...}
+
+    :param initial: The limit each family starts with (optional, defaults to 10).
+    :param minimum: The lowest limit (optional, defaults to 1).
+    :param maximum: The highest limit (optional, defaults to 100, the connection pool size).
+    :param tolerance: How far latency may rise above the family's baseline before the
+        limit shrinks (optional, defaults to 2.0, i.e. twice the baseline).
+    :param latency_decrease: The factor the limit is multiplied by when latency rises (optional, defaults to 0.9).
+    :param overload_decrease: The factor the limit is multiplied by on a 429/503 or timeout (optional, defaults to 0.5).
+    :param family: Maps ``(method, route template)`` to a family name (optional, defaults to ``route_family``).
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 100,
+        tolerance: float = 2.0,
+        latency_decrease: float = 0.9,
+        overload_decrease: float = 0.5,
+        family: Callable[[str, str], str] = route_family,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum.")
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.latency_decrease = latency_decrease
+        self.overload_decrease = overload_decrease
+        self.family = family
+        self._families: Dict[str, _Family] = {}
+
+    def limits(self) -> Dict[str, float]:
+        """
+        Returns the current limit of every family seen so far.
+        """
+        return {name: family.limit for name, family in sorted(self._families.items())}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the limit, requests in flight, queued requests and baseline latency per family.
+        """
+        return {
+            name: {"limit": family.limit, "in_flight": family.in_flight, "queued": len(family.waiters), "baseline": family.baseline}
+            for name, family in sorted(self._families.items())
+        }
+
+    def _get(self, method: str, route: str) -> _Family:
+        name = self.family(method, route)
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(float(self.initial))
+        return family
+
+    async def acquire(self, method: str, route: str) -> None:
+        family = self._get(method, route)
+        if family.in_flight < int(family.limit) and not family.waiters:
+            family.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        family.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                family.in_flight -= 1  # The slot was handed over just as the request was cancelled.
+                family.wake()
+            elif waiter in family.waiters:
+                family.waiters.remove(waiter)
+            raise
+
+    def release(self, method: str, route: str, elapsed: float, status_code: Optional[int], timed_out: bool = False) -> None:
+        family = self._get(method, route)
+        saturated = family.in_flight >= family.limit / 2
+        family.in_flight -= 1
+        now = time.monotonic()
+        if timed_out or status_code in OVERLOAD_STATUSES:
+            self._decrease(family, self.overload_decrease, now, elapsed)
+        elif status_code is not None and status_code < 500:
+            if family.baseline is None or elapsed < family.baseline:
+                family.baseline = elapsed
+            else:
+                # Drift upwards slowly so a server that became slower for good sets a new baseline.
+                family.baseline += (elapsed - family.baseline) * 0.01
+            if elapsed > family.baseline * self.tolerance:
+                self._decrease(family, self.latency_decrease, now, elapsed)
+            elif saturated:
+                family.limit = min(float(self.maximum), family.limit + 1 / family.limit)
+        family.wake()
+
+    def _decrease(self, family: _Family, factor: float, now: float, elapsed: float) -> None:
+        if now < family.cooldown_until:
+            return
+        family.limit = max(float(self.minimum), family.limit * factor)
+        family.cooldown_until = now + elapsed
@@ -0,0 +1,308 @@
+"""
+Parallel, resumable downloads of generated files (PDF and pivot outputs).
+
+    downloader = get_client().downloader
+    download = await downloader.download(await PDF.get_pdf_url(pdf_id), "order.pdf")
+
+Files are fetched in HTTP range chunks over several connections and written
+straight to a ``.part`` file next to the destination, so memory stays at one
+read buffer per connection. The chunks already on disk are recorded in a
+``.part.json`` file; an interrupted download resumes from there. Servers that
+do not support ranges are streamed in one piece.
+
+Downloads use their own connection pool without the API key, since the URLs
+are presigned links to storage outside the Lume API.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from .handles import gather
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 8 * 1024 * 1024
+READ_SIZE = 64 * 1024
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_CONTENT_RANGE = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+class Download(BaseModel):
+    """
+    A finished download.
+    """
+    url: str
+    path: str
+    size: int
+    chunks: int = 1
+    resumed_chunks: int = 0
+    retries: int = 0
+    skipped: bool = False
+    seconds: float = 0.0
+
+
+class _RetryableStatus(Exception):
+    pass
+
+
+class Downloader:
+    """
+    Downloads files in parallel range chunks, with resume and verification.
+
+    :param chunk_size: Bytes per range request (optional, defaults to 8 MiB).
+    :param connections: Range requests in flight per file (optional, defaults to 4).
+    :param max_retries: Retries per chunk after a network error or a 429/5xx
+        response (optional, defaults to 3). A retried chunk continues from the last byte written.
+    :param max_connections: The size of the connection pool shared by every download
+        (optional, defaults to 32).
+    :param timeout: Seconds without progress before a request fails (optional, defaults to 60).
+    :param transport: An httpx transport, e.g. for tests (optional).
+    :param executor: Where checksums are computed (optional, defaults to the event loop's thread pool).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        connections: int = 4,
+        max_retries: int = 3,
+        max_connections: int = 32,
+        timeout: float = 60.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        executor: Optional["Executor"] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1 byte.")
+        self.chunk_size = chunk_size
+        self.connections = connections
+        self.max_retries = max_retries
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._transport = transport
+        self.executor = executor
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                timeout=httpx.Timeout(self.timeout),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "Downloader":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def download(
+        self, url: str, path: str, size: Optional[int] = None, checksum: Optional[str] = None
+    ) -> Download:
+        """
+        Downloads ``url`` to ``path``. An existing complete file is kept and a
+        partial one from an interrupted call is resumed.
+
+        :param url: The URL to download, e.g. from ``PDF.get_pdf_url``.
+        :param path: The destination file.
+        :param size: The expected size in bytes (optional).
+        :param checksum: The expected digest as ``"<algorithm>:<hex>"``, e.g. ``"sha256:9f86..."`` (optional).
+        :return: What was transferred.
+        :raises ValueError: If the size or checksum of the downloaded file does not match.
+        :raises httpx.HTTPStatusError: If the server refuses the download.
+        """
+        started = time.perf_counter()
+        part, state_path = f"{path}.part", f"{path}.part.json"
+        if size is not None and os.path.exists(path) and not os.path.exists(part) and os.path.getsize(path) == size:
+            if checksum is None or await self._digest(path, checksum) == checksum:
+                return Download(url=url, path=path, size=size, chunks=0, skipped=True)
+
+        total, etag, download = await self._probe(url, part)
+        if download is None:
+            state = _load_state(state_path)
+            if state is None or state.get("size") != total or state.get("etag") != etag or state.get("chunk_size") != self.chunk_size:
+                state = {"size": total, "etag": etag, "chunk_size": self.chunk_size, "done": []}
+                with open(part, "wb") as file:
+                    file.truncate(total)
+            download = await self._download_chunks(url, part, state, state_path)
+        download.url, download.path = url, path
+
+        actual = os.path.getsize(part)
+        if (size is not None and actual != size) or (total is not None and actual != total):
+            _discard(part, state_path)
+            raise ValueError(f"Downloaded {actual} bytes from {url}, expected {size if size is not None else total}")
+        if checksum is not None:
+            digest = await self._digest(part, checksum)
+            if digest != checksum:
+                _discard(part, state_path)
+                raise ValueError(f"Checksum mismatch for {url}: expected {checksum}, got {digest}")
+        os.replace(part, path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        download.seconds = time.perf_counter() - started
+        return download
+
+    async def download_many(
+        self, downloads: Iterable[Tuple[str, str]], max_concurrency: int = 8, timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Downloads many ``(url, path)`` pairs concurrently.
+
+        :param downloads: The URLs and their destination files.
+        :param max_concurrency: Files downloaded at once (optional, defaults to 8).
+        :param timeout: Seconds to wait for all of them (optional, defaults to no limit).
+        :return: One ``Download``, or the exception it failed with, per pair in input order.
+        """
+        return await gather(
+            [lambda url=url, path=path: self.download(url, path) for url, path in downloads],
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _digest(self, path: str, checksum: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _digest, path, checksum)
+
+    async def _probe(self, url: str, part: str) -> Tuple[Optional[int], Optional[str], Optional[Download]]:
+        # A one-byte range GET rather than HEAD: presigned URLs are usually signed for GET only.
+        async with self.client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+            if response.status_code == 206:
+                match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+                if match:
+                    await response.aread()
+                    return int(match.group(1)), response.headers.get("ETag"), None
+                # A partial reply without a known total, e.g. "bytes 0-0/*", cannot be split
+                # into chunks, and its body is only the probed byte: fetch the file in one piece.
+            elif response.status_code == 416 and response.headers.get("Content-Range") == "bytes */0":
+                open(part, "wb").close()  # An empty file has no byte 0 to ask for.
+                return None, None, Download(url=url, path=part, size=0, chunks=0)
+            else:
+                response.raise_for_status()
+                # No range support: this response is the whole file.
+                return None, None, await self._save_whole(url, part, response)
+        async with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+            return None, None, await self._save_whole(url, part, response)
+
+    async def _save_whole(self, url: str, part: str, response: "httpx.Response") -> Download:
+        with open(part, "wb") as file:
+            async for data in response.aiter_bytes(READ_SIZE):
+                file.write(data)
+        return Download(url=url, path=part, size=os.path.getsize(part))
+
+    async def _download_chunks(self, url: str, part: str, state: Dict[str, Any], state_path: str) -> Download:
+        total = state["size"]
+        ranges = [(start, min(start + self.chunk_size, total) - 1) for start in range(0, total, self.chunk_size)]
+        done: Set[int] = set(state["done"])
+        download = Download(url=url, path=part, size=total, chunks=len(ranges), resumed_chunks=len(done))
+        budget = asyncio.Semaphore(self.connections)
+        failed = asyncio.Event()
+
+        async def fetch(index: int, start: int, end: int) -> None:
+            async with budget:
+                if failed.is_set():
+                    return  # Leave the remaining chunks for a resumed call.
+                try:
+                    retries = await self._fetch_range(url, part, start, end)
+                except BaseException:
+                    failed.set()
+                    raise
+            download.retries += retries
+            done.add(index)
+            state["done"] = sorted(done)
+            _save_state(state_path, state)
+
+        tasks = [
+            asyncio.ensure_future(fetch(index, start, end))
+            for index, (start, end) in enumerate(ranges)
+            if index not in done
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return download
+
+    async def _fetch_range(self, url: str, part: str, start: int, end: int) -> int:
+        import httpx
+
+        attempt = 0
+        position = start
+        while True:
+            try:
+                async with self.client.stream("GET", url, headers={"Range": f"bytes={position}-{end}"}) as response:
+                    if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                        raise _RetryableStatus(f"status {response.status_code}")
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise ValueError(f"{url} ignored the range request after announcing range support")
+                    with open(part, "r+b") as file:
+                        file.seek(position)
+                        async for data in response.aiter_bytes(READ_SIZE):
+                            file.write(data[: end + 1 - position])
+                            position += len(data)
+                    if position <= end:
+                        raise httpx.ReadError(f"Connection closed at byte {position} of {start}-{end}", request=response.request)
+                return attempt
+            except (httpx.TransportError, _RetryableStatus) as exc:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                delay = min(0.1 * 2 ** (attempt - 1), 5.0) * random.uniform(0.5, 1.0)
+                logger.debug("Retrying bytes %d-%d of %s in %.2fs: %s", position, end, url, delay, exc)
+                await asyncio.sleep(delay)
+
+
+def _digest(path: str, checksum: str) -> str:
+    algorithm = checksum.split(":", 1)[0]
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as file:
+        while data := file.read(1024 * 1024):
+            digest.update(data)
+    return f"{algorithm}:{digest.hexdigest()}"
+
+
+def _load_state(state_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(state_path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_state(state_path: str, state: Dict[str, Any]) -> None:
+    temporary = f"{state_path}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(state, file)
+    os.replace(temporary, state_path)
+
+
+def _discard(part: str, state_path: str) -> None:
+    for leftover in (part, state_path):
+        if os.path.exists(leftover):
+            os.remove(leftover)
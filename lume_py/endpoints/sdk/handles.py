@@ -0,0 +1,230 @@
+"""
+Futures-style handles for operations that run in the background.
+
+    handle = await job.submit()
+    handle.add_done_callback(lambda h: print(h.result().status))
+    result = await handle.wait(timeout=600)
+
+``as_completed`` yields many handles in the order they finish and ``gather``
+collects their results. Both accept any mix of SDK operations and apply an
+optional concurrency budget:
+
+    budget = asyncio.Semaphore(20)  # shared by every call that is given it
+    results = await gather(
+        [workshop.run_sample(sample) for sample in samples]
+        + [pipeline.run_pipeline(rows) for rows in batches]
+        + [functools.partial(PDF.extract_pdf, path) for path in pdfs],
+        max_concurrency=budget,
+    )
+"""
+import asyncio
+import inspect
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Generator, Generic, Iterable, List, Optional, TypeVar, Union
+
+from .hooks import detached_context
+
+T = TypeVar("T")
+
+# An operation is an awaitable, or a callable returning one so that it is only
+# created once the concurrency budget lets it start.
+Operation = Union["Handle[Any]", Awaitable[Any], Callable[[], Awaitable[Any]]]
+
+
+class Handle(Generic[T]):
+    """
+    A handle on an operation running as an asyncio task.
+
+    Waiting with a timeout never cancels the operation; ``cancel()`` does, and
+    stops its polling and requests right away.
+
+    :param awaitable: The operation to run.
+    :param name: A label for the operation, used in ``repr`` (optional).
+    """
+
+    def __init__(self, awaitable: Awaitable[T], name: Optional[str] = None):
+        self.name = name
+        self.index: Optional[int] = None
+        if isinstance(awaitable, asyncio.Future):
+            self._task = awaitable
+        else:
+            # Run outside the caller's operation so the task reports its own events.
+            self._task = asyncio.get_running_loop().create_task(_run(awaitable), context=detached_context())
+
+    @property
+    def task(self) -> "asyncio.Future[T]":
+        return self._task
+
+    def done(self) -> bool:
+        """
+        Returns True when the operation finished, failed or was cancelled.
+        """
+        return self._task.done()
+
+    def cancelled(self) -> bool:
+        return self._task.cancelled()
+
+    def cancel(self, msg: Optional[Any] = None) -> bool:
+        """
+        Cancels the operation.
+
+        :return: False if it had already finished, True otherwise.
+        """
+        return self._task.cancel(msg)
+
+    def result(self) -> T:
+        """
+        Returns the result of a finished operation, or raises its exception.
+
+        :raises asyncio.InvalidStateError: If the operation has not finished yet.
+        :raises asyncio.CancelledError: If the operation was cancelled.
+        """
+        return self._task.result()
+
+    def exception(self) -> Optional[BaseException]:
+        return self._task.exception()
+
+    async def wait(self, timeout: Optional[float] = None) -> T:
+        """
+        Waits for the operation to finish.
+
+        :param timeout: Seconds to wait (optional, defaults to no limit).
+        :return: The result of the operation.
+        :raises TimeoutError: If it is still running after ``timeout`` seconds; it keeps running.
+        """
+        return await asyncio.wait_for(asyncio.shield(self._task), timeout)
+
+    def add_done_callback(self, callback: Callable[["Handle[T]"], Any]) -> None:
+        """
+        Calls ``callback(handle)`` once the operation is done, including when it
+        failed or was cancelled. Callbacks added after that are called soon.
+        """
+        self._task.add_done_callback(lambda _: callback(self))
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.wait().__await__()
+
+    def __repr__(self) -> str:
+        if not self._task.done():
+            state = "pending"
+        elif self._task.cancelled():
+            state = "cancelled"
+        else:
+            state = "failed" if self._task.exception() else "finished"
+        return f"<Handle {self.name or self._task.get_name()} {state}>"
+
+
+async def _run(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _start(operation: Operation, budget: Optional[asyncio.Semaphore]) -> Any:
+    if budget is None:
+        return await (operation() if callable(operation) else operation)
+    try:
+        await budget.acquire()
+    except BaseException:
+        if inspect.iscoroutine(operation):
+            operation.close()  # Cancelled before it started; avoids "never awaited" warnings.
+        raise
+    try:
+        return await (operation() if callable(operation) else operation)
+    finally:
+        budget.release()
+
+
+def _handles(operations: Iterable[Operation], max_concurrency: Union[int, asyncio.Semaphore, None]) -> List[Handle[Any]]:
+    if isinstance(max_concurrency, int) and max_concurrency < 1:
+        for operation in operations:
+            if inspect.iscoroutine(operation):
+                operation.close()  # Never started; avoids "never awaited" warnings.
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+    budget = asyncio.Semaphore(max_concurrency) if isinstance(max_concurrency, int) else max_concurrency
+    handles = []
+    for index, operation in enumerate(operations):
+        handle = operation if isinstance(operation, Handle) else Handle(_start(operation, budget))
+        handle.index = index
+        handles.append(handle)
+    return handles
+
+
+async def as_completed(
+    operations: Iterable[Operation],
+    timeout: Optional[float] = None,
+    max_concurrency: Union[int, asyncio.Semaphore, None] = None,
+) -> AsyncIterator[Handle[Any]]:
+    """
+    Yields handles as their operations finish, whether they succeeded, failed
+    or were cancelled. Each handle's ``index`` is its position in ``operations``.
+
+        async for handle in as_completed(handles, timeout=600):
+            if handle.exception() is None:
+                print(handle.result().status)
+
+    :param operations: Handles, awaitables, or callables returning awaitables.
+    :param timeout: Seconds to wait for all of them (optional, defaults to no limit).
+    :param max_concurrency: The number of operations allowed to run at once, or a
+        semaphore shared with other calls as a global budget (optional, defaults to no limit).
+        Handles that are already running are not limited.
+    :raises TimeoutError: If operations are still running after ``timeout`` seconds;
+        they keep running. Operations started from awaitables are cancelled if the
+        caller stops iterating early instead.
+    :raises ValueError: If ``max_concurrency`` is a number below 1.
+    """
+    operations = list(operations)
+    handles = _handles(operations, max_concurrency)
+    by_task = {handle.task: handle for handle in handles}
+    pending = set(by_task)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while pending:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            finished, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not finished:
+                raise TimeoutError(f"{len(pending)} operations still running after {timeout} seconds")
+            for task in finished:
+                yield by_task[task]
+    except GeneratorExit:
+        # The caller stopped iterating: cancel the operations started here, not the handles passed in.
+        for operation, handle in zip(operations, handles):
+            if operation is not handle:
+                handle.cancel()
+        raise
+
+
+async def gather(
+    operations: Iterable[Operation],
+    timeout: Optional[float] = None,
+    max_concurrency: Union[int, asyncio.Semaphore, None] = None,
+) -> List[Any]:
+    """
+    Runs operations concurrently and returns their results in input order.
+
+    A failed operation does not affect the others: its exception takes the
+    place of its result. Operations still running after ``timeout`` are cancelled
+    and get a ``TimeoutError`` in their place.
+
+    :param operations: Handles, awaitables, or callables returning awaitables.
+    :param timeout: Seconds to wait for all of them (optional, defaults to no limit).
+    :param max_concurrency: The number of operations allowed to run at once, or a
+        semaphore shared with other calls as a global budget (optional, defaults to no limit).
+    :return: One result or exception per operation.
+    :raises ValueError: If ``max_concurrency`` is a number below 1.
+    """
+    handles = _handles(operations, max_concurrency)
+    if not handles:
+        return []
+    _, pending = await asyncio.wait([handle.task for handle in handles], timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    results = []
+    for handle in handles:
+        if handle.task in pending:
+            results.append(TimeoutError(f"Operation still running after {timeout} seconds"))
+        elif handle.cancelled():
+            results.append(asyncio.CancelledError())
+        else:
+            results.append(handle.exception() or handle.result())
+    return results
@@ -0,0 +1,203 @@
+import functools
+import itertools
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from .binding import BoundModel, current_client, use_client
+from .lanes import operation_lane
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = (
+    "request_start",
+    "request_end",
+    "retry",
+    "poll_tick",
+    "poll_end",
+    "cache_hit",
+    "cache_miss",
+    "operation_start",
+    "operation_end",
+)
+
+# Path segments that are followed by an identifier, and segments that look like
+# identifiers but are fixed parts of a route.
+_COLLECTIONS = {"pipelines", "pipeline", "jobs", "results", "workshops", "mappings", "target_schemas", "adv", "orders", "pivot"}
+_FIXED = {"populate", "upload", "generate", "sheets", "convert"}
+
+_operation: ContextVar[Optional["Event"]] = ContextVar("lume_operation", default=None)
+
+
+class Event(BaseModel):
+    """
+    A single instrumentation event emitted by the client.
+
+    ``id`` correlates the start and end events of one request or operation.
+    Fields that do not apply to an event type are left as ``None``.
+    """
+    type: str
+    id: int
+    time: float
+    operation: Optional[str] = None
+    method: Optional[str] = None
+    url: Optional[str] = None
+    route: Optional[str] = None
+    status: Optional[str] = None
+    status_code: Optional[int] = None
+    elapsed: Optional[float] = None
+    queue_wait: Optional[float] = None
+    request_size: Optional[int] = None
+    response_size: Optional[int] = None
+    attempt: Optional[int] = None
+    key: Optional[str] = None
+    error: Optional[str] = None
+
+
+def route_template(url: str) -> str:
+    """
+    Turns a request URL into its route template, e.g. ``results/abc/spec`` into ``results/{id}/spec``.
+    """
+    segments = [segment for segment in urlsplit(str(url)).path.split("/") if segment]
+    template = []
+    for index, segment in enumerate(segments):
+        if index and segments[index - 1] in _COLLECTIONS and segment not in _FIXED:
+            template.append("{id}")
+        else:
+            template.append(segment)
+    return "/".join(template)
+
+
+def current_operation() -> Optional[str]:
+    """
+    Returns the name of the endpoint method currently running in this task, if any.
+    """
+    operation = _operation.get()
+    return operation.operation if operation else None
+
+
+def detached_context() -> Context:
+    """
+    Returns a copy of the current context outside of any operation, for tasks
+    that outlive the operation that started them. The selected client is kept.
+    """
+    context = copy_context()
+    context.run(_operation.set, None)
+    return context
+
+
+class Hooks:
+    """
+    Registry of instrumentation callbacks for a ``Lume`` client.
+
+    Callbacks are plain callables receiving an ``Event``. They run inline on the
+    request path, so they should be cheap; exceptions raised by a callback are
+    logged and never interrupt the request.
+    """
+
+    def __init__(self):
+        self._callbacks: Dict[str, List[Callable[[Event], Any]]] = defaultdict(list)
+        self._ids = itertools.count(1)
+
+    def on(self, event_type: str, callback: Optional[Callable[[Event], Any]] = None):
+        """
+        Registers a callback for an event type, or for every event with ``"*"``.
+        Can be used as a decorator when ``callback`` is omitted.
+
+        :param event_type: One of ``EVENT_TYPES`` or ``"*"``.
+        :param callback: The callable to invoke with each matching ``Event``.
+        :return: The callback.
+        :raises ValueError: If the event type is unknown.
+        """
+        if event_type != "*" and event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type {event_type!r}, expected one of {EVENT_TYPES}")
+        if callback is None:
+            return functools.partial(self.on, event_type)
+        self._callbacks[event_type].append(callback)
+        return callback
+
+    def off(self, event_type: str, callback: Callable[[Event], Any]) -> None:
+        """
+        Removes a previously registered callback.
+        """
+        if callback in self._callbacks.get(event_type, []):
+            self._callbacks[event_type].remove(callback)
+
+    def active(self, event_type: str) -> bool:
+        return bool(self._callbacks.get(event_type) or self._callbacks.get("*"))
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def emit(self, event_type: str, id: Optional[int] = None, **fields: Any) -> Optional[Event]:
+        """
+        Builds an event and passes it to the registered callbacks.
+
+        :return: The event, or ``None`` when nobody is listening.
+        """
+        if not self.active(event_type):
+            return None
+        fields.setdefault("operation", current_operation())
+        event = Event(type=event_type, id=id if id is not None else self.next_id(), time=time.time(), **fields)
+        for callback in [*self._callbacks.get(event_type, []), *self._callbacks.get("*", [])]:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Lume hook %r failed on %s", callback, event_type)
+        return event
+
+    @asynccontextmanager
+    async def operation(self, name: str) -> AsyncIterator[None]:
+        """
+        Marks the enclosed block as one endpoint operation, e.g. ``Job.run``.
+        Requests made inside the block carry the operation name.
+        """
+        if _operation.get() is not None:
+            # Nested endpoint calls are reported as part of the outer operation.
+            yield
+            return
+        operation_id = self.next_id()
+        started = time.perf_counter()
+        token = _operation.set(Event(type="operation_start", id=operation_id, time=time.time(), operation=name))
+        self.emit("operation_start", id=operation_id, operation=name)
+        error = None
+        try:
+            yield
+        except BaseException as exc:
+            error = repr(exc)
+            raise
+        finally:
+            self.emit("operation_end", id=operation_id, operation=name, elapsed=time.perf_counter() - started, error=error)
+            _operation.reset(token)
+
+
+def instrumented(name: str):
+    """
+    Decorates an async endpoint method so its requests are grouped under ``name``.
+
+    The method runs with the client bound to its model instance, if any, so every
+    request and every model it creates use that client. The client is pinned for
+    the whole method, so replacing it meanwhile does not close it under the method.
+    Bulk methods such as ``get_all_*`` send their requests in the bulk lane.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            from lume_py.endpoints.config import get_settings
+
+            bound = args[0]._client if args and isinstance(args[0], BoundModel) else None
+            client = bound or current_client() or get_settings().client
+            if client is None:
+                return await func(*args, **kwargs)
+            client = client.current()
+            with client.pinned(), use_client(client), operation_lane(name):
+                async with client.hooks.operation(name):
+                    return await func(*args, **kwargs)
+        return wrapper
+    return decorator
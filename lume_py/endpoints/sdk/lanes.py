@@ -0,0 +1,138 @@
+"""
+Priority lanes for the requests of a ``Lume`` client.
+
+Every request runs in a lane. Listing everything (``get_all_*``), refreshing local
+indexes and polling for completion run in the ``bulk`` lane; everything else runs
+in the ``interactive`` lane unless a ``lane`` block says otherwise:
+
+    with lane(BULK):
+        await gather([Job.create(pipeline_id, rows) for rows in batches])
+
+With ``PriorityLanes`` as the client's ``max_concurrency``, waiting interactive
+requests are sent before waiting bulk ones, and some slots are reserved for them,
+so a batch job cannot hold every connection.
+"""
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+LANES = (INTERACTIVE, BULK)
+# Endpoint methods whose requests go to the bulk lane, besides every ``get_all_*``.
+BULK_OPERATIONS = {"Mirror.refresh", "TriageIndex.refresh", "TargetRegistry.refresh", "TargetRegistry.get_many", "Result.get_failed"}
+
+_lane: ContextVar[Optional[str]] = ContextVar("lume_lane", default=None)
+
+
+@contextmanager
+def lane(name: str) -> Iterator[None]:
+    """
+    Sends the requests made inside the block, including those of tasks started in it, in lane ``name``.
+    """
+    token = _lane.set(name)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_lane() -> str:
+    """
+    Returns the lane of the requests made in this task.
+    """
+    return _lane.get() or INTERACTIVE
+
+
+@contextmanager
+def operation_lane(operation: str) -> Iterator[None]:
+    """
+    Moves a bulk endpoint method to the bulk lane, unless an outer block already chose a lane.
+    """
+    if _lane.get() is None and (operation in BULK_OPERATIONS or operation.rsplit(".", 1)[-1].startswith("get_all")):
+        with lane(BULK):
+            yield
+    else:
+        yield
+
+
+class PriorityLanes:
+    """
+    Limits the requests in flight and serves the lanes in priority order.
+
+        client = Lume(api_key, max_concurrency=PriorityLanes(limit=50, reserved={"interactive": 10}))
+
+    When a slot frees up, waiting requests of the first lane go before those of
+    the next. Reserved slots are kept free for their lane: with the example above,
+    bulk requests use at most 40 slots while no interactive request is in flight.
+
+    :param limit: The requests in flight across all lanes (optional, defaults to 50).
+    :param reserved: Slots only the given lane may use (optional, defaults to a fifth of
+        ``limit`` for the first lane).
+    :param lanes: The lane names, highest priority first (optional, defaults to interactive, bulk).
+    """
+
+    def __init__(self, limit: int = 50, reserved: Optional[Dict[str, int]] = None, lanes: Sequence[str] = LANES):
+        self.lanes = tuple(lanes)
+        self.reserved = dict(reserved) if reserved is not None else {self.lanes[0]: max(1, limit // 5)}
+        unknown = set(self.reserved) - set(self.lanes)
+        if unknown:
+            raise ValueError(f"Reserved slots for unknown lanes: {', '.join(sorted(unknown))}")
+        if limit < 1 or sum(self.reserved.values()) >= limit:
+            raise ValueError("limit must be at least 1 and larger than the reserved slots.")
+        self.limit = limit
+        self.in_flight: Dict[str, int] = {name: 0 for name in self.lanes}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {name: deque() for name in self.lanes}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the requests in flight, queued requests and reserved slots per lane.
+        """
+        return {
+            name: {"in_flight": self.in_flight[name], "queued": len(self._waiters[name]), "reserved": self.reserved.get(name, 0)}
+            for name in self.lanes
+        }
+
+    def _lane(self) -> str:
+        name = current_lane()
+        if name not in self.in_flight:
+            raise ValueError(f"Unknown lane {name!r}, expected one of {', '.join(self.lanes)}")
+        return name
+
+    def _available(self, name: str) -> bool:
+        # Slots reserved for the other lanes and not in use by them are off limits.
+        held = sum(max(0, self.reserved.get(other, 0) - self.in_flight[other]) for other in self.lanes if other != name)
+        return sum(self.in_flight.values()) + held < self.limit
+
+    async def acquire(self, method: str, route: str) -> None:
+        name = self._lane()
+        ahead = self.lanes[: self.lanes.index(name) + 1]
+        if self._available(name) and not any(self._waiters[other] for other in ahead):
+            self.in_flight[name] += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[name].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight[name] -= 1  # The slot was handed over just as the request was cancelled.
+                self._dispatch()
+            elif waiter in self._waiters[name]:
+                self._waiters[name].remove(waiter)
+            raise
+
+    def release(self, method: str, route: str, elapsed: float, status_code: Optional[int], timed_out: bool = False) -> None:
+        self.in_flight[self._lane()] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        for name in self.lanes:
+            waiters = self._waiters[name]
+            while waiters and self._available(name):
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self.in_flight[name] += 1
+                    waiter.set_result(None)
@@ -0,0 +1,295 @@
+"""
+In-process metrics for the ``Lume`` client.
+
+A ``MetricsRegistry`` listens to the client hooks and keeps request counters and
+HDR-style latency histograms per route template, method and outcome, plus
+histograms for time spent waiting in the client queue and time spent polling.
+"""
+import math
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+from .hooks import Event, Hooks
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Values are recorded in microseconds; the first 2**_SUB_BITS values get exact
+# buckets and every further power of two is split into 2**(_SUB_BITS - 1)
+# buckets, bounding the relative error of a recorded value to under 1.6%.
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT >> 1
+
+
+def _bucket_of(value: int) -> int:
+    if value < _SUB_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF_COUNT + (value >> shift) - _HALF_COUNT
+
+
+def _bucket_bounds(bucket: int) -> Tuple[int, int]:
+    if bucket < _SUB_COUNT:
+        return bucket, bucket
+    shift, offset = divmod(bucket - _SUB_COUNT, _HALF_COUNT)
+    shift += 1
+    lower = (offset + _HALF_COUNT) << shift
+    return lower, lower + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations with bounded relative error and sparse storage.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self.counts[_bucket_of(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the value at quantile ``q`` (between 0 and 1) in seconds.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                lower, upper = _bucket_bounds(bucket)
+                return min(max((lower + upper) / 2 / 1_000_000, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        summary = {"count": self.count, "sum": self.total, "min": self.min if self.count else 0.0, "max": self.max}
+        summary["mean"] = self.total / self.count if self.count else 0.0
+        for q in QUANTILES:
+            summary[f"p{round(q * 100)}"] = self.quantile(q)
+        return summary
+
+
+def outcome_of(event: Event) -> str:
+    if event.status_code is None:
+        return "transport_error"
+    if event.status_code < 400:
+        return "success"
+    return "client_error" if event.status_code < 500 else "server_error"
+
+
+class MetricsRegistry:
+    """
+    Collects request counts and latency histograms from a client's hooks.
+
+    All keys are route templates such as ``results/{id}`` so the number of series
+    stays bounded no matter how many objects are accessed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._operations: Dict[Tuple[str, str], LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._queue_wait: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._polling: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._bytes: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._retries: Dict[str, int] = defaultdict(int)
+        self._cache: Dict[str, int] = defaultdict(int)
+
+    def attach(self, hooks: Hooks) -> "MetricsRegistry":
+        hooks.on("request_end", self._on_request_end)
+        hooks.on("operation_end", self._on_operation_end)
+        hooks.on("poll_end", self._on_poll_end)
+        hooks.on("retry", self._on_retry)
+        hooks.on("cache_hit", self._on_cache)
+        hooks.on("cache_miss", self._on_cache)
+        return self
+
+    def detach(self, hooks: Hooks) -> None:
+        hooks.off("request_end", self._on_request_end)
+        hooks.off("operation_end", self._on_operation_end)
+        hooks.off("poll_end", self._on_poll_end)
+        hooks.off("retry", self._on_retry)
+        hooks.off("cache_hit", self._on_cache)
+        hooks.off("cache_miss", self._on_cache)
+
+    def reset(self) -> None:
+        with self._lock:
+            for series in (self._requests, self._operations, self._queue_wait, self._polling, self._bytes, self._retries, self._cache):
+                series.clear()
+
+    def _on_request_end(self, event: Event) -> None:
+        with self._lock:
+            self._requests[(event.route, event.method, outcome_of(event))].record(event.elapsed)
+            if event.queue_wait is not None:
+                self._queue_wait[event.route].record(event.queue_wait)
+            sizes = self._bytes[event.route]
+            sizes[0] += event.request_size or 0
+            sizes[1] += event.response_size or 0
+
+    def _on_operation_end(self, event: Event) -> None:
+        with self._lock:
+            self._operations[(event.operation, "error" if event.error else "success")].record(event.elapsed)
+
+    def _on_poll_end(self, event: Event) -> None:
+        with self._lock:
+            self._polling[event.route].record(event.elapsed)
+
+    def _on_retry(self, event: Event) -> None:
+        with self._lock:
+            self._retries[event.route] += 1
+
+    def _on_cache(self, event: Event) -> None:
+        with self._lock:
+            self._cache[event.type[len("cache_"):]] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a point-in-time copy of every metric as plain data.
+
+        :return: A dictionary with ``requests`` (per route, method and outcome),
+            ``operations`` (per endpoint method and outcome), ``queue_wait`` and ``polling`` (per route), ``bytes``, ``retries``,
+            ``cache`` and ``totals`` splitting time between transfer, queueing and polling.
+        """
+        with self._lock:
+            requests = [
+                {"route": route, "method": method, "outcome": outcome, **histogram.summary()}
+                for (route, method, outcome), histogram in sorted(self._requests.items())
+            ]
+            operations = [
+                {"operation": operation, "outcome": outcome, **histogram.summary()}
+                for (operation, outcome), histogram in sorted(self._operations.items())
+            ]
+            queue_wait = {route: histogram.summary() for route, histogram in sorted(self._queue_wait.items())}
+            polling = {route: histogram.summary() for route, histogram in sorted(self._polling.items())}
+            sizes = {route: {"sent": sent, "received": received} for route, (sent, received) in sorted(self._bytes.items())}
+            retries = dict(self._retries)
+            cache = dict(self._cache)
+            overall = LatencyHistogram()
+            for histogram in self._requests.values():
+                overall.merge(histogram)
+        return {
+            "requests": requests,
+            "latency": overall.summary(),
+            "operations": operations,
+            "queue_wait": queue_wait,
+            "polling": polling,
+            "bytes": sizes,
+            "retries": retries,
+            "cache": cache,
+            "totals": {
+                "transfer_seconds": overall.total,
+                "queue_seconds": sum(entry["sum"] for entry in queue_wait.values()),
+                "polling_seconds": sum(entry["sum"] for entry in polling.values()),
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "lume_client") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+        Latency histograms are exported as summaries with ``quantile`` labels.
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def summary(name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], Dict[str, float]]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for labels, values in series:
+                for q in QUANTILES:
+                    lines.append(_sample(f"{prefix}_{name}", {**labels, "quantile": str(q)}, values[f"p{round(q * 100)}"]))
+                lines.append(_sample(f"{prefix}_{name}_sum", labels, values["sum"]))
+                lines.append(_sample(f"{prefix}_{name}_count", labels, values["count"]))
+
+        def counter(name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in series:
+                lines.append(_sample(f"{prefix}_{name}", labels, value))
+
+        summary(
+            "request_duration_seconds", "Duration of SDK HTTP requests.",
+            (({"route": r["route"], "method": r["method"], "outcome": r["outcome"]}, r) for r in snapshot["requests"]),
+        )
+        summary(
+            "operation_duration_seconds", "Duration of SDK endpoint methods, including polling.",
+            (({"operation": o["operation"], "outcome": o["outcome"]}, o) for o in snapshot["operations"]),
+        )
+        summary(
+            "queue_wait_seconds", "Time requests waited for a concurrency slot.",
+            (({"route": route}, values) for route, values in snapshot["queue_wait"].items()),
+        )
+        summary(
+            "poll_duration_seconds", "Time spent polling for completion.",
+            (({"route": route}, values) for route, values in snapshot["polling"].items()),
+        )
+        counter(
+            "sent_bytes_total", "Request body bytes sent.",
+            (({"route": route}, sizes["sent"]) for route, sizes in snapshot["bytes"].items()),
+        )
+        counter(
+            "received_bytes_total", "Response body bytes received.",
+            (({"route": route}, sizes["received"]) for route, sizes in snapshot["bytes"].items()),
+        )
+        counter("retries_total", "Requests retried.", (({"route": route}, n) for route, n in snapshot["retries"].items()))
+        counter("cache_lookups_total", "SDK cache lookups.", (({"result": k}, n) for k, n in snapshot["cache"].items()))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+    return f"{name}{{{rendered}}} {value}" if rendered else f"{name} {value}"
+
+
+def serve_prometheus(registry: MetricsRegistry, port: int = 9464, addr: str = "") -> "ThreadingHTTPServer":
+    """
+    Serves ``registry`` on ``http://addr:port/metrics`` from a daemon thread.
+
+    :return: The running server; call ``shutdown()`` on it to stop.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") not in ("", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    threading.Thread(target=server.serve_forever, name="lume-prometheus", daemon=True).start()
+    return server
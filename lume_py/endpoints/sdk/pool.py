@@ -0,0 +1,123 @@
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from .api_client import Lume, close_soon
+from .binding import use_client
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class ClientPool:
+    """
+    A keyed pool of ``Lume`` clients, one per tenant, each with its own
+    connection pool and limits.
+
+    :param max_clients: Number of tenants kept open; the least recently used
+        client is closed when the pool is full, once the operations running on it
+        finish (optional, defaults to 128). Models bound to an evicted client
+        re-open their tenant on their next call.
+    :param limits: Connection limits applied to every tenant client (optional).
+    :param client_options: Further ``Lume`` keyword arguments shared by every tenant,
+        e.g. ``base_url``, ``timeout`` or ``max_retries``.
+    """
+
+    def __init__(self, max_clients: int = 128, limits: Optional["httpx.Limits"] = None, **client_options: Any):
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1.")
+        self.max_clients = max_clients
+        self.limits = limits
+        self.client_options = client_options
+        self._clients: "OrderedDict[str, Lume]" = OrderedDict()
+        self._tenants: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tenant: str, api_key: str, **overrides: Any) -> Lume:
+        """
+        Creates (or replaces) the client of a tenant.
+
+        :param tenant: The key identifying the tenant.
+        :param api_key: The tenant's Lume API key.
+        :param overrides: ``Lume`` keyword arguments for this tenant only, e.g. ``limits``.
+        :return: The tenant's client.
+        """
+        options = {"limits": self.limits, **self.client_options, **overrides}
+        client = Lume(api_key=api_key, **options)
+        with self._lock:
+            previous = self._clients.pop(tenant, None)
+            self._clients[tenant] = client
+            self._tenants[tenant] = {"api_key": api_key, **overrides}
+            evicted = self._evict()
+        if previous is not None:
+            close_soon(previous, reopen=functools.partial(self.get, tenant))
+        for name, stale in evicted:
+            close_soon(stale, reopen=functools.partial(self.get, name))
+        return client
+
+    def get(self, tenant: str, api_key: Optional[str] = None) -> Lume:
+        """
+        Returns the client of a tenant, creating it when an API key is given
+        and re-opening it if it was evicted.
+
+        :raises KeyError: If the tenant is unknown and no API key is given.
+        """
+        with self._lock:
+            client = self._clients.get(tenant)
+            if client is not None and (api_key is None or api_key == client.api_key):
+                self._clients.move_to_end(tenant)
+                return client
+        if api_key is not None:
+            return self.register(tenant, api_key)
+        if tenant not in self._tenants:
+            raise KeyError(tenant)
+        # Re-open a tenant that was evicted, with the options it was registered with.
+        return self.register(tenant, **self._tenants[tenant])
+
+    def __getitem__(self, tenant: str) -> Lume:
+        return self.get(tenant)
+
+    def __contains__(self, tenant: str) -> bool:
+        return tenant in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @contextmanager
+    def use(self, tenant: str, api_key: Optional[str] = None) -> Iterator[Lume]:
+        """
+        Routes the SDK calls made inside the block through the tenant's client.
+        The client stays open until the block exits, even if it is evicted meanwhile.
+        """
+        client = self.get(tenant, api_key)
+        with client.pinned(), use_client(client):
+            yield client
+
+    def remove(self, tenant: str) -> None:
+        """
+        Drops a tenant and closes its client.
+        """
+        with self._lock:
+            client = self._clients.pop(tenant, None)
+            self._tenants.pop(tenant, None)
+        if client is not None:
+            close_soon(client)
+
+    async def aclose(self) -> None:
+        """
+        Closes every client in the pool.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+    def _evict(self):
+        evicted = []
+        while len(self._clients) > self.max_clients:
+            evicted.append(self._clients.popitem(last=False))
+        return evicted
+
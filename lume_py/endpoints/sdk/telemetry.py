@@ -0,0 +1,148 @@
+"""
+Optional OpenTelemetry integration for the ``Lume`` client.
+
+Requires the ``opentelemetry-api`` package (``pip install lume_py[opentelemetry]``).
+Each endpoint method (``Job.run``, ``Pipeline.run_pipeline``, ``PDF.extract_pdf``, ...)
+becomes an ``INTERNAL`` span with one ``CLIENT`` child span per HTTP request.
+Retries, poll ticks and cache lookups are recorded as span events and metrics.
+"""
+from typing import Any, Dict, Tuple
+
+from .hooks import Event
+
+try:
+    from opentelemetry import context, metrics, trace
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    context = metrics = trace = None
+
+INSTRUMENTATION_NAME = "lume_py"
+
+
+class OpenTelemetryInstrumentor:
+    """
+    Translates client hook events into OpenTelemetry spans and metrics.
+
+    :param client: The ``Lume`` client to instrument.
+    :param tracer_provider: Tracer provider to use (optional, defaults to the global one).
+    :param meter_provider: Meter provider to use (optional, defaults to the global one).
+    """
+
+    def __init__(self, client, tracer_provider=None, meter_provider=None):
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetry support requires the 'opentelemetry-api' package: "
+                "pip install lume_py[opentelemetry]"
+            )
+        self.client = client
+        self.tracer = trace.get_tracer(INSTRUMENTATION_NAME, tracer_provider=tracer_provider)
+        meter = metrics.get_meter(INSTRUMENTATION_NAME, meter_provider=meter_provider)
+        self.request_duration = meter.create_histogram(
+            "lume.client.request.duration", unit="s", description="Duration of HTTP requests made by the SDK."
+        )
+        self.operation_duration = meter.create_histogram(
+            "lume.client.operation.duration", unit="s", description="Duration of SDK endpoint methods."
+        )
+        self.response_size = meter.create_histogram(
+            "lume.client.response.size", unit="By", description="Size of response bodies."
+        )
+        self.retries = meter.create_counter("lume.client.retries", description="Requests retried by the SDK.")
+        self.poll_ticks = meter.create_counter("lume.client.poll.ticks", description="Status polls made by the SDK.")
+        self.cache_lookups = meter.create_counter("lume.client.cache.lookups", description="SDK cache lookups.")
+        self._operations: Dict[int, Tuple[Any, Any]] = {}
+        self._requests: Dict[int, Any] = {}
+        self._handlers = {
+            "operation_start": self._operation_start,
+            "operation_end": self._operation_end,
+            "request_start": self._request_start,
+            "request_end": self._request_end,
+            "retry": self._retry,
+            "poll_tick": self._poll_tick,
+            "cache_hit": self._cache,
+            "cache_miss": self._cache,
+        }
+
+    def instrument(self) -> "OpenTelemetryInstrumentor":
+        for event_type, handler in self._handlers.items():
+            self.client.hooks.on(event_type, handler)
+        return self
+
+    def uninstrument(self) -> None:
+        for event_type, handler in self._handlers.items():
+            self.client.hooks.off(event_type, handler)
+
+    def _operation_start(self, event: Event) -> None:
+        span = self.tracer.start_span(f"lume {event.operation}", kind=trace.SpanKind.INTERNAL)
+        span.set_attribute("lume.operation", event.operation)
+        token = context.attach(trace.set_span_in_context(span))
+        self._operations[event.id] = (span, token)
+
+    def _operation_end(self, event: Event) -> None:
+        span, token = self._operations.pop(event.id, (None, None))
+        if span is None:
+            return
+        outcome = "error" if event.error else "ok"
+        if event.error:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, event.error))
+        span.end()
+        context.detach(token)
+        self.operation_duration.record(event.elapsed, {"lume.operation": event.operation, "lume.outcome": outcome})
+
+    def _request_start(self, event: Event) -> None:
+        span = self.tracer.start_span(f"{event.method} {event.route}", kind=trace.SpanKind.CLIENT)
+        span.set_attribute("http.request.method", event.method)
+        span.set_attribute("http.route", event.route)
+        span.set_attribute("url.full", event.url)
+        span.set_attribute("lume.attempt", event.attempt)
+        span.set_attribute("http.request.body.size", event.request_size or 0)
+        if event.operation:
+            span.set_attribute("lume.operation", event.operation)
+        self._requests[event.id] = span
+
+    def _request_end(self, event: Event) -> None:
+        attributes = self._attributes(event)
+        self.request_duration.record(event.elapsed, attributes)
+        if event.response_size is not None:
+            self.response_size.record(event.response_size, attributes)
+        span = self._requests.pop(event.id, None)
+        if span is None:
+            return
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+            span.set_attribute("http.response.body.size", event.response_size or 0)
+        if event.error or (event.status_code or 0) >= 400:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, event.error))
+        span.end()
+
+    def _retry(self, event: Event) -> None:
+        self.retries.add(1, self._attributes(event))
+        trace.get_current_span().add_event("lume.retry", {"lume.attempt": event.attempt, "lume.delay": event.elapsed})
+
+    def _poll_tick(self, event: Event) -> None:
+        self.poll_ticks.add(1, {"http.route": event.route, "lume.operation": event.operation or ""})
+        trace.get_current_span().add_event("lume.poll", {"lume.attempt": event.attempt, "lume.status": event.status})
+
+    def _cache(self, event: Event) -> None:
+        outcome = "hit" if event.type == "cache_hit" else "miss"
+        self.cache_lookups.add(1, {"lume.cache.result": outcome, "lume.operation": event.operation or ""})
+        trace.get_current_span().add_event(f"lume.cache_{outcome}", {"lume.cache.key": event.key or ""})
+
+    @staticmethod
+    def _attributes(event: Event) -> Dict[str, Any]:
+        attributes = {"http.request.method": event.method, "http.route": event.route, "lume.operation": event.operation or ""}
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error:
+            attributes["error.type"] = event.error.split("(")[0]
+        return attributes
+
+
+def instrument_opentelemetry(client, tracer_provider=None, meter_provider=None) -> OpenTelemetryInstrumentor:
+    """
+    Emits OpenTelemetry spans and metrics for every request and endpoint method of ``client``.
+
+    :param client: The ``Lume`` client to instrument.
+    :param tracer_provider: Tracer provider to use (optional, defaults to the global one).
+    :param meter_provider: Meter provider to use (optional, defaults to the global one).
+    :return: The instrumentor; call ``uninstrument()`` on it to stop.
+    """
+    return OpenTelemetryInstrumentor(client, tracer_provider, meter_provider).instrument()
@@ -0,0 +1,20 @@
+from pydantic_settings import BaseSettings
+from lume_py.endpoints.sdk.api_client import Lume, close_soon
+from typing import Optional
+
+class Settings(BaseSettings):
+    lume_api_key: Optional[str] = None
+    client: Optional[Lume] = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.lume_api_key:
+            self.client = Lume(api_key=self.lume_api_key)
+
+    def set_api_key(self, api_key: str):
+        previous = self.client
+        self.lume_api_key = api_key
+        self.client = Lume(api_key=self.lume_api_key)
+        if previous is not None:
+            # Running operations finish on the old client; models bound to it move to the new one.
+            close_soon(previous, reopen=lambda: self.client)
@@ -0,0 +1,122 @@
+"""
+Local pre-filtering of Excel workbooks before they are uploaded.
+
+Requires the ``openpyxl`` package (``pip install lume_py[excel]``).
+The workbook is streamed in read-only mode and only the requested sheets, and
+optionally cell ranges within them, are written to a slimmed copy. Cell values
+are copied (formulas as their last computed values), formatting is not.
+"""
+import csv
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from lume_py.endpoints.config import get_client
+
+try:
+    import openpyxl
+    from openpyxl.utils.cell import range_boundaries
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    openpyxl = range_boundaries = None
+
+FORMATS = ("xlsx", "csv")
+
+
+def parse_sheets(sheets: Union[str, Iterable[str], None]) -> List[str]:
+    """
+    Normalizes sheet names given comma-delimited, as ``Excel.convert_sheets`` takes them, or as a list.
+    """
+    if sheets is None:
+        return []
+    if isinstance(sheets, str):
+        sheets = sheets.split(",")
+    return [name.strip() for name in sheets if name.strip()]
+
+
+def prefilter_workbook(
+    file_path: str,
+    sheets: Union[str, Iterable[str], None] = None,
+    ranges: Optional[Dict[str, str]] = None,
+    output: Optional[str] = None,
+    format: str = "xlsx",
+) -> str:
+    """
+    Writes a copy of a workbook that holds only the given sheets and ranges.
+
+        slim = prefilter_workbook("book.xlsx", "Orders,Customers", ranges={"Orders": "A1:H5000"})
+
+    :param file_path: The workbook to read.
+    :param sheets: The sheets to keep, comma-delimited or as a list (optional, defaults to the sheets in ``ranges``).
+    :param ranges: Cell ranges to keep per sheet, e.g. ``{"Orders": "A1:H5000"}`` (optional,
+        defaults to whole sheets). Cells keep their positions.
+    :param output: The file to write (optional, defaults to a new temporary file).
+    :param format: ``"xlsx"``, or ``"csv"`` for a single sheet (optional, defaults to ``"xlsx"``).
+    :return: The path of the written file.
+    :raises ValueError: If no sheet is selected, a sheet does not exist or the format is not supported.
+    :raises ImportError: If ``openpyxl`` is not installed.
+    """
+    if openpyxl is None:
+        raise ImportError("Pre-filtering workbooks requires the 'openpyxl' package: pip install lume_py[excel]")
+    ranges = ranges or {}
+    wanted = parse_sheets(sheets) or list(ranges)
+    if not wanted:
+        raise ValueError("No sheets selected to keep.")
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {', '.join(FORMATS)}.")
+    if format == "csv" and len(wanted) != 1:
+        raise ValueError("A CSV file holds a single sheet.")
+
+    source = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        missing = [name for name in wanted if name not in source.sheetnames]
+        if missing:
+            raise ValueError(f"{file_path} has no sheet {', '.join(missing)}; its sheets are {', '.join(source.sheetnames)}")
+        if output is None:
+            descriptor, output = tempfile.mkstemp(prefix="lume-", suffix=f".{format}")
+            os.close(descriptor)
+        if format == "csv":
+            with open(output, "w", newline="") as file:
+                csv.writer(file).writerows(_rows(source[wanted[0]], ranges.get(wanted[0])))
+        else:
+            target = openpyxl.Workbook(write_only=True)
+            for name in source.sheetnames:  # Keep the order of the original workbook.
+                if name in wanted:
+                    sheet = target.create_sheet(name)
+                    for row in _rows(source[name], ranges.get(name)):
+                        sheet.append(row)
+            target.save(output)
+    finally:
+        source.close()
+    return output
+
+
+@asynccontextmanager
+async def prefiltered(file_path: str, sheets: Union[str, Iterable[str], None], ranges: Optional[Dict[str, str]] = None) -> AsyncIterator[str]:
+    """
+    Yields the path of a slimmed copy of the workbook and removes it afterwards.
+    The copy is built on the client's executor. Yields ``file_path`` itself when
+    neither sheets nor ranges are given.
+    """
+    if not parse_sheets(sheets) and not ranges:
+        yield file_path
+        return
+    path = await get_client().offload(prefilter_workbook, file_path, parse_sheets(sheets), ranges)
+    try:
+        yield path
+    finally:
+        os.remove(path)
+
+
+def _rows(sheet: Any, cell_range: Optional[str]) -> Iterator[Tuple[Any, ...]]:
+    if cell_range is None:
+        yield from sheet.iter_rows(values_only=True)
+        return
+    min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+    min_col, min_row = min_col or 1, min_row or 1
+    # Pad above and to the left so cells keep their addresses.
+    for _ in range(min_row - 1):
+        yield ()
+    padding = (None,) * (min_col - 1)
+    for row in sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True):
+        yield padding + row
@@ -1,12 +1,12 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
-from lume_py.endpoints.config import get_settings
+from typing import List, Dict, Any, Iterable, Optional
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.hooks import instrumented
 from .sdk.api_client import Pagination
 from http import HTTPMethod
 
-settings = get_settings()
 
-class Target(BaseModel):
+class Target(BoundModel):
     id: Optional[str] = None
     user_id: Optional[str] = None
     name: Optional[str] = None
@@ -17,6 +17,7 @@ class Target(BaseModel):
         orm_mode = True
 
     @staticmethod
+    @instrumented("Target.get")
     async def get(page: int = 1, size: int = 50, all: bool = False) -> List['Target']:
         """
         Retrieves all target schemas, iterating through pages until all schemas are retrieved.
@@ -29,15 +30,15 @@ class Target(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET, url="target_schemas", pagination=pagination
                 )
                 targets.extend([Target(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET, url="target_schemas", pagination=pagination
             )
             targets.extend([Target(**item) for item in response["items"]])
@@ -45,6 +46,7 @@ class Target(BaseModel):
         return targets
 
     @staticmethod
+    @instrumented("Target.create")
     async def create(target_schema: Dict[str, Any], name: str = "string",  filename: str = "string") -> 'Target':
         """
         Creates a new target schema.
@@ -55,52 +57,85 @@ class Target(BaseModel):
         :return: The created target schema.
         """
         payload = {"name": name, "schema": target_schema, "filename": filename}
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url="target_schemas", json=payload
         )
         return Target(**response)
 
+    @staticmethod
+    @instrumented("Target.create_from_records")
+    async def create_from_records(records: Iterable[Dict[str, Any]], name: str = "string", filename: str = "string", max_enum: int = 20) -> 'Target':
+        """
+        Infers a target schema from records locally, in one pass, and creates it.
+        The records are consumed on the client's executor, so the event loop stays free.
+        :param records: The records to infer the schema from, e.g. a generator over a large extract.
+            With a process pool executor they must be picklable, e.g. a list.
+        :param name: The name of the schema.
+        :param filename: The filename of the schema.
+        :param max_enum: The most distinct strings a field may have to be inferred as an enum.
+        :return: The created target schema.
+        """
+        from lume_py.endpoints.inference import infer_schema
+
+        schema = await get_client().offload(infer_schema, records, max_enum=max_enum)
+        return await Target.create(schema, name=name, filename=filename)
+
     @classmethod
+    @instrumented("Target.get_schema_by_id")
     async def get_schema_by_id(cls, target_schema_id: str) -> Dict[str, Any]:
         """
         Retrieves a target schema by its ID.
         :param target_schema_id: The ID of the target schema to retrieve.
         :return: The target schema details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"target_schemas/{target_schema_id}"
         )
         return response
 
     @staticmethod
-    async def get_target_by_id(target_id, page: int = 1, size: int = 50) -> List['Target']:
+    @instrumented("Target.get_target_by_id")
+    async def get_target_by_id(target_id: str, page: Optional[int] = None, size: Optional[int] = None) -> Optional['Target']:
         """
-        Retrieves all target schemas.
-        :return: List of target schemas.
+        Retrieves a target schema by its ID with a single request.
+        :param target_id: The ID of the target schema to retrieve.
+        :param page: Unused, kept for compatibility with callers that passed a listing page.
+        :param size: Unused, kept for compatibility with callers that passed a listing page.
+        :return: The target schema, or None if no target schema has this ID.
         """
-        response = await Target.get(page, size)
-        for target in response:
-            if target.id == target_id:
-                return target
+        from httpx import HTTPStatusError
+
+        try:
+            response = await get_client().request(
+                method=HTTPMethod.GET, url=f"target_schemas/{target_id}"
+            )
+        except HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return None
+            raise
+        return Target(**response)
 
+    @instrumented("Target.get_schema")
     async def get_schema(self) -> Dict[str, Any]:
         """
         Retrieves the details of this target schema.
         :return: The target schema details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"target_schemas/{self.id}"
         )
         return response
 
+    @instrumented("Target.delete")
     async def delete(self) -> None:
         """
         Deletes a specific target schema by its ID.
         """
-        await settings.client.request(
+        await get_client().request(
             method=HTTPMethod.DELETE, url=f"target_schemas/{self.id}"
         )
 
+    @instrumented("Target.update")
     async def update(self, name: str = "string", filename: str = "string", target_schema: Dict[str, Any] = {}) -> 'Target':
         """
         Updates an existing target schema with the provided details.
@@ -111,29 +146,31 @@ class Target(BaseModel):
         :return: The updated target schema details.
         """
         payload = {"name": name, "filename": filename, "schema": target_schema}
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.PUT, url=f"target_schemas/{self.id}/update", json=payload
         )
         return response
 
+    @instrumented("Target.get_target_schema_object")
     async def get_target_schema_object(self) -> 'Target':
         """
         Retrieves the object of a specific target schema by its ID.
         :return: The target schema object.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"target_schemas/{self.id}/object"
         )
         return Target(**response)
 
     @staticmethod
+    @instrumented("Target.generate_target_schema")
     async def generate_target_schema(sample: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generates a new target schema.
         :param sample: The sample data to generate the schema.
         :return: The generated target schema details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url="target_schemas/generate",
             json={"sample": sample},
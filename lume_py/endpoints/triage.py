@@ -0,0 +1,173 @@
+import bisect
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from http import HTTPMethod
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.results import TRIAGE_STATUSES, Result
+from lume_py.endpoints.sdk.api_client import Pagination
+from lume_py.endpoints.sdk.handles import gather
+from lume_py.endpoints.sdk.hooks import instrumented
+
+PENDING_STATUSES = ("queued", "running")
+
+Since = Union[datetime, timedelta, str, float, None]
+
+
+def parse_timestamp(value: Union[datetime, str, float, None]) -> float:
+    """
+    Converts an API timestamp to seconds since the epoch. Naive timestamps are taken as UTC.
+    """
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class TriageIndex:
+    """
+    A local index of results by status and ``updated_at``, refreshed incrementally.
+
+        index = TriageIndex()
+        await index.refresh()
+        failed = index.since(timedelta(minutes=10))
+
+    ``refresh`` asks the server only for results updated since the last refresh
+    (``updated_since``). If the server ignores that filter, it fetches only the
+    listing pages it has not seen yet and re-checks the results that can still
+    change what ``since`` returns: queued, running, failed and needs review.
+    Queries then run on the index without any requests.
+
+    :param page_size: Results fetched per page (optional, defaults to 100).
+    :param max_concurrency: Results re-checked at once (optional, defaults to 10).
+    """
+
+    def __init__(self, page_size: int = 100, max_concurrency: int = 10):
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.server_filtering: Optional[bool] = None
+        self._results: Dict[str, Result] = {}
+        self._keys: Dict[str, Tuple[float, str]] = {}
+        self._by_status: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self._watermark: Optional[str] = None
+        self._watermark_at = 0.0
+        self._listed = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, result_id: str) -> bool:
+        return result_id in self._results
+
+    def get(self, result_id: str) -> Optional[Result]:
+        return self._results.get(result_id)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns the number of indexed results per status.
+        """
+        return {status: len(keys) for status, keys in self._by_status.items() if keys}
+
+    def since(self, since: Since = None, statuses: Iterable[str] = TRIAGE_STATUSES) -> List[Result]:
+        """
+        Returns the indexed results in ``statuses`` updated at or after ``since``, oldest first.
+
+        :param since: A datetime, ISO timestamp, epoch seconds, or a timedelta before now
+            (optional, defaults to every result).
+        :param statuses: The statuses to return (optional, defaults to failed and needs review).
+        """
+        if isinstance(since, timedelta):
+            since = time.time() - since.total_seconds()
+        cutoff = parse_timestamp(since)
+        found: List[Tuple[float, str]] = []
+        for status in statuses:
+            keys = self._by_status.get(status, [])
+            found.extend(keys[bisect.bisect_left(keys, (cutoff, "")):])
+        return [self._results[result_id] for _, result_id in sorted(found)]
+
+    def add(self, result: Result) -> bool:
+        """
+        Adds or updates a result in the index.
+
+        :return: True if the result is new or its status or ``updated_at`` changed.
+        """
+        key = (parse_timestamp(result.updated_at), result.id)
+        previous = self._results.get(result.id)
+        if previous is not None:
+            if previous.status == result.status and self._keys[result.id] == key:
+                self._results[result.id] = result
+                return False
+            keys = self._by_status[previous.status]
+            del keys[bisect.bisect_left(keys, self._keys[result.id])]
+        self._results[result.id] = result
+        self._keys[result.id] = key
+        bisect.insort(self._by_status[result.status], key)
+        if result.updated_at and key[0] > self._watermark_at:
+            self._watermark, self._watermark_at = result.updated_at, key[0]
+        return True
+
+    @instrumented("TriageIndex.refresh")
+    async def refresh(self) -> int:
+        """
+        Brings the index up to date with the server.
+
+        :return: The number of results that were added or changed.
+        """
+        if self._watermark is None:
+            return await self._list_pages(first_page=1)
+        if self.server_filtering is not False:
+            changed = await self._refresh_filtered()
+            if changed is not None:
+                return changed
+        listed: Set[str] = set()
+        changed = await self._list_pages(first_page=self._listed // self.page_size + 1, listed=listed)
+        return changed + await self._recheck(exclude=listed)
+
+    async def _refresh_filtered(self) -> Optional[int]:
+        watermark, cutoff = self._watermark, self._watermark_at
+        pagination = Pagination(page=1, size=self.page_size)
+        batch: List[Result] = []
+        while True:
+            response = await get_client().request(
+                method=HTTPMethod.GET, url="results", params={"updated_since": watermark}, pagination=pagination
+            )
+            items = [Result(**item) for item in response["items"]]
+            if any(parse_timestamp(item.updated_at) < cutoff for item in items):
+                # The server ignored the filter and sent the full listing.
+                self.server_filtering = False
+                return None
+            batch.extend(items)
+            if len(items) < self.page_size:
+                break
+            pagination.page += 1
+        self.server_filtering = True
+        return sum(self.add(result) for result in batch)
+
+    async def _list_pages(self, first_page: int, listed: Optional[Set[str]] = None) -> int:
+        pagination = Pagination(page=first_page, size=self.page_size)
+        changed = 0
+        while True:
+            response = await get_client().request(method=HTTPMethod.GET, url="results", pagination=pagination)
+            items = response["items"]
+            changed += sum(self.add(Result(**item)) for item in items)
+            if listed is not None:
+                listed.update(item["id"] for item in items)
+            self._listed = max(self._listed, (pagination.page - 1) * self.page_size + len(items))
+            if len(items) < self.page_size:
+                break
+            pagination.page += 1
+        return changed
+
+    async def _recheck(self, exclude: Set[str]) -> int:
+        # Without server filtering, a listed result only shows a change if it is fetched again.
+        statuses = (*PENDING_STATUSES, *TRIAGE_STATUSES)
+        stale = [result for result in self._results.values() if result.status in statuses and result.id not in exclude]
+        fetched = await gather([result.get_details for result in stale], max_concurrency=self.max_concurrency)
+        return sum(self.add(result) for result in fetched if isinstance(result, Result))
@@ -0,0 +1,158 @@
+"""
+Content-addressed deduplication of file uploads.
+
+    manifest = UploadManifest("uploads.json")
+    sheets = await Excel.convert_sheets("book.xlsx", "book.xlsx", manifest=manifest)
+
+An upload with a manifest is keyed by the client's tenant, a hash of the
+file contents and the call's other arguments. When the same tenant uploaded
+the same content before, the outcome recorded then is returned and nothing is
+sent. Renaming or copying a file does not change its key; editing it does.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from lume_py.endpoints.config import get_client
+
+HASH_ALGORITHM = "blake2b"
+HASH_BLOCK = 1024 * 1024
+FAILED_STATUSES = {"failed", "error"}
+
+
+def file_digest(path: str, algorithm: str = HASH_ALGORITHM) -> str:
+    """
+    Hashes a file in fixed-size blocks, so memory does not grow with the file.
+
+    :param path: The file to hash.
+    :param algorithm: A ``hashlib`` algorithm (optional, defaults to blake2b).
+    :return: The digest as ``"<algorithm>:<hex>"``.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as file:
+        while block := file.read(HASH_BLOCK):
+            digest.update(block)
+    return f"{algorithm}:{digest.hexdigest()}"
+
+
+def client_fingerprint() -> str:
+    """
+    Identifies the tenant of the current client by its base URL and a hash of its API key.
+    """
+    client = get_client()
+    api_key = hashlib.blake2b(client.api_key.encode(), digest_size=8).hexdigest()
+    return f"{client.base_url.rstrip('/')}#{api_key}"
+
+
+class UploadManifest:
+    """
+    Remembers the outcome of each uploaded file by content hash.
+
+    The manifest lives in memory, or in a JSON file when ``path`` is given so it
+    survives between runs. Digests are remembered per file path together with the
+    file's size and modification time, so an unchanged file is not hashed again.
+    Every lookup emits a ``cache_hit`` or ``cache_miss`` event on the client's hooks.
+
+    :param path: The JSON file to keep the manifest in (optional, defaults to memory only).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, List[Any]] = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                state = json.load(file)
+            self._entries = state.get("entries", {})
+            self._files = state.get("files", {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def digest(self, file_path: str) -> str:
+        """
+        Returns the content hash of a file, reusing the last one if its size and
+        modification time are unchanged.
+        """
+        stat = os.stat(file_path)
+        name = os.path.abspath(file_path)
+        known = self._files.get(name)
+        if known is not None and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return known[2]
+        digest = file_digest(file_path)
+        self._files[name] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    async def lookup(self, operation: str, file_path: str, **params: Any) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Builds the key of an upload like ``key`` and returns it with the recorded outcome.
+        A file that has to be hashed is hashed on the client's executor.
+
+        :return: The key, and the recorded outcome or None.
+        """
+        stat = os.stat(file_path)
+        known = self._files.get(os.path.abspath(file_path))
+        if known is None or known[:2] != [stat.st_size, stat.st_mtime_ns]:
+            digest = await get_client().offload(file_digest, file_path)
+            self._files[os.path.abspath(file_path)] = [stat.st_size, stat.st_mtime_ns, digest]
+        key = self.key(operation, file_path, **params)
+        return key, self.get(key)
+
+    def key(self, operation: str, file_path: str, **params: Any) -> str:
+        """
+        Builds the key of an upload from the operation, the current client, the file
+        contents and the other arguments. Tenants sharing a manifest get separate keys.
+
+        :param operation: The uploading method, e.g. ``"Excel.convert_sheets"``.
+        :param file_path: The file being uploaded.
+        :param params: The arguments that change the outcome, e.g. the sheet names.
+        :return: The manifest key.
+        """
+        params = json.dumps(params, sort_keys=True, default=str)
+        return f"{operation}:{client_fingerprint()}:{self.digest(file_path)}:{params}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the recorded outcome of an upload, or None if the content was not uploaded before.
+        """
+        entry = self._entries.get(key)
+        operation = key.split(":", 1)[0]
+        get_client().hooks.emit("cache_hit" if entry is not None else "cache_miss", route=operation, key=key)
+        return None if entry is None else entry["outcome"]
+
+    def put(self, key: str, outcome: Dict[str, Any]) -> None:
+        """
+        Records the outcome of an upload. Failed outcomes are not recorded, so the
+        next call uploads the file again.
+        """
+        if isinstance(outcome, dict) and str(outcome.get("status", "")).lower() in FAILED_STATUSES:
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = {"outcome": outcome, "stored_at": time.time()}
+        self.save()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Forgets one upload, or every upload when no key is given.
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        self.save()
+
+    def save(self) -> None:
+        """
+        Writes the manifest to ``path``. Called after every change; does nothing for a manifest in memory.
+        """
+        if self.path is None:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump({"entries": self._entries, "files": self._files}, file)
+        os.replace(temporary, self.path)
@@ -0,0 +1,462 @@
+"""
+Local validation of records against a target schema.
+
+    validator = get_validator(pipeline.target_schema, schema_id=pipeline.target_schema_id)
+    report = validator.validate_many(rows)
+    for error in report.errors:
+        print(error.row, error.path, error.message)
+
+Schemas are compiled once into nested checks and cached per schema ID, so
+validating a row costs a few dictionary lookups and type checks. The JSON
+Schema keywords used by target schemas are supported: ``type`` (with
+``nullable``), ``properties``, ``required``, ``additionalProperties``,
+``items``, ``prefixItems``, ``enum``, ``const``, numeric and length bounds,
+``pattern``, ``format``, ``allOf``/``anyOf``/``oneOf``/``not`` and local
+``$ref``. Other keywords are ignored.
+"""
+import atexit
+import ipaddress
+import json
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# A compiled check appends (path, message) pairs for every violation it finds.
+Check = Callable[[Any, str, List[Tuple[str, str]]], None]
+
+# Compiled validators kept by ``get_validator``.
+CACHE_SIZE = 128
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool))
+    or (isinstance(value, float) and value.is_integer()),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "null": lambda value: value is None,
+}
+
+_SCALARS = (str, int, float, bool, type(None))
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _parses(parse: Callable[[str], Any]) -> Callable[[str], bool]:
+    def check(value: str) -> bool:
+        try:
+            parse(value)
+        except ValueError:
+            return False
+        return True
+    return check
+
+
+def _is_uri(value: str) -> bool:
+    parts = urlsplit(value)
+    return bool(parts.scheme and (parts.netloc or parts.path))
+
+
+_is_datetime = _parses(datetime.fromisoformat)
+
+# Checks for the string formats the validator understands.
+FORMATS: Dict[str, Callable[[str], bool]] = {
+    "date": _parses(date.fromisoformat),
+    "date-time": lambda value: len(value) > 10 and value[10] in "Tt " and _is_datetime(value),
+    "time": _parses(time.fromisoformat),
+    "email": lambda value: _EMAIL.match(value) is not None,
+    "uri": _is_uri,
+    "uuid": _parses(uuid.UUID),
+    "ipv4": _parses(ipaddress.IPv4Address),
+    "ipv6": _parses(ipaddress.IPv6Address),
+}
+
+
+def _type_name(value: Any) -> str:
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if _TYPES[name](value):
+            return name
+    return type(value).__name__
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _accept(value: Any, path: str, errors: List[Tuple[str, str]]) -> None:
+    pass
+
+
+def _reject(value: Any, path: str, errors: List[Tuple[str, str]]) -> None:
+    errors.append((path, "is not allowed"))
+
+
+class _Compiler:
+    def __init__(self, root: Dict[str, Any]):
+        self.root = root
+        self.refs: Dict[str, Check] = {}
+
+    def compile(self, schema: Any) -> Check:
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise ValueError(f"A schema must be an object or a boolean, got {schema!r}")
+        checks: List[Check] = []
+        if "$ref" in schema:
+            checks.append(self._ref(schema["$ref"]))
+        if "type" in schema:
+            checks.append(self._type(schema))
+        if "enum" in schema or "const" in schema:
+            checks.append(self._enum(schema))
+        if any(key in schema for key in ("properties", "required", "additionalProperties")):
+            checks.append(self._object(schema))
+        if any(key in schema for key in ("items", "prefixItems", "minItems", "maxItems", "uniqueItems")):
+            checks.append(self._array(schema))
+        if any(key in schema for key in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")):
+            checks.append(self._number(schema))
+        if any(key in schema for key in ("minLength", "maxLength", "pattern", "format")):
+            checks.append(self._string(schema))
+        for keyword in ("allOf", "anyOf", "oneOf", "not"):
+            if keyword in schema:
+                checks.append(self._combinator(keyword, schema[keyword]))
+        if not checks:
+            return _accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value, path, errors):
+            for check in checks:
+                check(value, path, errors)
+        return check_all
+
+    def _ref(self, ref: str) -> Check:
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local $ref values are supported, got {ref!r}")
+        if ref not in self.refs:
+            self.refs[ref] = _accept  # Placeholder while a recursive schema compiles.
+            target: Any = self.root
+            for part in ref[1:].split("/")[1:]:
+                target = target[part.replace("~1", "/").replace("~0", "~")]
+            self.refs[ref] = self.compile(target)
+        refs = self.refs
+        return lambda value, path, errors: refs[ref](value, path, errors)
+
+    def _type(self, schema: Dict[str, Any]) -> Check:
+        names = [schema["type"]] if isinstance(schema["type"], str) else list(schema["type"])
+        if schema.get("nullable"):
+            names.append("null")
+        tests = [_TYPES[name] for name in names]
+        expected = " or ".join(names)
+
+        def check_type(value, path, errors):
+            for test in tests:
+                if test(value):
+                    return
+            errors.append((path, f"expected {expected}, got {_type_name(value)}"))
+        return check_type
+
+    def _enum(self, schema: Dict[str, Any]) -> Check:
+        allowed = schema["enum"] if "enum" in schema else [schema["const"]]
+        # Scalars are compared directly (keeping True apart from 1), anything else by its JSON form.
+        scalars = {(type(option) is bool, option) for option in allowed if isinstance(option, _SCALARS)}
+        canonical = {_canonical(option) for option in allowed if not isinstance(option, _SCALARS)}
+        message = f"must be one of {allowed!r}" if "enum" in schema else f"must be {schema['const']!r}"
+
+        def check_enum(value, path, errors):
+            if isinstance(value, _SCALARS):
+                if (type(value) is bool, value) in scalars:
+                    return
+            elif _canonical(value) in canonical:
+                return
+            errors.append((path, message))
+        return check_enum
+
+    def _object(self, schema: Dict[str, Any]) -> Check:
+        properties = {name: self.compile(sub) for name, sub in schema.get("properties", {}).items()}
+        required = list(schema.get("required", []))
+        additional = schema.get("additionalProperties", True)
+        other = None if additional is True else self.compile(additional)
+        walk = bool(properties) or other is not None
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append((f"{path}/{name}", "is required"))
+            if not walk:
+                return
+            for name, item in value.items():
+                check = properties.get(name, other)
+                if check is not None:
+                    check(item, f"{path}/{name}", errors)
+        return check_object
+
+    def _array(self, schema: Dict[str, Any]) -> Check:
+        prefix = [self.compile(sub) for sub in schema.get("prefixItems", [])]
+        items = self.compile(schema["items"]) if "items" in schema else None
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+
+        def check_array(value, path, errors):
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                errors.append((path, f"must have at least {min_items} items"))
+            if max_items is not None and len(value) > max_items:
+                errors.append((path, f"must have at most {max_items} items"))
+            if unique and len({_canonical(item) for item in value}) < len(value):
+                errors.append((path, "must not contain duplicate items"))
+            for index, item in enumerate(value):
+                check = prefix[index] if index < len(prefix) else items
+                if check is not None:
+                    check(item, f"{path}/{index}", errors)
+        return check_array
+
+    def _number(self, schema: Dict[str, Any]) -> Check:
+        bounds: List[Tuple[Callable[[float], bool], str]] = []
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+        exclusive_min, exclusive_max = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+        # Draft 4 spells exclusive bounds as booleans next to minimum and maximum.
+        if exclusive_min is True:
+            exclusive_min, minimum = minimum, None
+        if exclusive_max is True:
+            exclusive_max, maximum = maximum, None
+        if minimum is not None:
+            bounds.append((lambda value: value >= minimum, f"must be at least {minimum}"))
+        if maximum is not None:
+            bounds.append((lambda value: value <= maximum, f"must be at most {maximum}"))
+        if exclusive_min not in (None, False):
+            bounds.append((lambda value: value > exclusive_min, f"must be greater than {exclusive_min}"))
+        if exclusive_max not in (None, False):
+            bounds.append((lambda value: value < exclusive_max, f"must be less than {exclusive_max}"))
+        is_number = _TYPES["number"]
+
+        def check_number(value, path, errors):
+            if not is_number(value):
+                return
+            for test, message in bounds:
+                if not test(value):
+                    errors.append((path, message))
+        return check_number
+
+    def _string(self, schema: Dict[str, Any]) -> Check:
+        min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+        pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+        format_name = schema.get("format")
+        format_test = FORMATS.get(format_name)  # Unknown formats are annotations only.
+
+        def check_string(value, path, errors):
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                errors.append((path, f"must be at least {min_length} characters"))
+            if max_length is not None and len(value) > max_length:
+                errors.append((path, f"must be at most {max_length} characters"))
+            if pattern is not None and pattern.search(value) is None:
+                errors.append((path, f"must match {pattern.pattern!r}"))
+            if format_test is not None and not format_test(value):
+                errors.append((path, f"is not a valid {format_name}"))
+        return check_string
+
+    def _combinator(self, keyword: str, schemas: Any) -> Check:
+        if keyword == "not":
+            negated = self.compile(schemas)
+
+            def check_not(value, path, errors):
+                found: List[Tuple[str, str]] = []
+                negated(value, path, found)
+                if not found:
+                    errors.append((path, "must not match the excluded schema"))
+            return check_not
+        checks = [self.compile(sub) for sub in schemas]
+        if keyword == "allOf":
+            def check_all_of(value, path, errors):
+                for check in checks:
+                    check(value, path, errors)
+            return check_all_of
+
+        def check_some_of(value, path, errors):
+            matches = 0
+            for check in checks:
+                found: List[Tuple[str, str]] = []
+                check(value, path, found)
+                matches += not found
+            if keyword == "anyOf" and not matches:
+                errors.append((path, "does not match any of the allowed schemas"))
+            elif keyword == "oneOf" and matches != 1:
+                errors.append((path, f"must match exactly one schema, matched {matches}"))
+        return check_some_of
+
+
+class RowError(BaseModel):
+    """
+    One violation of the schema. ``path`` is a JSON pointer into the row, e.g. ``/address/zip``.
+    """
+    row: int
+    path: str
+    message: str
+
+
+class ValidationReport(BaseModel):
+    """
+    The outcome of validating a batch of rows.
+    """
+    rows: int = 0
+    errors: List[RowError] = Field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        return sorted({error.row for error in self.errors})
+
+    def by_row(self) -> Dict[int, List[RowError]]:
+        grouped: Dict[int, List[RowError]] = {}
+        for error in self.errors:
+            grouped.setdefault(error.row, []).append(error)
+        return grouped
+
+
+class SchemaValidator:
+    """
+    A target schema compiled for validating records locally.
+    Use ``get_validator`` to share compiled validators.
+
+    :param schema: A JSON Schema, e.g. a pipeline's ``target_schema``.
+    :raises ValueError: If the schema uses a remote ``$ref`` or is not a schema.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self._check = _Compiler(schema).compile(schema)
+
+    def is_valid(self, record: Any) -> bool:
+        found: List[Tuple[str, str]] = []
+        self._check(record, "", found)
+        return not found
+
+    def errors(self, record: Any, row: int = 0) -> List[RowError]:
+        """
+        Returns every violation in one record.
+        """
+        found: List[Tuple[str, str]] = []
+        self._check(record, "", found)
+        return [RowError(row=row, path=path, message=message) for path, message in found]
+
+    def validate_many(
+        self, records: Sequence[Any], processes: Optional[int] = None, chunk_size: int = 10000
+    ) -> ValidationReport:
+        """
+        Validates a batch of records.
+
+        :param records: The records to validate.
+        :param processes: Worker processes for batches larger than ``chunk_size``
+            (optional, defaults to validating in this process). The worker pool is
+            started on first use and shared by later calls.
+        :param chunk_size: Rows per worker task (optional, defaults to 10000).
+        :return: The report, with errors ordered by row.
+        """
+        records = records if isinstance(records, list) else list(records)
+        if processes and processes > 1 and len(records) > chunk_size:
+            pool = _process_pool(processes)
+            chunks = [
+                pool.submit(_validate_chunk, self.schema, start, records[start:start + chunk_size])
+                for start in range(0, len(records), chunk_size)
+            ]
+            found: List[Tuple[int, str, str]] = []
+            for chunk in chunks:
+                found.extend(chunk.result())
+        else:
+            found = _check_rows(self._check, 0, records)
+        return ValidationReport(
+            rows=len(records), errors=[RowError(row=row, path=path, message=message) for row, path, message in found]
+        )
+
+
+def _check_rows(check: Check, start: int, records: Iterable[Any]) -> List[Tuple[int, str, str]]:
+    found: List[Tuple[int, str, str]] = []
+    errors: List[Tuple[str, str]] = []
+    for row, record in enumerate(records, start):
+        check(record, "", errors)
+        if errors:
+            found.extend((row, path, message) for path, message in errors)
+            errors.clear()
+    return found
+
+
+def _validate_chunk(schema: Dict[str, Any], start: int, records: List[Any]) -> List[Tuple[int, str, str]]:
+    # Runs in a worker process, which compiles each schema once through its own cache.
+    return _check_rows(get_validator(schema)._check, start, records)
+
+
+def validate_records(
+    schema: Dict[str, Any], records: Sequence[Any], schema_id: Optional[str] = None, processes: Optional[int] = None
+) -> ValidationReport:
+    """
+    Validates records with the shared validator of ``schema``; a picklable entry
+    point for running ``validate_many`` on an executor.
+    """
+    return get_validator(schema, schema_id=schema_id).validate_many(records, processes=processes)
+
+
+_pools: Dict[int, "ProcessPoolExecutor"] = {}
+
+
+def _process_pool(processes: int) -> "ProcessPoolExecutor":
+    from concurrent.futures import ProcessPoolExecutor
+
+    with _lock:
+        pool = _pools.get(processes)
+        if pool is None:
+            if not _pools:
+                atexit.register(_shutdown_pools)
+            pool = _pools[processes] = ProcessPoolExecutor(max_workers=processes)
+        return pool
+
+
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown(cancel_futures=True)
+    _pools.clear()
+
+
+_validators: "OrderedDict[str, SchemaValidator]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_validator(schema: Dict[str, Any], schema_id: Optional[str] = None) -> SchemaValidator:
+    """
+    Returns the compiled validator for a schema, compiling it on first use.
+
+    :param schema: The JSON Schema.
+    :param schema_id: The ID the schema is cached under, e.g. a target schema ID
+        (optional, defaults to the schema's content). A changed schema under the
+        same ID is recompiled.
+    """
+    key = schema_id or _canonical(schema)
+    with _lock:
+        validator = _validators.get(key)
+        if validator is not None and (schema_id is None or validator.schema == schema):
+            _validators.move_to_end(key)
+            return validator
+    validator = SchemaValidator(schema)
+    with _lock:
+        _validators[key] = validator
+        while len(_validators) > CACHE_SIZE:
+            _validators.popitem(last=False)
+    return validator
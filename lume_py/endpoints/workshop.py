@@ -1,15 +1,15 @@
 from typing import List, Dict, Any, Optional
-from lume_py.endpoints.config import get_settings
+from lume_py.endpoints.config import get_client
+from lume_py.endpoints.sdk.binding import BoundModel
+from lume_py.endpoints.sdk.hooks import instrumented
 from lume_py.endpoints.results import Result
 from lume_py.endpoints.mappers import Mapping
 from .sdk.api_client import Pagination
 from http import HTTPMethod
 
-from pydantic import BaseModel
 
-settings = get_settings()
 
-class WorkShop(BaseModel):
+class WorkShop(BoundModel):
     id: Optional[str] = None
     user_id: Optional[str] = None
     pipeline_id: Optional[str] = None
@@ -23,6 +23,7 @@ class WorkShop(BaseModel):
     class Config:
         orm_mode = True
     @staticmethod
+    @instrumented("WorkShop.get_workshops")
     async def get_workshops(page: int = 1, size: int = 50, all: bool = False) -> List['WorkShop']:
         """
         Fetches all workshop data, iterating through pages until all workshops are retrieved.
@@ -35,15 +36,15 @@ class WorkShop(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET, url="workshops", pagination=pagination
                 )
                 workshops.extend([WorkShop(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET, url="workshops", pagination=pagination
             )
             workshops.extend([WorkShop(**item) for item in response["items"]])
@@ -51,59 +52,57 @@ class WorkShop(BaseModel):
         return workshops
 
     @classmethod
+    @instrumented("WorkShop.get_by_id")
     async def get_by_id(cls, workshop_id: str) -> 'WorkShop':
         """
         Retrieves details of a specific workshop.
         :param workshop_id: The ID of the workshop to fetch details for.
         :return: Workshop details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"workshops/{workshop_id}"
         )
         return cls(**response)
 
+    @instrumented("WorkShop.get_details")
     async def get_details(self) -> 'WorkShop':
         """
         Retrieves the details of this workshop.
         :return: The workshop details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"workshops/{self.id}"
         )
         return WorkShop(**response)
 
+    @instrumented("WorkShop.delete")
     async def delete(self) -> Dict[str, Any]:
         """
         Deletes a workshop with the specified ID.
         :return: Success message on successful deletion.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.DELETE, url=f"workshops/{self.id}"
         )
 
+    @instrumented("WorkShop.run_mapper")
     async def run_mapper(self, mapper: List[Dict[str, Any]], immediate: bool = False) -> Dict[str, Any]:
         """
         Runs the mapper of a workshop with the specified ID.
         :param mapper: Details required for running the mapper.
         :return: The result of running the mapper.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"workshops/{self.id}/mapper/run",
             json={"mapper": mapper},
         )
-        response_status = response["status"]
-
         if immediate:
             return Result(**response)
-        else:
-            while response_status in ["queued", "running"]:
-                response = await settings.client.request(
-                    method=HTTPMethod.GET, url=f'results/{response["id"]}'
-                )
-                response_status = response["status"]
-            return Result(**response)
+        response = await get_client().wait(f'results/{response["id"]}', response)
+        return Result(**response)
         
+    @instrumented("WorkShop.update_representative_sample")
     async def update_representative_sample(self, target_field_name: str, mapper: Dict[str, Any]) -> 'Mapping':
         """
         Runs the mapper of a workshop with the specified ID.
@@ -113,7 +112,7 @@ class WorkShop(BaseModel):
 
         if not self.pipeline_id:
             raise ValueError("Pipeline ID is required for fetching mapper.")
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.GET, url=f"pipelines/{self.pipeline_id}/mapper"
         )
         if response is None:
@@ -128,95 +127,76 @@ class WorkShop(BaseModel):
         if not updated_mapper:
             raise ValueError(f"Could not find {target_field_name} within the mapper")
         
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"workshops/{self.id}/mapper/run",
             json={"mapper": [updated_mapper]},
         )
         return Mapping(**response)
 
+    @instrumented("WorkShop.run_sample")
     async def run_sample(self, sample: Dict[str, Any], immediate: bool = False) -> Dict[str, Any]:
         """
         Runs a sample for the workshop with the specified ID.
         :param sample: Details required for running the sample.
         :return: The result of running the sample.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"workshops/{self.id}/sample/run",
             json={"sample": sample},
         )
-        response_status = response["status"]
-
         if immediate:
             return Result(**response)
-        else:
-            while response_status in ["queued", "running"]:
-                response = await settings.client.request(
-                    method=HTTPMethod.GET, url=f'results/{response["id"]}'
-                )
-                response_status = response["status"]
-            return Result(**response)
+        response = await get_client().wait(f'results/{response["id"]}', response)
+        return Result(**response)
 
+    @instrumented("WorkShop.run_target_schema")
     async def run_target_schema(self, target_schema: Dict[str, Any], immediate: bool = False) -> Dict[str, Any]:
         """
         Runs the target schema for the workshop with the specified ID.
         :param target_schema: Details required for running the target schema.
         :return: The result of running the target schema.
         """
-        # implement polling
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"workshops/{self.id}/target_schema/run",
             json={"target_schema": target_schema},
         )
-        response_status = response["status"]
-
         if immediate:
             return Result(**response)
-        else:
-            while response_status in ["queued", "running"]:
-                response = await settings.client.request(
-                    method=HTTPMethod.GET, url=f'results/{response["id"]}'
-                )
-                response_status = response["status"]
-
-            return Result(**response)
+        response = await get_client().wait(f'results/{response["id"]}', response)
+        return Result(**response)
 
+    @instrumented("WorkShop.run_prompt")
     async def run_prompt(self, target_fields_to_prompt: Dict[str, Any], immediate: bool = False) -> Dict[str, Any]:
         """
         Runs the prompts for the workshop with the specified ID.
         :param target_fields_to_prompt: Details required for running the prompt.
         :return: The result of running the prompt.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST,
             url=f"workshops/{self.id}/prompt/run",
             json={"target_fields_to_prompt": target_fields_to_prompt},
         )
-        response_status = response["status"]
-
         if immediate:
             return Result(**response)
-        else:
-            while response_status in ["queued", "running"]:
-                response = await settings.client.request(
-                    method=HTTPMethod.GET, url=f'results/{response["id"]}'
-                )
-                response_status = response["status"]
-
-            return Result(**response)
+        response = await get_client().wait(f'results/{response["id"]}', response)
+        return Result(**response)
 
+    @instrumented("WorkShop.deploy")
     async def deploy(self) -> Dict[str, Any]:
         """
         Deploys the workshop with the specified ID.
         :return: The deployed workshop details.
         """
-        response = await settings.client.request(
+        response = await get_client().request(
             method=HTTPMethod.POST, url=f"workshops/{self.id}/deploy"
         )
         return WorkShop(**response)
 
+    @instrumented("WorkShop.get_results")
     async def get_results(self, page: int = 1, size: int = 50, all: bool = False) -> List[Result]:
         """
         Retrieves results associated with a specific workshop, iterating through pages until all results are retrieved.
@@ -229,7 +209,7 @@ class WorkShop(BaseModel):
         pagination = Pagination(page=page, size=size)
         if all:
             while True:
-                response = await settings.client.request(
+                response = await get_client().request(
                     method=HTTPMethod.GET,
                     url=f"workshops/{self.id}/results",
                     pagination=pagination,
@@ -237,9 +217,9 @@ class WorkShop(BaseModel):
                 results.extend([Result(**item) for item in response["items"]])
                 if not response["items"] or len(response["items"]) < size:
                     break
-                page += 1
+                pagination.page += 1
         else:
-            response = await settings.client.request(
+            response = await get_client().request(
                 method=HTTPMethod.GET,
                 url=f"workshops/{self.id}/results",
                 pagination=pagination,
@@ -248,21 +228,23 @@ class WorkShop(BaseModel):
 
         return results
 
+    @instrumented("WorkShop.get_target_schema")
     async def get_target_schema(self) -> Dict[str, Any]:
         """
         Retrieves the target schema for a specific workshop.
         :return: The target schema for the workshop.
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"workshops/{self.id}/target_schema"
         )
 
+    @instrumented("WorkShop.get_mapping")
     async def get_mapping(self) -> List[Dict[str, Any]]:
         """
         Retreives the mappings transformations associated with the workshop.
         Returns:
             List[Dict[str, Any]]: The mapping
         """
-        return await settings.client.request(
+        return await get_client().request(
             method=HTTPMethod.GET, url=f"workshops/{self.id}/mapper"
         )
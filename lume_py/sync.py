@@ -0,0 +1,248 @@
+"""
+Synchronous facade over the async SDK.
+
+Every call is executed on one long-lived event loop running in a background
+thread, so the pooled ``httpx.AsyncClient`` of ``settings.client`` is reused
+across calls instead of being rebuilt by ``asyncio.run()`` for each one. The
+facade is safe to use from many threads at once; their calls run concurrently
+on the shared loop.
+
+    from lume_py import sync
+
+    sync.set_api_key("...")
+    pipeline = sync.Pipeline.get_pipeline_by_id("pipeline-id")
+    result = pipeline.create_job(source_data).run()
+
+Objects returned by the facade are synchronous views of the usual models;
+``.aio`` gives back the underlying async object. Methods returning async
+iterators, such as ``Result.generate_confidence_scores_many``, return plain iterators. ``sync.Pipeline.bind(client)``
+works as in the async API.
+"""
+import asyncio
+import atexit
+import functools
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from lume_py.endpoints.config import get_settings
+from lume_py.endpoints.excel import Excel as _Excel
+from lume_py.endpoints.jobs import Job as _Job
+from lume_py.endpoints.mappers import Mapping as _Mapping
+from lume_py.endpoints.pdf import PDF as _PDF
+from lume_py.endpoints.pipeline import Pipeline as _Pipeline
+from lume_py.endpoints.results import Result as _Result
+from lume_py.endpoints.sdk.binding import BoundEndpoint
+from lume_py.endpoints.sdk.handles import Handle
+from lume_py.endpoints.target import Target as _Target
+from lume_py.endpoints.workshop import WorkShop as _WorkShop
+
+T = TypeVar("T")
+
+
+class _LoopThread:
+    """
+    An event loop running forever in a daemon thread, started on first use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, args=(self._loop, ready), name="lume-sync-loop", daemon=True)
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, awaitable: Awaitable[T]) -> "Future[T]":
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("The lume_py.sync API cannot be called from its own event loop thread; await the async API instead.")
+        return asyncio.run_coroutine_threadsafe(_await(awaitable), self.loop)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+_runner = _LoopThread()
+atexit.register(_runner.shutdown, 5)
+
+
+def run(awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Runs an awaitable on the shared background loop and blocks until it completes.
+
+    :param awaitable: The coroutine to run, e.g. ``lume_py.Job.get_job_by_id(job_id)``.
+    :param timeout: Seconds to wait for the result (optional, defaults to no limit).
+    :return: The result of the awaitable.
+    :raises TimeoutError: If the timeout expires; the operation is cancelled.
+    """
+    future = _runner.submit(awaitable)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def submit(awaitable: Awaitable[T]) -> "Future[T]":
+    """
+    Schedules an awaitable on the shared background loop without blocking.
+
+    :return: A ``concurrent.futures.Future`` for its result.
+    """
+    return _runner.submit(awaitable)
+
+
+def shutdown(timeout: Optional[float] = None) -> None:
+    """
+    Stops the background loop. It is started again by the next call.
+    """
+    _runner.shutdown(timeout)
+
+
+def set_api_key(api_key: str) -> None:
+    get_settings().set_api_key(api_key)
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, SyncProxy):
+        return value.aio
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, (BaseModel, BoundEndpoint, Handle)):
+        return SyncProxy(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_wrap(item) for item in value)
+    return value
+
+
+def _iterate(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Yields the items of an async iterator, fetching each one on the shared background loop.
+    """
+    try:
+        while True:
+            try:
+                item = run(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield _wrap(item)
+    finally:
+        if hasattr(iterator, "aclose"):
+            run(iterator.aclose())
+
+
+class SyncProxy:
+    """
+    Synchronous view of an SDK class or model instance.
+
+    Coroutine methods are run on the shared background loop; models in their
+    results are wrapped again. Other attributes are read and written through.
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target: Any):
+        object.__setattr__(self, "_target", target)
+
+    @property
+    def aio(self) -> Any:
+        """
+        The wrapped async class or object.
+        """
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if name == "bind":
+            return lambda client: _wrap(value(client))
+        if not inspect.iscoroutinefunction(value):
+            if not (inspect.isfunction(value) or inspect.ismethod(value)):
+                return value
+
+            @functools.wraps(value)
+            def call_plain(*args: Any, **kwargs: Any) -> Any:
+                args = [_unwrap(arg) for arg in args]
+                kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+                result = value(*args, **kwargs)
+                # Async iterators, e.g. ``Result.generate_confidence_scores_many``, are driven on the loop.
+                return _iterate(result) if isinstance(result, AsyncIterator) else result
+
+            return call_plain
+
+        @functools.wraps(value)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            args = [_unwrap(arg) for arg in args]
+            kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+            return _wrap(run(value(*args, **kwargs)))
+
+        return call
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target, name, value)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return _wrap(self._target(*args, **kwargs))
+
+    def __eq__(self, other: Any) -> bool:
+        return self._target == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"sync({self._target!r})"
+
+    def __dir__(self):
+        return dir(self._target)
+
+
+Pipeline = SyncProxy(_Pipeline)
+Job = SyncProxy(_Job)
+Result = SyncProxy(_Result)
+Target = SyncProxy(_Target)
+WorkShop = SyncProxy(_WorkShop)
+Mapping = SyncProxy(_Mapping)
+Excel = SyncProxy(_Excel)
+PDF = SyncProxy(_PDF)
+
+__all__ = [
+    'Pipeline', 'Job', 'Result', 'Target', 'WorkShop', 'Mapping', 'Excel', 'PDF',
+    'SyncProxy', 'run', 'submit', 'shutdown', 'set_api_key',
+]
@@ -0,0 +1,252 @@
+"""
+In-memory stand-in for the Lume API.
+
+The stand-in is mounted as an ``httpx.MockTransport`` so every call still goes
+through ``Lume.request`` exactly as it would against the real service. It is
+used by the offline tests and by the ``benchmarks`` suite.
+"""
+import asyncio
+import itertools
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from lume_py.endpoints.config import get_settings
+from lume_py.endpoints.sdk.api_client import Lume
+
+COLLECTIONS = ("pipelines", "jobs", "results", "workshops", "target_schemas")
+
+_PREFIXES = {
+    "pipelines": "pipe",
+    "jobs": "job",
+    "results": "res",
+    "workshops": "ws",
+    "target_schemas": "ts",
+    "mappings": "map",
+}
+
+
+class StandInServer:
+    """
+    A small, deterministic fake of the Lume REST API.
+
+    :param latency: Seconds every request is delayed before it is answered.
+    :param run_duration: Seconds a run (job, workshop, pipeline, confidence) stays
+        ``running`` before it is reported as ``finished``.
+    :param mappings_per_result: Number of mapping rows served by ``results/{id}/mappings``.
+    :param filtering: Whether collection listings honour the ``updated_since`` filter.
+    :param push: The completion channel offered for ``results/{id}`` and ``mappings/{id}``:
+        ``"sse"`` serves ``{url}/events``, ``"long-poll"`` serves ``{url}/wait``, and
+        ``None`` offers neither so clients have to poll.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        run_duration: float = 0.0,
+        mappings_per_result: int = 0,
+        push: Optional[str] = None,
+        filtering: bool = False,
+    ):
+        self.latency = latency
+        self.run_duration = run_duration
+        self.mappings_per_result = mappings_per_result
+        self.push = push
+        self.filtering = filtering
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in COLLECTIONS}
+        self.mappings: Dict[str, Dict[str, Any]] = {}
+        self.request_counts: Counter = Counter()
+        self._ids = itertools.count(1)
+        self._started: Dict[str, float] = {}
+        self._faults: List[int] = []
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.request_counts.values())
+
+    def reset_counts(self) -> None:
+        self.request_counts.clear()
+
+    def add(self, collection: str, **fields: Any) -> Dict[str, Any]:
+        """
+        Stores a record in one of the stand-in collections.
+
+        :param collection: One of ``COLLECTIONS``.
+        :param fields: Fields of the record; ``id`` and timestamps are filled in when missing.
+        :return: The stored record.
+        """
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        record = {"id": f"{_PREFIXES[collection]}-{next(self._ids)}", "created_at": now, "updated_at": now}
+        record.update(fields)
+        self.collections[collection][record["id"]] = record
+        return record
+
+    def seed(self, collection: str, count: int, **fields: Any) -> List[Dict[str, Any]]:
+        """
+        Stores ``count`` records with the same fields in a collection.
+        """
+        return [self.add(collection, **fields) for _ in range(count)]
+
+    def fail(self, status_code: int, times: int = 1) -> None:
+        """
+        Answers the next ``times`` requests with ``status_code`` instead of handling them.
+        """
+        self._faults.extend([status_code] * times)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, api_key: str = "stand-in") -> Lume:
+        """
+        Creates a ``Lume`` client whose requests are answered by this server.
+        """
+        return Lume(api_key=api_key, transport=self.transport())
+
+    @contextmanager
+    def install(self) -> Iterator[Lume]:
+        """
+        Temporarily replaces the client of the global settings with one bound to this server.
+        """
+        settings = get_settings()
+        previous = settings.client
+        settings.client = self.client()
+        try:
+            yield settings.client
+        finally:
+            settings.client = previous
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        segments = request.url.path.strip("/").split("/")
+        route = "/".join(["{id}" if i == 1 else s for i, s in enumerate(segments)])
+        self.request_counts[(request.method, route)] += 1
+        if self._faults:
+            return httpx.Response(self._faults.pop(0), json={"detail": "Injected fault"})
+        if len(segments) == 3 and segments[0] in ("results", "mappings") and segments[2] in ("events", "wait"):
+            return await self._push(request, segments)
+        body = json.loads(request.content) if request.content else {}
+        try:
+            status_code, payload = self._dispatch(request.method, segments, request.url.params, body)
+        except KeyError:
+            status_code, payload = 404, {"detail": "Not Found"}
+        return httpx.Response(status_code, json=payload)
+
+    def _dispatch(self, method: str, segments: List[str], params: httpx.QueryParams, body: Dict[str, Any]) -> Tuple[int, Any]:
+        head, rest = segments[0], segments[1:]
+        if head in COLLECTIONS and not rest:
+            if method == "GET":
+                items = list(self.collections[head].values())
+                if self.filtering and "updated_since" in params:
+                    items = [item for item in items if item["updated_at"] >= params["updated_since"]]
+                return 200, self._page(items, params)
+            return 200, self.add(head, **body)
+        if head in COLLECTIONS and len(rest) == 1:
+            record = self.collections[head][rest[0]]
+            if method == "DELETE":
+                del self.collections[head][rest[0]]
+                return 200, {"detail": "deleted"}
+            if method == "PUT":
+                record.update(body)
+            if head == "results":
+                self._refresh(record)
+            return 200, record
+        if head == "pipelines" and rest[1:] == ["jobs"]:
+            return 200, self.add("jobs", pipeline_id=rest[0], status="created", data=body.get("data"))
+        if head in ("pipelines", "jobs") and rest[1:] == ["workshops"]:
+            key = "pipeline_id" if head == "pipelines" else "job_id"
+            if method == "POST":
+                return 200, self.add("workshops", status="created", **{key: rest[0]})
+            items = [w for w in self.collections["workshops"].values() if w.get(key) == rest[0]]
+            return 200, self._page(items, params)
+        if head in ("jobs", "workshops") and rest[1:] == ["results"]:
+            key = "job_id" if head == "jobs" else "workshop_id"
+            items = [r for r in self.collections["results"].values() if r.get(key) == rest[0]]
+            return 200, self._page(items, params)
+        if head == "jobs" and rest[1:] == ["run"]:
+            self.collections["jobs"][rest[0]]["status"] = "running"
+            return 200, self._start("results", job_id=rest[0])
+        if head == "workshops" and len(rest) == 3 and rest[2] == "run":
+            return 200, self._start("results", workshop_id=rest[0])
+        if head == "pipeline" and rest[1:] == ["run"]:
+            return 200, self._start("mappings", pipeline_id=rest[0], mapped_data=body.get("data"))
+        if head == "mappings" and len(rest) == 1:
+            return 200, self._refresh(self.mappings[rest[0]])
+        if head == "results" and rest[1:] == ["mappings"]:
+            return 200, self._mappings_page(rest[0], params)
+        if head == "results" and rest[1:] == ["confidence"]:
+            confidence = self.collections["results"][rest[0]].setdefault("confidence", {"status": "queued"})
+            if method == "POST":
+                self._started[f"{rest[0]}/confidence"] = time.monotonic()
+            elif time.monotonic() - self._started.get(f"{rest[0]}/confidence", 0.0) >= self.run_duration:
+                confidence.update(status="finished", scores={"overall": 0.9})
+            return 200, dict(confidence)
+        raise KeyError(segments)
+
+    async def _push(self, request: httpx.Request, segments: List[str]) -> httpx.Response:
+        kind, record_id, channel = segments
+        records = self.mappings if kind == "mappings" else self.collections["results"]
+        offered = {"sse": "events", "long-poll": "wait"}.get(self.push)
+        if channel != offered or record_id not in records:
+            return httpx.Response(404, json={"detail": "Not Found"})
+        record = records[record_id]
+        if channel == "wait":
+            status = request.url.params.get("status")
+            deadline = time.monotonic() + float(request.url.params.get("timeout", 30))
+            while record_id in self._started and self._refresh(record)["status"] == status and time.monotonic() < deadline:
+                await asyncio.sleep(min(self._remaining(record_id), deadline - time.monotonic()))
+            return httpx.Response(200, json=dict(record))
+
+        async def stream():
+            yield f"data: {json.dumps(self._refresh(record))}\n\n".encode()
+            while record_id in self._started and record["status"] in ("queued", "running"):
+                await asyncio.sleep(self._remaining(record_id))
+                yield f"event: status\ndata: {json.dumps(self._refresh(record))}\n\n".encode()
+
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream())
+
+    def _remaining(self, record_id: str) -> float:
+        started = self._started.get(record_id, 0.0)
+        return max(started + self.run_duration - time.monotonic(), 0.0)
+
+    def _start(self, kind: str, **fields: Any) -> Dict[str, Any]:
+        if kind == "mappings":
+            record = {"id": f"map-{next(self._ids)}", "status": "queued", **fields}
+            self.mappings[record["id"]] = record
+        else:
+            record = self.add(kind, status="queued", **fields)
+        self._started[record["id"]] = time.monotonic()
+        return dict(record)
+
+    def _refresh(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        started = self._started.get(record["id"])
+        if started is not None and record["status"] in ("queued", "running"):
+            done = time.monotonic() - started >= self.run_duration
+            record["status"] = "finished" if done else "running"
+            record["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        return record
+
+    def _page(self, items: List[Dict[str, Any]], params: httpx.QueryParams) -> Dict[str, Any]:
+        page, size = int(params.get("page", 1)), int(params.get("size", 50))
+        start = (page - 1) * size
+        return {"items": items[start:start + size], "total": len(items), "page": page, "size": size}
+
+    def _mappings_page(self, result_id: str, params: httpx.QueryParams) -> Dict[str, Any]:
+        page, size = int(params.get("page", 1)), int(params.get("size", 50))
+        start = (page - 1) * size
+        stop = min(start + size, self.mappings_per_result)
+        items = [
+            {
+                "result_id": result_id,
+                "index": index,
+                "source_record": {"first_name": f"first-{index}", "last_name": f"last-{index}", "row": index},
+                "mapped_record": {"f_name": f"first-{index}", "l_name": f"last-{index}"},
+                "messsage": None,
+            }
+            for index in range(start, stop)
+        ]
+        return {"items": items, "total": self.mappings_per_result, "page": page, "size": size}
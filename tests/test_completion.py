@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+RUN = 0.3
+
+
+async def run_job(server: StandInServer, client) -> lume.Result:
+    pipeline = server.add("pipelines", name="completion")
+    job = await lume.Job.bind(client).create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+    return await job.run()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("push, route", [("sse", "results/{id}/events"), ("long-poll", "results/{id}/wait")])
+async def test_push_channel_delivers_completion(push, route):
+    server = StandInServer(run_duration=RUN, push=push)
+    client = server.client()
+
+    started = time.perf_counter()
+    result = await run_job(server, client)
+    elapsed = time.perf_counter() - started
+
+    assert result.status == "finished"
+    assert elapsed < RUN + 0.1
+    # One stream, or one long-poll per status change (queued -> running -> finished).
+    assert 1 <= server.request_counts[("GET", route)] <= 2
+    assert server.request_counts[("GET", "results/{id}")] == 0
+    assert client._wait_channels["results/{id}"] == push
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_backoff_polling_and_remembers_it():
+    server = StandInServer(run_duration=RUN)
+    client = server.client()
+
+    result = await run_job(server, client)
+    await run_job(server, client)
+
+    assert result.status == "finished"
+    assert client._wait_channels["results/{id}"] == "poll"
+    # Probed once per client, not once per wait.
+    assert server.request_counts[("GET", "results/{id}/events")] == 1
+    assert server.request_counts[("GET", "results/{id}/wait")] == 1
+    # Backoff keeps the number of polls well below one per event loop tick.
+    assert server.request_counts[("GET", "results/{id}")] < 12
+
+
+@pytest.mark.asyncio
+async def test_result_wait_times_out():
+    server = StandInServer(run_duration=5.0, push="sse")
+    client = server.client()
+    pipeline = server.add("pipelines", name="completion")
+    job = await lume.Job.bind(client).create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+    result = await job.run(immediate=True)
+
+    with pytest.raises(TimeoutError):
+        await result.wait(timeout=0.05)
+    await asyncio.sleep(0.01)
+    assert not client._waits
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waits_share_one_stream():
+    server = StandInServer(run_duration=RUN, push="sse")
+    client = server.client()
+    pipeline = server.add("pipelines", name="completion")
+    job = await lume.Job.bind(client).create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+    result = await job.run(immediate=True)
+    copies = [lume.Result.bind(client)(**result.model_dump()) for _ in range(5)]
+
+    waited = await asyncio.gather(*(copy.wait() for copy in copies))
+
+    assert all(item.status == "finished" for item in waited)
+    assert server.request_counts[("GET", "results/{id}/events")] == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk.api_client import Lume
+from lume_py.endpoints.sdk.concurrency import AdaptiveConcurrency
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat_and_backs_off_on_overload():
+    limiter = AdaptiveConcurrency(initial=4, maximum=50)
+
+    for _ in range(40):
+        # A full round trip: every slot in use, then all of them released.
+        slots = int(limiter.limits().get("GET results", 4))
+        for _ in range(slots):
+            await limiter.acquire("GET", "results")
+        for _ in range(slots):
+            limiter.release("GET", "results", 0.05, 200)
+    grown = limiter.limits()["GET results"]
+    assert grown > 15
+
+    limiter.release("GET", "results", 0.05, 429)
+    limiter.release("GET", "results", 0.05, 503)  # Same round trip: counted once.
+    assert limiter.limits()["GET results"] == pytest.approx(grown / 2, rel=0.01)
+
+    limiter._families["GET results"].cooldown_until = 0
+    limiter.release("GET", "results", 0.5, 200)  # Ten times the baseline.
+    assert limiter.limits()["GET results"] == pytest.approx(grown / 2 * 0.9, rel=0.01)
+    # Other families are tuned separately.
+    assert limiter._get("POST", "pipelines/{id}/jobs").limit == 4
+
+
+@pytest.mark.asyncio
+async def test_adapts_to_server_capacity():
+    server = StandInServer()
+    handle = server.handle
+    capacity = 8
+    in_flight = 0
+    peak = 0
+
+    async def overloaded_server(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            if in_flight > 2 * capacity:
+                return httpx.Response(503, json={"detail": "busy"})
+            await asyncio.sleep(0.005 * max(1.0, in_flight / capacity))
+            return await handle(request)
+        finally:
+            in_flight -= 1
+
+    server.handle = overloaded_server
+    limiter = AdaptiveConcurrency(initial=32, maximum=64)
+    client = Lume(api_key="key", transport=server.transport(), max_concurrency=limiter, max_retries=5)
+    pipeline = server.add("pipelines", name="contacts")
+
+    with lume.use_client(client):
+        results = await lume.gather([lume.Pipeline.get_pipeline_by_id(pipeline["id"]) for _ in range(600)])
+
+    assert not [result for result in results if isinstance(result, Exception)]
+    assert 2 <= limiter.limits()["GET pipelines/{id}"] <= 3 * capacity
+    assert peak <= 32
+
+
+@pytest.mark.asyncio
+async def test_fixed_limit_still_accepts_a_number():
+    server = StandInServer(latency=0.01)
+    client = Lume(api_key="key", transport=server.transport(), max_concurrency=2)
+    pipeline = server.add("pipelines", name="contacts")
+
+    with lume.use_client(client):
+        await lume.gather([lume.Pipeline.get_pipeline_by_id(pipeline["id"]) for _ in range(6)])
+
+    assert client.concurrency.limit == 2
+    assert client.metrics.snapshot()["queue_wait"]["pipelines/{id}"]["count"] == 6
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
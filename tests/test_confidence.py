@@ -0,0 +1,41 @@
+import time
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def scored_results(server: StandInServer, count: int):
+    client = server.client()
+    return [lume.Result.bind(client)(**record) for record in server.seed("results", count, status="finished")]
+
+
+@pytest.mark.asyncio
+async def test_scores_many_results_concurrently():
+    server = StandInServer(run_duration=0.1)
+    results = scored_results(server, 20)
+
+    started = time.perf_counter()
+    scored = [pair async for pair in lume.Result.generate_confidence_scores_many(results, max_concurrency=10)]
+    elapsed = time.perf_counter() - started
+
+    assert {result.id for result, _ in scored} == {result.id for result in results}
+    assert all(scores["status"] == "finished" for _, scores in scored)
+    assert elapsed < 1.0
+    assert server.request_counts[("POST", "results/{id}/confidence")] == 20
+
+
+@pytest.mark.asyncio
+async def test_per_result_errors_and_deadlines_do_not_stop_the_batch():
+    server = StandInServer(run_duration=5.0)
+    results = scored_results(server, 3)
+    server.fail(500)
+
+    scored = [pair async for pair in lume.Result.generate_confidence_scores_many(results, timeout=0.2)]
+
+    errors = sorted(type(scores).__name__ for _, scores in scored)
+    assert errors == ["HTTPStatusError", "TimeoutError", "TimeoutError"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,69 @@
+import json
+
+import lume_py as lume
+import pytest
+from lume_py.endpoints.dedup import Deduplicated
+from lume_py.testing import StandInServer
+
+ROWS = [
+    {"first_name": "John", "last_name": "Doe"},
+    {"first_name": "Ann", "last_name": "Lee"},
+    {"last_name": "Doe", "first_name": "John"},  # Same record, different key order.
+    {"first_name": "John", "last_name": "Doe"},
+    {"first_name": "Ann", "last_name": "Lee", "age": None},
+]
+
+
+def test_deduplicated_expands_in_original_order():
+    plan = Deduplicated(ROWS)
+
+    assert plan.unique == [ROWS[0], ROWS[1], ROWS[4]]
+    assert plan.positions == [0, 1, 0, 0, 2] and plan.counts == [3, 1, 1]
+    assert plan.rows == 5 and plan.duplicates == 2
+    assert plan.expand(["a", "b", "c"]) == ["a", "b", "a", "a", "c"]
+    with pytest.raises(ValueError):
+        plan.expand(["a"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("immediate", [True, False])
+async def test_run_pipeline_sends_unique_records(immediate):
+    server = StandInServer()
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts"))
+    sent = []
+    handle = server.handle
+
+    async def recording(request):
+        if request.url.path.endswith("/run"):
+            sent.append(json.loads(request.content)["data"])
+        return await handle(request)
+
+    server.handle = recording
+    with server.install():
+        mapping = await pipeline.run_pipeline(ROWS, immediate=immediate, dedup=True)
+        details = await mapping.get_details()
+
+    assert sent == [[ROWS[0], ROWS[1], ROWS[4]]]
+    assert mapping.mapped_data == [ROWS[0], ROWS[1], ROWS[0], ROWS[0], ROWS[4]]
+    assert details.mapped_data == mapping.mapped_data
+
+
+@pytest.mark.asyncio
+async def test_job_mappings_expand_to_original_rows():
+    server = StandInServer(mappings_per_result=3)
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts"))
+
+    with server.install():
+        job = await pipeline.create_job(ROWS, dedup=True)
+        result = await job.run()
+        mappings = await result.get_mappings(all=True)
+        plain = await (await (await lume.Job.create(pipeline.id, ROWS)).run()).get_mappings(all=True)
+
+    stored = server.collections["jobs"][job.id]["data"]
+    assert len(stored) == 3 and len(plain) == 3
+    assert [m.index for m in mappings] == [0, 1, 2, 3, 4]
+    assert [m.source_record["row"] for m in mappings] == [0, 1, 0, 0, 2]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,126 @@
+import hashlib
+import os
+
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk.downloads import Downloader
+from lume_py.testing import StandInServer
+
+DATA = os.urandom(100_000)
+CHECKSUM = "sha256:" + hashlib.sha256(DATA).hexdigest()
+
+
+class FileServer:
+    """
+    Serves ``DATA`` with range support, failing chosen requests.
+    """
+
+    def __init__(self, ranges: bool = True, length: bool = True):
+        self.ranges = ranges
+        self.length = length
+        self.requests = []
+        self.failures = {}  # Range start -> "drop" (truncated body) or a status code.
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        assert "lume-api-key" not in request.headers
+        header = request.headers.get("Range")
+        self.requests.append(header)
+        if not self.ranges or header is None:
+            return httpx.Response(200, content=DATA)
+        start, end = (int(part) for part in header.removeprefix("bytes=").split("-"))
+        failure = self.failures.pop(start, None)
+        if isinstance(failure, int):
+            return httpx.Response(failure)
+        body = DATA[start:end + 1]
+        if failure == "drop":
+            body = body[: len(body) // 2]
+        headers = {"Content-Range": f"bytes {start}-{end}/{len(DATA) if self.length else '*'}", "ETag": '"v1"'}
+        return httpx.Response(206, headers=headers, content=body)
+
+    def downloader(self, **options) -> Downloader:
+        return Downloader(chunk_size=16_384, transport=httpx.MockTransport(self.handle), **options)
+
+
+@pytest.mark.asyncio
+async def test_parallel_chunks_with_retries(tmp_path):
+    server = FileServer()
+    server.failures = {16_384: "drop", 32_768: 503}
+    path = str(tmp_path / "out.pdf")
+
+    async with server.downloader() as downloader:
+        download = await downloader.download("https://files.example/out.pdf", path, checksum=CHECKSUM)
+
+    assert open(path, "rb").read() == DATA
+    assert download.chunks == 7 and download.retries == 2 and download.size == len(DATA)
+    # The dropped chunk resumes from the byte where it was cut off.
+    assert "bytes=24576-32767" in server.requests
+    assert not os.path.exists(path + ".part") and not os.path.exists(path + ".part.json")
+
+
+@pytest.mark.asyncio
+async def test_resumes_after_interruption(tmp_path):
+    server = FileServer()
+    server.failures = {49_152: 500}
+    path = str(tmp_path / "out.pdf")
+
+    async with server.downloader(max_retries=0, connections=1) as downloader:
+        with pytest.raises(httpx.HTTPError):
+            await downloader.download("https://files.example/a", path)
+        assert os.path.exists(path + ".part.json")
+        server.requests.clear()
+        download = await downloader.download("https://files.example/b", path, size=len(DATA))
+        skipped = await downloader.download("https://files.example/b", path, size=len(DATA), checksum=CHECKSUM)
+
+    assert open(path, "rb").read() == DATA
+    assert download.resumed_chunks == 3 and len(server.requests) == 1 + 4
+    assert skipped.skipped
+
+
+@pytest.mark.asyncio
+async def test_without_range_support_and_bad_checksum(tmp_path):
+    server = FileServer(ranges=False)
+    path = str(tmp_path / "out.xlsx")
+
+    async with server.downloader() as downloader:
+        download = await downloader.download("https://files.example/out.xlsx", path, size=len(DATA))
+        with pytest.raises(ValueError):
+            await downloader.download("https://files.example/out.xlsx", str(tmp_path / "bad"), checksum="sha256:00")
+
+    assert open(path, "rb").read() == DATA and download.chunks == 1
+    assert not os.path.exists(tmp_path / "bad") and not os.path.exists(tmp_path / "bad.part")
+
+
+@pytest.mark.asyncio
+async def test_partial_probe_without_total_fetches_whole_file(tmp_path):
+    server = FileServer(length=False)
+    path = str(tmp_path / "out.pdf")
+
+    async with server.downloader() as downloader:
+        download = await downloader.download("https://files.example/out.pdf", path)
+
+    assert open(path, "rb").read() == DATA and download.size == len(DATA)
+    assert server.requests == ["bytes=0-0", None]
+
+
+@pytest.mark.asyncio
+async def test_pdf_download_uses_a_separate_pool(tmp_path):
+    files = FileServer()
+    server = StandInServer()
+    handle = server.handle
+
+    async def with_urls(request):
+        if request.url.path == "/pdf/orders/7/url":
+            return httpx.Response(200, json={"url": "https://files.example/7.pdf?signature=abc"})
+        return await handle(request)
+
+    server.handle = with_urls
+    with server.install():
+        download = await lume.PDF.download_pdf(7, str(tmp_path / "7.pdf"), checksum=CHECKSUM, downloader=files.downloader())
+
+    assert download.path == str(tmp_path / "7.pdf") and download.size == len(DATA)
+    assert files.requests[0] == "bytes=0-0"
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,48 @@
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_experiment_runs_grid_concurrently():
+    server = StandInServer(run_duration=0.1, mappings_per_result=2, push="sse")
+    pipeline = lume.Pipeline.bind(server.client())(**server.add("pipelines", name="experiment"))
+    experiment = lume.WorkShopExperiment(
+        pipeline,
+        prompts={"short": {"f_name": "first name"}, "strict": {"f_name": "first name only"}},
+        samples={"john": {"first_name": "John"}, "jane": {"first_name": "Jane"}},
+        max_concurrency=4,
+    )
+
+    report = await experiment.run()
+
+    assert [row.variant for row in report.rows] == ["short / john", "short / jane", "strict / john", "strict / jane"]
+    assert not report.failed
+    assert len({row.workshop_id for row in report.rows}) == 4
+    assert all(len(row.mapped_records) == 2 for row in report.rows)
+    # Two sequential steps per variant, all variants in parallel.
+    assert report.seconds < 0.6
+    assert server.request_counts[("POST", "workshops/{id}/prompt/run")] == 4
+    assert server.request_counts[("POST", "workshops/{id}/sample/run")] == 4
+    table = report.table(["variant", "prompt", "sample", "status"])
+    assert table.splitlines()[2].split() == ["short", "/", "john", "short", "john", "finished"]
+
+
+@pytest.mark.asyncio
+async def test_failing_variant_is_reported_in_its_row():
+    server = StandInServer()
+    pipeline = lume.Pipeline.bind(server.client())(**server.add("pipelines", name="experiment"))
+    server.fail(500)
+
+    report = await lume.WorkShopExperiment(pipeline, samples={"john": {"first_name": "John"}}).run()
+
+    assert report.failed and "HTTPStatusError" in report.rows[0].error
+
+
+def test_grid_needs_a_variant():
+    with pytest.raises(ValueError):
+        lume.WorkShopExperiment(lume.Pipeline(id="pipe-1")).variants()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
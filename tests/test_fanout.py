@@ -0,0 +1,76 @@
+import asyncio
+import functools
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_gather_mixed_operations_with_per_item_errors():
+    server = StandInServer(run_duration=0.05, push="sse")
+    client = server.client()
+    workshop = lume.WorkShop.bind(client)(**server.add("workshops", status="created"))
+    pipeline = lume.Pipeline.bind(client)(**server.add("pipelines", name="fanout"))
+    job = await pipeline.create_job([{"a": 1}])
+
+    results = await lume.gather([
+        workshop.run_sample({"first_name": "John"}),
+        functools.partial(workshop.run_prompt, {"f_name": "first name only"}),
+        pipeline.run_pipeline([{"a": 1}]),
+        job.run(),
+        lume.Job.bind(client).get_job_by_id("missing"),
+    ], max_concurrency=2)
+
+    assert [type(item).__name__ for item in results] == ["Result", "Result", "Mapping", "Result", "HTTPStatusError"]
+    assert all(item.status == "finished" for item in results[:4])
+
+
+@pytest.mark.asyncio
+async def test_budget_is_shared_across_calls():
+    running, peak = 0, 0
+
+    async def operation():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    budget = asyncio.Semaphore(3)
+    results = await asyncio.gather(
+        lume.gather([operation for _ in range(10)], max_concurrency=budget),
+        lume.gather([operation() for _ in range(10)], max_concurrency=budget),
+    )
+
+    assert sum(map(len, results)) == 20
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_as_completed_reports_input_index():
+    delays = [0.06, 0.0, 0.03]
+    order = [handle.index async for handle in lume.as_completed([asyncio.sleep(d, d) for d in delays], max_concurrency=3)]
+
+    assert order == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_gather_timeout_cancels_stragglers():
+    results = await lume.gather([asyncio.sleep(0, "fast"), asyncio.sleep(5)], timeout=0.05, max_concurrency=1)
+
+    assert results[0] == "fast"
+    assert isinstance(results[1], TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_rejects_a_budget_below_one():
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(lume.gather([asyncio.sleep(0)], max_concurrency=0), 1)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(anext(lume.as_completed([asyncio.sleep(0)], max_concurrency=0)), 1)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,88 @@
+import asyncio
+
+import lume_py as lume
+import pytest
+from lume_py import sync
+from lume_py.testing import StandInServer
+
+
+async def submit_jobs(server: StandInServer, client, count: int):
+    pipeline = server.add("pipelines", name="handles")
+    jobs = [await lume.Job.bind(client).create(pipeline_id=pipeline["id"], source_data=[{"a": i}]) for i in range(count)]
+    return await asyncio.gather(*(job.submit() for job in jobs))
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_handle():
+    server = StandInServer(run_duration=0.1)
+    [handle] = await submit_jobs(server, server.client(), 1)
+    seen = []
+    handle.add_done_callback(seen.append)
+
+    assert handle.result_id and not handle.done()
+    result = await handle.wait(timeout=5)
+
+    assert result.status == "finished" and result.id == handle.result_id
+    assert handle.done() and handle.result() is result
+    await asyncio.sleep(0)
+    assert seen == [handle]
+
+
+@pytest.mark.asyncio
+async def test_wait_timeout_keeps_running_and_cancel_stops():
+    server = StandInServer(run_duration=5.0)
+    [handle] = await submit_jobs(server, server.client(), 1)
+
+    with pytest.raises(TimeoutError):
+        await handle.wait(timeout=0.05)
+    assert not handle.done()
+
+    assert handle.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await handle.wait()
+    assert handle.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_as_completed_yields_in_completion_order():
+    server = StandInServer(push="sse")
+    client = server.client()
+    handles = await submit_jobs(server, client, 3)
+    slow = lume.Handle(asyncio.sleep(0.2, "slow"))
+
+    order = [handle async for handle in lume.as_completed([slow, *handles], timeout=5)]
+
+    assert order[-1] is slow
+    assert {h.result().status for h in order[:-1]} == {"finished"}
+
+
+@pytest.mark.asyncio
+async def test_as_completed_timeout():
+    with pytest.raises(TimeoutError):
+        async for _ in lume.as_completed([asyncio.sleep(1)], timeout=0.05):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_confidence_scores_keep_http_errors():
+    server = StandInServer()
+    result = lume.Result.bind(server.client())(**server.add("results", status="finished"))
+    server.fail(500)
+
+    with pytest.raises(Exception) as error:
+        await result.generate_confidence_scores(timeout=5)
+    assert not isinstance(error.value, TimeoutError)
+
+
+def test_sync_handle():
+    server = StandInServer(run_duration=0.05)
+    pipeline = server.add("pipelines", name="handles")
+    with server.install():
+        job = sync.Job.create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+        handle = job.submit()
+        assert handle.wait(5).status == "finished"
+        assert handle.done()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
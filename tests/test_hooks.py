@@ -0,0 +1,79 @@
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk.hooks import route_template
+from lume_py.testing import StandInServer
+
+
+def test_route_template():
+    assert route_template("results/res-1") == "results/{id}"
+    assert route_template("https://api.lume.ai/pipeline/abc/run?x=1") == "pipeline/{id}/run"
+    assert route_template("pipelines/populate/sheets") == "pipelines/populate/sheets"
+    assert route_template("https://staging.lume-terminus.com/crud/excel/pivot/7/url") == "crud/excel/pivot/{id}/url"
+
+
+@pytest.mark.asyncio
+async def test_job_run_emits_request_and_poll_events():
+    server = StandInServer(run_duration=0.01)
+    pipeline = server.add("pipelines", name="hooks")
+    events = []
+
+    with server.install() as client:
+        client.hooks.on("*", events.append)
+        job = await lume.Job.create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+        result = await job.run()
+
+    assert result.status == "finished"
+    types = [event.type for event in events]
+    assert types[0] == "operation_start" and types[-1] == "operation_end"
+    ends = [event for event in events if event.type == "request_end"]
+    assert ends[0].route == "pipelines/{id}/jobs"
+    assert ends[0].request_size > 0 and ends[0].response_size > 0
+    assert {event.operation for event in ends} == {"Job.create", "Job.run"}
+    ticks = [event for event in events if event.type == "poll_tick"]
+    assert ticks and ticks[-1].status == "finished"
+    assert [event for event in events if event.type == "poll_end"][0].attempt == len(ticks)
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_are_retried():
+    server = StandInServer()
+    pipeline = server.add("pipelines", name="retry")
+    server.fail(503, times=1)
+    retries = []
+
+    with server.install() as client:
+        client.max_retries = 2
+        client.hooks.on("retry", retries.append)
+        fetched = await lume.Pipeline.get_pipeline_by_id(pipeline["id"])
+
+    assert fetched.id == pipeline["id"]
+    assert [(event.attempt, event.status_code) for event in retries] == [(1, 503)]
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_spans_per_endpoint_method():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from lume_py.endpoints.sdk.telemetry import instrument_opentelemetry
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    server = StandInServer()
+    pipeline = server.add("pipelines", name="otel")
+
+    with server.install() as client:
+        instrument_opentelemetry(client, tracer_provider=provider)
+        await lume.Pipeline(**pipeline).run_pipeline([{"a": 1}])
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    operation = spans["lume Pipeline.run_pipeline"]
+    request = spans["POST pipeline/{id}/run"]
+    assert request.parent.span_id == operation.context.span_id
+    assert request.attributes["http.response.status_code"] == 200
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+import lume_py as lume
+from lume_py.endpoints.sdk.api_client import Lume
+from lume_py.testing import StandInServer
+
+
+def loaded_modules(code: str) -> set:
+    script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    modules = loaded_modules("import lume_py")
+    assert "lume_py.endpoints.jobs" not in modules
+    assert "httpx" not in modules
+    assert "pydantic_settings" not in modules
+
+
+def test_endpoint_import_defers_http_stack():
+    modules = loaded_modules("from lume_py import Job")
+    assert "lume_py.endpoints.jobs" in modules
+    assert "lume_py.endpoints.excel" not in modules
+    assert "httpx" not in modules
+
+
+def test_lazy_names():
+    from lume_py.endpoints.pipeline import Pipeline, PipelineCreatePayload
+    import lume_py.endpoints as endpoints
+
+    assert lume.Pipeline is Pipeline
+    assert endpoints.PipelineCreatePayload is PipelineCreatePayload
+    assert set(lume.__all__) <= set(dir(lume))
+    with pytest.raises(AttributeError):
+        lume.NotAnEndpoint
+
+
+@pytest.mark.asyncio
+async def test_http_client_created_on_first_request():
+    server = StandInServer()
+    job = server.add("jobs", status="created")
+    client = Lume(api_key="stand-in", transport=server.transport())
+    assert client._client is None
+
+    fetched = await lume.Job.bind(client).get_job_by_id(job["id"])
+
+    assert fetched.id == job["id"]
+    assert client._client is not None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def records(count: int):
+    for index in range(count):
+        record = {
+            "id": f"{index:08x}-0000-4000-8000-000000000000",
+            "name": f"name-{index}",
+            "age": index if index % 3 else float(index) + 0.5,
+            "status": ("active", "inactive")[index % 2],
+            "joined": "2024-01-%02d" % (index % 28 + 1),
+            "email": f"user{index}@example.com" if index % 5 else None,
+            "address": {"zip": "941%02d" % (index % 100), "city": "SF"},
+            "tags": ["a", "b"][: index % 3],
+        }
+        if index % 4 == 0:
+            record["nickname"] = "n"
+        yield record
+
+
+def test_infers_types_nullability_enums_and_formats():
+    schema = lume.infer_schema(records(1000))
+
+    properties = schema["properties"]
+    assert schema["type"] == "object"
+    assert schema["required"] == ["id", "name", "age", "status", "joined", "email", "address", "tags"]
+    assert properties["id"] == {"type": "string", "format": "uuid"}
+    assert properties["name"] == {"type": "string"}
+    assert properties["age"] == {"type": "number"}
+    assert properties["status"] == {"type": "string", "enum": ["active", "inactive"]}
+    assert properties["joined"] == {"type": "string", "format": "date"}
+    assert properties["email"] == {"type": ["string", "null"], "format": "email"}
+    assert properties["address"]["properties"]["zip"] == {"type": "string"}
+    assert properties["address"]["required"] == ["zip", "city"]
+    assert properties["tags"] == {"type": "array", "items": {"type": "string", "enum": ["a", "b"]}}
+    assert properties["nickname"] == {"type": "string", "enum": ["n"]}
+
+
+def test_inferred_schema_accepts_its_records():
+    schema = lume.infer_schema(records(500))
+
+    assert lume.SchemaValidator(schema).validate_many(list(records(500))).valid
+
+
+def test_incremental_updates_widen_the_schema():
+    inferrer = lume.SchemaInferrer(max_enum=3)
+    inferrer.update([{"code": "a", "count": 1}, {"code": "a", "count": 2}])
+    assert inferrer.schema()["properties"] == {"code": {"type": "string", "enum": ["a"]}, "count": {"type": "integer"}}
+
+    inferrer.update({"code": code, "count": "many"} for code in "abcd")
+
+    assert inferrer.records == 6
+    assert inferrer.schema()["properties"] == {"code": {"type": "string"}, "count": {"type": ["integer", "string"]}}
+    with pytest.raises(ValueError):
+        lume.SchemaInferrer().schema()
+
+
+@pytest.mark.asyncio
+async def test_create_from_records():
+    server = StandInServer()
+    offloaded = []
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            offloaded.append(fn.func.__name__)
+            return super().submit(fn, *args, **kwargs)
+
+    with Executor(max_workers=1) as executor:
+        client = lume.Client("stand-in", transport=server.transport(), executor=executor)
+        target = await lume.Target.bind(client).create_from_records(records(50), name="contacts")
+
+    assert target.name == "contacts" and offloaded == ["infer_schema"]
+    assert target.schema == lume.infer_schema(records(50))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
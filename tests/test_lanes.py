@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk.api_client import Lume
+from lume_py.endpoints.sdk.lanes import current_lane
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_requests_are_assigned_to_lanes():
+    server = StandInServer(run_duration=0.05)
+    handle = server.handle
+    lanes = []
+
+    async def recording(request):
+        lanes.append((request.method, request.url.path, current_lane()))
+        return await handle(request)
+
+    server.handle = recording
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts"))
+    with server.install() as client:
+        client.poll_interval = 0.01
+        client.wait_strategy = "poll"
+        await lume.Pipeline.get_all_pipelines()
+        await lume.Pipeline.get_pipeline_by_id(pipeline.id)
+        with lume.lane("bulk"):
+            job = await pipeline.create_job([{"a": 1}])
+        await job.run()
+
+    assert lanes[0] == ("GET", "/pipelines", "bulk")
+    assert lanes[1] == ("GET", f"/pipelines/{pipeline.id}", "interactive")
+    assert lanes[2] == ("POST", f"/pipelines/{pipeline.id}/jobs", "bulk")
+    assert lanes[3] == ("POST", f"/jobs/{job.id}/run", "interactive")
+    assert {lane for _, path, lane in lanes[4:]} == {"bulk"}  # Polling the result.
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_skip_the_bulk_queue():
+    server = StandInServer(latency=0.05)
+    handle = server.handle
+    in_flight = {"bulk": 0, "interactive": 0}
+    peak = {"bulk": 0, "interactive": 0}
+
+    async def counting(request):
+        name = current_lane()
+        in_flight[name] += 1
+        peak[name] = max(peak[name], in_flight[name])
+        try:
+            return await handle(request)
+        finally:
+            in_flight[name] -= 1
+
+    server.handle = counting
+    lanes = lume.PriorityLanes(limit=4, reserved={"interactive": 1})
+    client = Lume(api_key="key", transport=server.transport(), max_concurrency=lanes)
+    pipeline = server.add("pipelines", name="contacts")
+
+    with lume.use_client(client):
+        with lume.lane("bulk"):
+            batch = asyncio.ensure_future(lume.gather([lume.Pipeline.get_pipeline_by_id(pipeline["id"]) for _ in range(30)]))
+        await asyncio.sleep(0.06)
+        assert lanes.snapshot()["bulk"]["queued"] > 20
+        started = time.perf_counter()
+        await lume.Pipeline.get_pipeline_by_id(pipeline["id"])
+        interactive = time.perf_counter() - started
+        await batch
+
+    # One round trip, not the ~0.4s the queued bulk requests still need.
+    assert interactive < 0.15
+    assert peak["bulk"] == 3 and lanes.snapshot()["bulk"]["in_flight"] == 0
+
+
+def test_reserved_slots_must_leave_room():
+    with pytest.raises(ValueError):
+        lume.PriorityLanes(limit=4, reserved={"interactive": 4})
+    with pytest.raises(ValueError):
+        lume.PriorityLanes(limit=4, reserved={"urgent": 1})
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,84 @@
+import asyncio
+
+import lume_py as lume
+import pytest
+from lume_py.endpoints.settings import Settings
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_pool():
+    server = StandInServer()
+    job = server.add("jobs", status="created")
+
+    async with lume.Client("stand-in", transport=server.transport()) as client:
+        fetched = await lume.Job.bind(client).get_job_by_id(job["id"])
+
+    assert fetched.id == job["id"]
+    assert client.closed and client.client.is_closed
+    with pytest.raises(RuntimeError):
+        await lume.Job.bind(client).get_job_by_id(job["id"])
+
+
+@pytest.mark.asyncio
+async def test_aclose_drains_in_flight_requests():
+    server = StandInServer(latency=0.05)
+    job = server.add("jobs", status="created")
+    client = lume.Client("stand-in", transport=server.transport())
+
+    pending = asyncio.create_task(lume.Job.bind(client).get_job_by_id(job["id"]))
+    await asyncio.sleep(0.01)
+    await client.aclose()
+
+    assert (await pending).id == job["id"]
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections_concurrently():
+    server = StandInServer(latency=0.02)
+    client = lume.Client("stand-in", transport=server.transport())
+
+    opened = await client.warmup(30)
+
+    assert opened == 20  # capped at the keep-alive limit
+    assert server.request_counts[("HEAD", "")] == 20
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_set_api_key_closes_previous_client():
+    settings = Settings()
+    settings.set_api_key("first")
+    previous = settings.client
+    previous.client
+
+    settings.set_api_key("second")
+    await asyncio.sleep(0)
+
+    assert previous.closed and previous.client.is_closed
+    assert settings.client.api_key == "second"
+
+
+@pytest.mark.asyncio
+async def test_set_api_key_waits_for_running_operations():
+    server = StandInServer(run_duration=0.3)
+    pipeline = server.add("pipelines", name="rotation")
+    with server.install() as previous:
+        job = await lume.Job.create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+        running = asyncio.create_task(job.run())
+        await asyncio.sleep(0.05)
+        lume.set_api_key("rotated")
+        await asyncio.sleep(0)
+
+        assert not previous.closed
+        assert previous.current().api_key == "rotated"
+        result = await running
+        await asyncio.sleep(0)
+
+    assert result.status == "finished"
+    assert previous.closed and previous.client.is_closed
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,56 @@
+import asyncio
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk.api_client import Lume
+from lume_py.endpoints.sdk.metrics import LatencyHistogram
+from lume_py.testing import StandInServer
+
+
+def test_histogram_quantiles_stay_within_bucket_error():
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 1001):
+        histogram.record(millisecond / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+    assert histogram.quantile(1.0) == pytest.approx(1.0, rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_registry_tracks_routes_outcomes_and_polling():
+    server = StandInServer(run_duration=0.01)
+    pipeline = server.add("pipelines", name="metrics")
+
+    with server.install() as client:
+        job = await lume.Job.create(pipeline_id=pipeline["id"], source_data=[{"a": 1}])
+        await job.run()
+        with pytest.raises(Exception):
+            await lume.Pipeline.get_pipeline_by_id("missing")
+        snapshot = client.metrics.snapshot()
+        text = client.metrics.to_prometheus()
+
+    series = {(r["route"], r["method"], r["outcome"]): r for r in snapshot["requests"]}
+    assert series[("results/{id}", "GET", "success")]["count"] >= 1
+    assert series[("pipelines/{id}", "GET", "client_error")]["count"] == 1
+    assert snapshot["polling"]["results/{id}"]["count"] == 1
+    assert {o["operation"] for o in snapshot["operations"]} >= {"Job.create", "Job.run"}
+    assert snapshot["totals"]["polling_seconds"] > 0
+    assert 'lume_client_request_duration_seconds{route="results/{id}",method="GET",outcome="success",quantile="0.99"}' in text
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_measured_when_concurrency_is_capped():
+    server = StandInServer(latency=0.02)
+    server.seed("pipelines", 4, name="queued")
+    client = Lume(api_key="stand-in", transport=server.transport(), max_concurrency=1)
+
+    await asyncio.gather(*(client.request("GET", f"pipelines/{pid}") for pid in server.collections["pipelines"]))
+
+    waits = client.metrics.snapshot()["queue_wait"]["pipelines/{id}"]
+    assert waits["count"] == 4
+    assert waits["max"] >= 0.05
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,94 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def stamp(minutes_ago: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def seed(server: StandInServer):
+    pipeline = server.add("pipelines", name="contacts", updated_at=stamp(60))
+    server.add("pipelines", name="orders", updated_at=stamp(60))
+    jobs = [server.add("jobs", pipeline_id=pipeline["id"], status="created", updated_at=stamp(minutes)) for minutes in (52, 51, 50)]
+    server.add("results", job_id=jobs[0]["id"], status="failed", updated_at=stamp(40))
+    server.add("results", job_id=jobs[0]["id"], status="finished", updated_at=stamp(20))
+    server.add("results", job_id=jobs[1]["id"], status="running", updated_at=stamp(30))
+    server.seed("results", 120, status="finished", updated_at=stamp(45))
+    return pipeline, jobs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filtering", [True, False])
+@pytest.mark.parametrize("store", ["memory", "sqlite"])
+async def test_refresh_is_incremental(filtering, store):
+    server = StandInServer(filtering=filtering)
+    pipeline, jobs = seed(server)
+    mirror = lume.Mirror(lume.MemoryStore() if store == "memory" else lume.SQLiteStore(), page_size=50)
+
+    with server.install():
+        assert await mirror.refresh() == {"pipelines": 2, "jobs": 3, "workshops": 0, "results": 123, "target_schemas": 0}
+        assert [job.id for job in mirror.jobs_for_pipeline(pipeline["id"])] == [job["id"] for job in jobs]
+        latest = mirror.latest_result_per_job()
+        assert set(latest) == {jobs[0]["id"], jobs[1]["id"]}
+        assert latest[jobs[0]["id"]].status == "finished"
+
+        server.reset_counts()
+        server.collections["results"][latest[jobs[1]["id"]].id].update(status="failed", updated_at=stamp(0))
+        server.add("results", job_id=jobs[2]["id"], status="queued", updated_at=stamp(0))
+        server.add("jobs", pipeline_id=pipeline["id"], status="created", updated_at=stamp(0))
+        changed = await mirror.refresh(["jobs", "results"])
+
+    assert changed == {"jobs": 1, "results": 2}
+    assert mirror.server_filtering == {"jobs": filtering, "results": filtering}
+    assert len(mirror.jobs_for_pipeline(pipeline["id"])) == 4
+    assert mirror.latest_result_per_job()[jobs[1]["id"]].status == "failed"
+    assert [r.status for r in mirror.find("results", status="failed")] == ["failed", "failed"]
+    assert mirror.count("results") == 124
+    # Filtered: one page of changes per collection. Unfiltered: the full listing.
+    assert server.request_counts[("GET", "results")] == (1 if filtering else 3)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_persists(tmp_path):
+    server = StandInServer(filtering=True)
+    pipeline, jobs = seed(server)
+    path = str(tmp_path / "lume.db")
+
+    with server.install():
+        await lume.Mirror(lume.SQLiteStore(path), collections=["jobs"]).refresh()
+        server.reset_counts()
+        reopened = lume.Mirror(lume.SQLiteStore(path), collections=["jobs"])
+        assert await reopened.refresh() == {"jobs": 0}
+
+    assert reopened.get("jobs", jobs[0]["id"]).pipeline_id == pipeline["id"]
+    with pytest.raises(ValueError):
+        reopened.find("jobs", name="contacts")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_writes_run_off_the_event_loop():
+    class RecordingStore(lume.SQLiteStore):
+        threads = set()
+
+        def watermark(self, collection):
+            self.threads.add(threading.current_thread())
+            return super().watermark(collection)
+
+        def upsert(self, collection, records):
+            self.threads.add(threading.current_thread())
+            return super().upsert(collection, records)
+
+    server = StandInServer(filtering=True)
+    seed(server)
+    with server.install():
+        assert await lume.Mirror(RecordingStore(), collections=["jobs"]).refresh() == {"jobs": 3}
+
+    assert RecordingStore.threads and threading.current_thread() not in RecordingStore.threads
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
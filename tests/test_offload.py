@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.endpoints.sdk import api_client
+from lume_py.testing import StandInServer
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls.append(fn.func.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+def with_uploads(server: StandInServer, bodies: list):
+    handle = server.handle
+
+    async def handler(request):
+        if request.url.host == "staging.lume-terminus.com":
+            bodies.append(request.read())
+            return httpx.Response(200, json={"id": 1, "status": "COMPLETED"})
+        return await handle(request)
+
+    server.handle = handler
+
+
+@pytest.mark.asyncio
+async def test_large_json_bodies_are_encoded_on_the_executor():
+    server = StandInServer()
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts"))
+    rows = [{"row": index, "thread": None} for index in range(6000)]
+    executor = RecordingExecutor()
+    client = lume.Client(api_key="key", transport=server.transport(), executor=executor)
+
+    with lume.use_client(client):
+        small = await lume.Job.create(pipeline.id, rows[:10])
+        job = await lume.Job.create(pipeline.id, rows)
+
+    assert executor.calls == ["encode_json"]
+    assert server.collections["jobs"][job.id]["data"] == rows and small.id != job.id
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_uploads_read_files_on_the_executor(tmp_path):
+    server = StandInServer()
+    bodies = []
+    with_uploads(server, bodies)
+    pdf = tmp_path / "order.pdf"
+    pdf.write_bytes(b"%PDF-1.7 " + b"x" * 100_000)
+    executor = RecordingExecutor()
+    client = lume.Client(api_key="key", transport=server.transport(), executor=executor)
+
+    with lume.use_client(client):
+        await lume.PDF.extract_pdf(str(pdf), manifest=lume.UploadManifest())
+        await lume.Excel.convert_sheets(str(pdf), "order.xlsx")
+
+    assert executor.calls == ["file_digest", "read_block", "read_block"]
+    assert all(b"x" * 100_000 in body for body in bodies)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_uploads_stream_files_in_blocks(tmp_path, monkeypatch):
+    server = StandInServer()
+    bodies = []
+    with_uploads(server, bodies)
+    book = tmp_path / "book.xlsx"
+    book.write_bytes(os.urandom(250_000))
+    monkeypatch.setattr(api_client, "UPLOAD_BLOCK", 100_000)
+    executor = RecordingExecutor()
+    client = lume.Client(api_key="key", transport=server.transport(), executor=executor)
+
+    with lume.use_client(client):
+        await lume.Excel.convert_sheets(str(book), "book.xlsx", "Orders")
+
+    assert executor.calls == ["read_block"] * 3
+    assert book.read_bytes() in bodies[0] and b'name="sheets"\r\n\r\nOrders' in bodies[0]
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_executor(tmp_path):
+    server = StandInServer()
+    bodies = []
+    with_uploads(server, bodies)
+    pdf = tmp_path / "order.pdf"
+    pdf.write_bytes(b"%PDF-1.7 order")
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        client = lume.Client(api_key="key", transport=server.transport(), executor=executor)
+        with lume.use_client(client):
+            result = await lume.PDF.extract_pdf(str(pdf), manifest=lume.UploadManifest())
+
+    assert result["status"] == "COMPLETED" and b"%PDF-1.7 order" in bodies[0]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,31 @@
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_get_all_walks_every_page():
+    server = StandInServer()
+    server.seed("pipelines", 120, name="paged")
+
+    with server.install():
+        pipelines = await lume.Pipeline.get_all_pipelines(size=50, all=True)
+
+    assert len(pipelines) == 120
+    assert len({pipeline.id for pipeline in pipelines}) == 120
+    assert server.request_counts[("GET", "pipelines")] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_mappings_all_walks_every_page():
+    server = StandInServer(mappings_per_result=130)
+    result = server.add("results", status="finished")
+
+    with server.install():
+        mappings = await lume.Result(**result).get_mappings(all=True)
+
+    assert [mapping.index for mapping in mappings] == list(range(130))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,103 @@
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def pivot_server(server: StandInServer, finish_after: dict, requests: list, faults: dict = None):
+    """
+    Answers the pivot task endpoints. Task ``id`` finishes on its ``finish_after[id]``-th status check,
+    after failing its first ``faults[id]`` checks with 503.
+    """
+    faults = dict(faults or {})
+    handle = server.handle
+    checks = {}
+
+    async def with_pivots(request):
+        segments = request.url.path.strip("/").split("/")
+        if segments[:3] == ["crud", "excel", "pivot"] and len(segments) > 3:
+            requests.append(request.url.path)
+            task_id = segments[3]
+            if task_id not in finish_after:
+                return httpx.Response(404, json={"detail": "Not Found"})
+            if segments[4:] == ["url"]:
+                return httpx.Response(200, json={"url": f"https://files.example/{task_id}.xlsx"})
+            if faults.get(task_id):
+                faults[task_id] -= 1
+                return httpx.Response(503, json={"detail": "Service Unavailable"})
+            checks[task_id] = checks.get(task_id, 0) + 1
+            status = "COMPLETED" if checks[task_id] >= finish_after[task_id] else "PENDING"
+            return httpx.Response(200, json={"id": task_id, "status": status})
+        return await handle(request)
+
+    server.handle = with_pivots
+
+
+@pytest.mark.asyncio
+async def test_tracks_tasks_and_fetches_urls():
+    server = StandInServer()
+    requests = []
+    pivot_server(server, {"a": 3, "b": 1, "c": 2}, requests)
+    ticks = []
+
+    with server.install() as client:
+        client.poll_interval = 0.01
+        client.hooks.on("poll_end")(ticks.append)
+        tasks = [task async for task in lume.Excel.track_pivot_tasks(["a", "b", "c", "missing"], fetch_urls=True)]
+
+    order = [task.id for task in tasks]
+    assert set(order[:2]) == {"b", "missing"} and order[2:] == ["c", "a"]
+    by_id = {task.id: task for task in tasks}
+    assert by_id["a"].url == "https://files.example/a.xlsx" and by_id["a"].status == "COMPLETED"
+    assert by_id["missing"].error and by_id["missing"].url is None
+    # 6 status checks for the three tasks, one for the missing one, and one URL per finished task.
+    assert len(requests) == 6 + 1 + 3
+    assert len(ticks) == 4 and {tick.route for tick in ticks} == {"crud/excel/pivot/{id}"}
+
+
+@pytest.mark.asyncio
+async def test_bound_client_tracks_tasks():
+    server = StandInServer()
+    requests = []
+    pivot_server(server, {"a": 2}, requests)
+    client = server.client()
+    client.poll_interval = 0.01
+
+    tasks = [task async for task in lume.Excel.bind(client).track_pivot_tasks(["a"], fetch_urls=True)]
+
+    assert [(task.id, task.status, task.url) for task in tasks] == [("a", "COMPLETED", "https://files.example/a.xlsx")]
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_timeout_leaves_tasks_pending():
+    server = StandInServer()
+    pivot_server(server, {"slow": 1000, "fast": 1}, [])
+
+    with server.install() as client:
+        client.poll_interval = 0.01
+        tracker = lume.PivotTaskTracker(["slow", "fast"])
+        with pytest.raises(TimeoutError):
+            await tracker.wait(timeout=0.1)
+
+    assert tracker.pending == ["slow"] and list(tracker.finished) == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_keep_tasks_pending():
+    server = StandInServer()
+    requests = []
+    pivot_server(server, {"flaky": 1, "down": 1}, requests, faults={"flaky": 2, "down": 100})
+
+    with server.install() as client:
+        client.poll_interval = client.max_poll_interval = 0.01
+        tasks = await lume.PivotTaskTracker(["flaky", "down"], max_errors=3).wait()
+
+    by_id = {task.id: task for task in tasks}
+    assert by_id["flaky"].status == "COMPLETED" and by_id["flaky"].error is None
+    assert "503" in by_id["down"].error and by_id["down"].status is None
+    assert len(requests) == 3 + 3
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
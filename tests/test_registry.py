@@ -0,0 +1,65 @@
+import asyncio
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_get_target_by_id_beyond_first_page():
+    server = StandInServer()
+    targets = server.seed("target_schemas", 120, name="contacts", schema={"type": "object"})
+
+    with server.install():
+        target = await lume.Target.get_target_by_id(targets[-1]["id"])
+        missing = await lume.Target.get_target_by_id("ts-missing")
+
+    assert target.id == targets[-1]["id"] and target.schema == {"type": "object"}
+    assert missing is None
+    assert server.request_counts[("GET", "target_schemas")] == 0
+    assert server.request_counts[("GET", "target_schemas/{id}")] == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_caches_and_batches():
+    server = StandInServer(latency=0.01)
+    ids = [target["id"] for target in server.seed("target_schemas", 30, name="contacts")]
+    registry = lume.TargetRegistry(max_size=20)
+    events = []
+
+    with server.install() as client:
+        client.hooks.on("cache_hit", events.append)
+        client.hooks.on("cache_miss", events.append)
+        first, again = await asyncio.gather(registry.get(ids[0]), registry.get(ids[0]))
+        assert first is again
+        resolved = await registry.get_many(ids[:10] + ids[:10] + ["ts-missing"])
+        assert await registry.get(ids[0]) is first
+
+    assert [resolved[i].id for i in ids[:10]] == ids[:10] and resolved["ts-missing"] is None
+    # One request for the two concurrent lookups, nine for the rest of the batch, one for the missing ID.
+    assert server.request_counts[("GET", "target_schemas/{id}")] == 11
+    assert sum(event.type == "cache_hit" for event in events) == 2
+    assert {event.key for event in events if event.type == "cache_miss"} == set(ids[:10]) | {"ts-missing"}
+
+
+@pytest.mark.asyncio
+async def test_registry_bounds_and_expiry():
+    server = StandInServer()
+    ids = [target["id"] for target in server.seed("target_schemas", 5)]
+    registry = lume.TargetRegistry(max_size=3, ttl=None)
+
+    with server.install():
+        await registry.get_many(ids)
+        assert len(registry) == 3 and ids[0] not in registry and ids[-1] in registry
+        assert await registry.refresh() == 3
+
+        expiring = lume.TargetRegistry(ttl=0)
+        await expiring.get(ids[0])
+        server.reset_counts()
+        await expiring.get(ids[0])
+
+    assert server.request_counts[("GET", "target_schemas/{id}")] == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,70 @@
+import csv
+import os
+import tempfile
+
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from lume_py.endpoints.sheets import prefilter_workbook  # noqa: E402
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    book = openpyxl.Workbook()
+    book.active.title = "Orders"
+    for row in range(1, 21):
+        book["Orders"].append([f"order-{row}", row, row * 1.5])
+    for index in range(30):
+        sheet = book.create_sheet(f"Archive {index}")
+        for row in range(200):
+            sheet.append([index, row, "x" * 20])
+    book.create_sheet("Customers").append(["name", "email"])
+    path = tmp_path / "book.xlsx"
+    book.save(path)
+    return path
+
+
+def test_keeps_only_requested_sheets_and_ranges(workbook, tmp_path):
+    slim = prefilter_workbook(str(workbook), "Customers, Orders", ranges={"Orders": "B2:C4"})
+
+    result = openpyxl.load_workbook(slim)
+    assert result.sheetnames == ["Orders", "Customers"]
+    assert result["Orders"]["B2"].value == 2 and result["Orders"]["C4"].value == 6.0
+    assert result["Orders"]["A2"].value is None and result["Orders"].max_row == 4
+    assert os.path.getsize(slim) * 4 < workbook.stat().st_size
+
+    path = prefilter_workbook(str(workbook), ["Customers"], output=str(tmp_path / "customers.csv"), format="csv")
+    assert list(csv.reader(open(path))) == [["name", "email"]]
+    with pytest.raises(ValueError):
+        prefilter_workbook(str(workbook), "Missing")
+
+
+@pytest.mark.asyncio
+async def test_convert_sheets_uploads_the_slimmed_workbook(workbook, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    server = StandInServer()
+    uploaded = []
+    handle = server.handle
+
+    async def with_convert(request):
+        if request.url.path == "/crud/convert/sheets":
+            uploaded.append(len(request.read()))
+            return httpx.Response(200, json={"sheets": ["Orders"]})
+        return await handle(request)
+
+    server.handle = with_convert
+    with server.install():
+        await lume.Excel.convert_sheets(str(workbook), "book.xlsx", sheets="Orders")
+        await lume.Excel.convert_sheets(str(workbook), "book.xlsx", sheets="Orders", prefilter=True)
+
+    full, slim = uploaded
+    assert slim * 4 < full
+    assert not list(tmp_path.glob("lume-*"))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,65 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lume_py import sync
+from lume_py.testing import StandInServer
+
+
+def test_sync_facade_runs_on_one_background_loop():
+    server = StandInServer(latency=0.01)
+    server.seed("pipelines", 30, name="sync")
+    threads = set()
+
+    with server.install() as client:
+        client.hooks.on("request_start", lambda event: threads.add(threading.current_thread().name))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pages = list(pool.map(lambda _: sync.Pipeline.get_all_pipelines(size=10, all=True), range(8)))
+
+    assert all(len(page) == 30 for page in pages)
+    assert threads == {"lume-sync-loop"}
+
+
+def test_sync_facade_wraps_models_and_chains_calls():
+    server = StandInServer()
+    pipeline = server.add("pipelines", name="sync")
+
+    with server.install():
+        fetched = sync.Pipeline.get_pipeline_by_id(pipeline["id"])
+        result = fetched.create_job([{"a": 1}]).run()
+
+    assert fetched.name == "sync"
+    assert result.status == "finished"
+    assert isinstance(result.aio, sync.Result.aio)
+
+
+def test_sync_facade_supports_bound_clients():
+    server = StandInServer()
+    record = server.add("pipelines", name="tenant")
+
+    pipeline = sync.Pipeline.bind(server.client()).get_pipeline_by_id(record["id"])
+
+    assert pipeline.name == "tenant"
+    assert server.total_requests == 1
+
+
+def test_sync_facade_iterates_async_iterators():
+    server = StandInServer()
+    client = server.client()
+    results = [sync.Result.bind(client)(**record) for record in server.seed("results", 3, status="finished")]
+
+    scored = list(sync.Result.generate_confidence_scores_many(results))
+
+    assert {result.id for result, _ in scored} == {result.id for result in results}
+    assert all(isinstance(result, sync.SyncProxy) and scores["status"] == "finished" for result, scores in scored)
+
+
+def test_sync_run_times_out():
+    import asyncio
+
+    with pytest.raises(TimeoutError):
+        sync.run(asyncio.sleep(1), timeout=0.01)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
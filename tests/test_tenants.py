@@ -0,0 +1,82 @@
+import asyncio
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_bound_models_keep_their_tenant_client():
+    first, second = StandInServer(), StandInServer()
+    first_pipeline = first.add("pipelines", name="first")
+    second.add("pipelines", name="second")
+
+    pipeline = await lume.Pipeline.bind(first.client()).get_pipeline_by_id(first_pipeline["id"])
+    job = await pipeline.create_job([{"a": 1}])
+    await job.run()
+
+    assert first.request_counts[("POST", "pipelines/{id}/jobs")] == 1
+    assert first.request_counts[("POST", "jobs/{id}/run")] == 1
+    assert second.total_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_client_pool_multiplexes_tenants_concurrently():
+    servers = {f"tenant-{i}": StandInServer(latency=0.01) for i in range(3)}
+    for name, server in servers.items():
+        server.seed("jobs", 5, status="finished", tenant=name)
+    pool = lume.ClientPool(max_clients=2)
+    for name, server in servers.items():
+        pool.register(name, api_key=name, transport=server.transport())
+
+    async def list_jobs(tenant):
+        with pool.use(tenant):
+            return await lume.Job.get_all_jobs()
+
+    assert len(pool) == 2 and "tenant-0" not in pool
+    pool.register("tenant-0", api_key="tenant-0", transport=servers["tenant-0"].transport())
+    pages = await asyncio.gather(*(list_jobs(name) for name in servers))
+
+    for name, jobs in zip(servers, pages):
+        assert len(jobs) == 5
+        assert all(job.id in servers[name].collections["jobs"] for job in jobs)
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_evicted_tenant_reopens_for_bound_models():
+    first, second = StandInServer(), StandInServer()
+    record = first.add("pipelines", name="first")
+    pool = lume.ClientPool(max_clients=1)
+    evicted = pool.register("a", api_key="a", transport=first.transport())
+
+    with pool.use("a"):
+        pipeline = await lume.Pipeline.get_pipeline_by_id(record["id"])
+        pool.register("b", api_key="b", transport=second.transport())
+        await asyncio.sleep(0)
+        assert not evicted.closed  # still pinned by the ``use`` block
+    await asyncio.sleep(0)
+    job = await pipeline.create_job([{"a": 1}])
+
+    assert evicted.closed
+    assert job.pipeline_id == record["id"]
+    assert first.request_counts[("POST", "pipelines/{id}/jobs")] == 1
+    assert "a" in pool and "b" not in pool
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_instance_bind_overrides_the_default_client():
+    default, tenant = StandInServer(), StandInServer()
+    record = tenant.add("workshops", status="created")
+
+    with default.install():
+        workshop = lume.WorkShop(**record).bind(tenant.client())
+        details = await workshop.get_details()
+
+    assert details.id == record["id"]
+    assert default.total_requests == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
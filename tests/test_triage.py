@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def stamp(minutes_ago: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def seed(server: StandInServer):
+    server.add("results", status="failed", updated_at=stamp(60))
+    review = server.add("results", status="needs review", updated_at=stamp(5))
+    server.add("results", status="finished", updated_at=stamp(4))
+    return review, server.add("results", status="running", updated_at=stamp(3))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filtering", [True, False])
+async def test_refresh_is_incremental(filtering):
+    server = StandInServer(filtering=filtering)
+    review, running = seed(server)
+    server.seed("results", 250, status="finished", updated_at=stamp(30))
+    index = lume.TriageIndex(page_size=100)
+
+    with server.install():
+        assert await index.refresh() == 254
+        assert [r.status for r in index.since(timedelta(minutes=10))] == ["needs review"]
+        assert len(index.since()) == 2
+
+        server.reset_counts()
+        running.update(status="failed", updated_at=stamp(0))
+        review.update(status="finished", updated_at=stamp(0))
+        server.add("results", status="failed", updated_at=stamp(0))
+        assert await index.refresh() == 3
+
+    recent = index.since(timedelta(minutes=10))
+    assert [r.status for r in recent] == ["failed", "failed"]
+    assert index.counts()["failed"] == 3 and "running" not in index.counts() and "needs review" not in index.counts()
+    assert index.server_filtering is filtering
+    listing = server.request_counts[("GET", "results")]
+    # Filtered: one page of changes (plus nothing else). Unfiltered: one probe, the
+    # last listing page, and a re-check of the running, failed and needs review results.
+    assert listing == 1 if filtering else listing == 2
+    assert server.request_counts[("GET", "results/{id}")] == (0 if filtering else 3)
+
+
+@pytest.mark.asyncio
+async def test_get_failed():
+    server = StandInServer()
+    seed(server)
+
+    with server.install():
+        failed = await lume.Result.get_failed()
+
+    assert sorted(r.status for r in failed) == ["failed", "needs review"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
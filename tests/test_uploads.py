@@ -0,0 +1,103 @@
+import os
+
+import httpx
+import lume_py as lume
+import pytest
+from lume_py.testing import StandInServer
+
+
+def terminus(server: StandInServer, uploads: list):
+    """
+    Answers the file upload endpoints, recording the uploaded bytes.
+    """
+    handle = server.handle
+    polls = []
+
+    async def with_uploads(request):
+        path = request.url.path
+        if path in ("/crud/convert/sheets", "/crud/pipelines/upload/sheets", "/crud/pdf/orders"):
+            uploads.append(request.read())
+            if path == "/crud/pdf/orders":
+                return httpx.Response(200, json={"id": len(uploads), "status": "QUEUED"})
+            return httpx.Response(200, json={"upload": len(uploads)})
+        if path.startswith("/crud/pdf/orders/"):
+            polls.append(path)
+            return httpx.Response(200, json={"id": int(path.rsplit("/", 1)[1]), "status": "COMPLETED", "data": {"total": 3}})
+        return await handle(request)
+
+    server.handle = with_uploads
+    return polls
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_is_not_uploaded_again(tmp_path):
+    server = StandInServer()
+    uploads = []
+    terminus(server, uploads)
+    book = tmp_path / "book.xlsx"
+    book.write_bytes(b"workbook v1")
+    copy = tmp_path / "copy.xlsx"
+    copy.write_bytes(b"workbook v1")
+    manifest = lume.UploadManifest(str(tmp_path / "manifest.json"))
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts"))
+    hits = []
+
+    with server.install() as client:
+        client.hooks.on("cache_hit")(hits.append)
+        first = await lume.Excel.convert_sheets(str(book), "book.xlsx", manifest=manifest)
+        again = await lume.Excel.convert_sheets(str(copy), "book.xlsx", manifest=manifest)
+        other_sheets = await lume.Excel.convert_sheets(str(book), "book.xlsx", sheets="Orders", manifest=manifest)
+        await pipeline.upload_sheets(str(book), manifest=manifest)
+        await pipeline.upload_sheets(str(book), manifest=manifest)
+        book.write_bytes(b"workbook v2")
+        os.utime(book, ns=(1, 1))
+        changed = await lume.Excel.convert_sheets(str(book), "book.xlsx", manifest=manifest)
+
+    assert first == again == {"upload": 1}
+    assert other_sheets == {"upload": 2} and changed == {"upload": 4}
+    assert len(uploads) == 4 and len(hits) == 2
+    # The manifest survives a restart.
+    assert len(lume.UploadManifest(str(tmp_path / "manifest.json"))) == 4
+
+
+@pytest.mark.asyncio
+async def test_pdf_extraction_reuses_the_task(tmp_path):
+    server = StandInServer()
+    uploads = []
+    polls = terminus(server, uploads)
+    pdf = tmp_path / "order.pdf"
+    pdf.write_bytes(b"%PDF-1.7 order")
+    manifest = lume.UploadManifest()
+
+    with server.install():
+        task = await lume.PDF.extract_pdf(str(pdf), immediate=True, manifest=manifest)
+        result = await lume.PDF.extract_pdf(str(pdf), manifest=manifest)
+        cached = await lume.PDF.extract_pdf(str(pdf), manifest=manifest)
+
+    assert task["status"] == "QUEUED"
+    assert result == cached and result["status"] == "COMPLETED"
+    assert len(uploads) == 1 and len(polls) == 1
+
+
+@pytest.mark.asyncio
+async def test_tenants_sharing_a_manifest_upload_separately(tmp_path):
+    server = StandInServer()
+    uploads = []
+    terminus(server, uploads)
+    pdf = tmp_path / "order.pdf"
+    pdf.write_bytes(b"%PDF-1.7 order")
+    manifest = lume.UploadManifest()
+    pool = lume.ClientPool()
+    for tenant in ("a", "b"):
+        pool.register(tenant, api_key=tenant, transport=server.transport())
+
+    for tenant in ("a", "b", "a"):
+        with pool.use(tenant):
+            await lume.PDF.extract_pdf(str(pdf), immediate=True, manifest=manifest)
+
+    assert len(uploads) == 2 and len(manifest) == 2
+    await pool.aclose()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import lume_py as lume
+import pytest
+from lume_py.endpoints.validation import get_validator
+from lume_py.testing import StandInServer
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "f_name": {"type": "string", "minLength": 1},
+        "age": {"type": "integer", "minimum": 0},
+        "email": {"type": "string", "format": "email"},
+        "status": {"enum": ["active", "inactive"]},
+        "joined": {"type": ["string", "null"], "format": "date"},
+        "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+        "address": {"$ref": "#/$defs/address"},
+    },
+    "required": ["f_name", "age"],
+    "additionalProperties": False,
+    "$defs": {
+        "address": {"type": "object", "properties": {"zip": {"type": "string", "pattern": "^[0-9]{5}$"}}},
+    },
+}
+
+VALID = {
+    "f_name": "John", "age": 42, "email": "john@example.com", "status": "active",
+    "joined": None, "tags": ["a", "b"], "address": {"zip": "94103"},
+}
+
+
+def test_reports_errors_per_row():
+    validator = lume.SchemaValidator(SCHEMA)
+    rows = [
+        VALID,
+        {"f_name": "", "age": True, "email": "nope", "status": "gone"},
+        {"age": -1, "joined": "2024-02-30", "tags": ["a", "a", 3], "address": {"zip": "941"}, "extra": 1},
+    ]
+
+    report = validator.validate_many(rows)
+
+    assert report.rows == 3 and report.invalid_rows == [1, 2] and not report.valid
+    errors = {(error.row, error.path): error.message for error in report.errors}
+    assert errors == {
+        (1, "/f_name"): "must be at least 1 characters",
+        (1, "/age"): "expected integer, got boolean",
+        (1, "/email"): "is not a valid email",
+        (1, "/status"): "must be one of ['active', 'inactive']",
+        (2, "/f_name"): "is required",
+        (2, "/age"): "must be at least 0",
+        (2, "/joined"): "is not a valid date",
+        (2, "/tags"): "must not contain duplicate items",
+        (2, "/tags/2"): "expected string, got integer",
+        (2, "/address/zip"): "must match '^[0-9]{5}$'",
+        (2, "/extra"): "is not allowed",
+    }
+
+
+def test_combinators():
+    validator = lume.SchemaValidator({
+        "oneOf": [{"type": "integer"}, {"type": "number", "exclusiveMaximum": 1}],
+        "not": {"const": 5},
+    })
+
+    assert validator.is_valid(2) and validator.is_valid(0.5)
+    assert [e.message for e in validator.errors(0)] == ["must match exactly one schema, matched 2"]
+    assert [e.message for e in validator.errors(5)] == ["must not match the excluded schema"]
+    assert [e.message for e in validator.errors("x")] == ["must match exactly one schema, matched 0"]
+
+
+def test_cached_per_schema_id():
+    first = get_validator(SCHEMA, schema_id="ts-1")
+    assert get_validator(SCHEMA, schema_id="ts-1") is first
+    assert get_validator(dict(SCHEMA), schema_id="ts-2") is not first
+    assert get_validator({**SCHEMA, "required": []}, schema_id="ts-1") is not first
+
+
+def test_process_pool_matches_serial():
+    validator = lume.SchemaValidator(SCHEMA)
+    rows = [VALID if index % 7 else {"f_name": 1, "age": index} for index in range(500)]
+
+    serial = validator.validate_many(rows)
+    pooled = validator.validate_many(rows, processes=2, chunk_size=100)
+
+    assert pooled == serial and len(serial.invalid_rows) == 72
+
+
+@pytest.mark.asyncio
+async def test_pipeline_validates_mapped_records():
+    server = StandInServer()
+    pipeline = lume.Pipeline(**server.add("pipelines", name="contacts", target_schema=SCHEMA))
+    operations, offloaded = [], []
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            offloaded.append(fn.func.__name__)
+            return super().submit(fn, *args, **kwargs)
+
+    with Executor(max_workers=1) as executor:
+        client = lume.Client("stand-in", transport=server.transport(), executor=executor)
+        client.hooks.on("operation_start", lambda event: operations.append(event.operation))
+        report = await pipeline.bind(client).validate_records([VALID, {"f_name": "Ann"}])
+
+    assert [(error.row, error.path) for error in report.errors] == [(1, "/age")]
+    assert operations == ["Pipeline.validate_records"] and offloaded == ["validate_records"]
+    assert server.total_requests == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])